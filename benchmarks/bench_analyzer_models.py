@@ -0,0 +1,155 @@
+"""Benchmark memory of the analyzer's conversation and turn-score models.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_analyzer_models.py [--turns 1000000]
+
+Builds `--turns` turns and one dimension evaluation per turn, the way the
+loader and `GeminiEvaluator` do (every role and every echoed content is a
+fresh string, as `json.loads` returns them), and measures the memory each
+layout holds with `tracemalloc`:
+
+- turns: plain dataclasses (the previous models) versus the slotted, frozen
+  `Turn` with interned roles;
+- evaluations: a list of plain `TurnDimensionEvaluation`s with eight
+  `DimensionScore`s each and a copy of the turn content, versus a
+  `TurnScoreTable` reading content from the turns.
+
+Turn content and justification texts cost the same in every layout; the
+benchmark shares justifications from a small pool so the difference shown is
+the per-object overhead.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tars_analyzer.models import DIMENSIONS, DimensionScore, Turn, TurnDimensionEvaluation, TurnScoreTable
+
+
+@dataclass
+class PlainTurn:
+    role: str
+    content: str
+
+
+@dataclass
+class PlainDimensionScore:
+    score: float
+    justification: str
+    error_flag: str | None = None
+
+
+@dataclass
+class PlainTurnDimensionEvaluation:
+    turn_index: int
+    role: str
+    content: str
+    helpfulness: PlainDimensionScore
+    factual_accuracy: PlainDimensionScore
+    instruction_following: PlainDimensionScore
+    coherence: PlainDimensionScore
+    depth_of_reasoning: PlainDimensionScore
+    safety_awareness: PlainDimensionScore
+    hallucination_likelihood: PlainDimensionScore
+    specificity: PlainDimensionScore
+
+
+JUSTIFICATIONS = [f"justification {i}" for i in range(64)]
+
+
+def fresh(text: str) -> str:
+    """A new string object equal to `text`, as a JSON parser would return."""
+    return "".join(list(text))
+
+
+def measure(build: Callable[[], Any]) -> tuple[Any, int, float]:
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    value = build()
+    elapsed = time.perf_counter() - started
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return value, size, elapsed
+
+
+def contents(count: int) -> list[str]:
+    return [f"turn {i} says something" for i in range(count)]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+    count = args.turns
+    texts = contents(count)
+    roles = ("human", "agent")
+
+    def plain_turns() -> list[PlainTurn]:
+        return [PlainTurn(role=fresh(roles[i % 2]), content=texts[i]) for i in range(count)]
+
+    def slotted_turns() -> list[Turn]:
+        return [Turn(role=fresh(roles[i % 2]), content=texts[i]) for i in range(count)]
+
+    def plain_scores(i: int) -> dict[str, PlainDimensionScore]:
+        return {
+            name: PlainDimensionScore(score=float(i % 11), justification=JUSTIFICATIONS[(i + d) % 64])
+            for d, name in enumerate(DIMENSIONS)
+        }
+
+    def plain_evaluations() -> list[PlainTurnDimensionEvaluation]:
+        return [
+            PlainTurnDimensionEvaluation(
+                turn_index=i, role=fresh(roles[i % 2]), content=fresh(texts[i]), **plain_scores(i)
+            )
+            for i in range(count)
+        ]
+
+    def table(turns: list[Turn]) -> Callable[[], TurnScoreTable]:
+        def build() -> TurnScoreTable:
+            result = TurnScoreTable(turns=turns)
+            for i in range(count):
+                scores = {
+                    name: DimensionScore(score=float(i % 11), justification=JUSTIFICATIONS[(i + d) % 64])
+                    for d, name in enumerate(DIMENSIONS)
+                }
+                # Parsed evaluations are appended and dropped one at a time.
+                result.append(
+                    TurnDimensionEvaluation(turn_index=i, role=fresh(roles[i % 2]), content=fresh(texts[i]), **scores)
+                )
+            return result
+
+        return build
+
+    rows = []
+    value, size, elapsed = measure(plain_turns)
+    rows.append(("turns", "dataclass", size, elapsed))
+    del value
+    turns, size, elapsed = measure(slotted_turns)
+    rows.append(("turns", "slotted", size, elapsed))
+    value, size, elapsed = measure(plain_evaluations)
+    rows.append(("scores", "dataclass", size, elapsed))
+    del value
+    value, size, elapsed = measure(table(turns))
+    rows.append(("scores", "table", size, elapsed))
+    del value
+
+    print(f"{'data':>7} {'layout':>10} {'MiB':>9} {'bytes/turn':>11} {'build_s':>8}")
+    for data, layout, size, elapsed in rows:
+        print(f"{data:>7} {layout:>10} {size / 2**20:9.1f} {size / count:11.1f} {elapsed:8.2f}")
+    for data in ("turns", "scores"):
+        before, after = (size for name, _layout, size, _elapsed in rows if name == data)
+        print(f"{data}: {before / after:.1f}x less memory over {count} turns")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
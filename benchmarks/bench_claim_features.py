@@ -0,0 +1,104 @@
+"""Benchmark claim comparison with precomputed features against re-tokenizing.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_claim_features.py [--claims 1500] [--queries 200] [--batch 5]
+
+Builds a synthetic history of normalized claims, then compares a batch of
+query claims with every claim in the history: once with
+`_claim_similarity`, which rebuilds n-gram sets and `Counter`s for both
+sides of every pair, and once against a `ClaimFeatureStore`. Prints the
+time per comparison and the memory held by the history in each form
+(plain strings plus the per-claim sets and Counters the old loop would have
+needed to cache, versus the store's arrays). When NumPy is installed, the
+queries are also compared in batches of `--batch` with
+`ClaimFeatureStore.best_matches`, as the ``numpy`` deduplication backend does.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tars_analyzer.claim_deduplication import _claim_similarity, _ngram_set
+from tars_analyzer.claim_features import ClaimFeatureStore
+
+
+def build_claims(count: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    vocabulary = [f"term{i}" for i in range(5000)]
+    return [" ".join(rng.choice(vocabulary) for _ in range(rng.randint(5, 25))) for _ in range(count)]
+
+
+def allocated(build) -> tuple[object, int]:
+    tracemalloc.start()
+    value = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return value, size
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--claims", type=int, default=1500)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--batch", type=int, default=5, help="queries per vectorized call (claims per conversation)")
+    args = parser.parse_args(argv)
+
+    history = build_claims(args.claims)
+    queries = build_claims(args.queries, seed=1)
+    pairs = len(history) * len(queries)
+
+    started = time.perf_counter()
+    baseline = [max(_claim_similarity(query, claim) for claim in history) for query in queries]
+    baseline_s = time.perf_counter() - started
+
+    def build_store() -> ClaimFeatureStore:
+        store = ClaimFeatureStore()
+        for claim in history:
+            store.add(store.features(claim))
+        return store
+
+    store, store_bytes = allocated(build_store)
+    started = time.perf_counter()
+    featured = []
+    for query in queries:
+        features = store.features(query)
+        featured.append(max(store.similarity(features, ident) for ident in range(len(store))))
+    store_s = time.perf_counter() - started
+    if featured != baseline:
+        raise SystemExit("feature store similarities differ from _claim_similarity")
+
+    numpy_s = None
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        started = time.perf_counter()
+        vectorized = []
+        for first in range(0, len(queries), args.batch):
+            batch = [store.features(query) for query in queries[first : first + args.batch]]
+            vectorized.extend(similarity for _ident, similarity in store.best_matches(batch))
+        numpy_s = time.perf_counter() - started
+        if vectorized != baseline:
+            raise SystemExit("vectorized similarities differ from _claim_similarity")
+
+    _, cached_bytes = allocated(lambda: [(claim, _ngram_set(claim), Counter(claim.split())) for claim in history])
+
+    print(f"{'method':>10} {'us/pair':>8} {'total_s':>8} {'history_kb':>11}")
+    print(f"{'strings':>10} {baseline_s / pairs * 1e6:8.2f} {baseline_s:8.2f} {cached_bytes / 1024:11.0f}")
+    print(f"{'store':>10} {store_s / pairs * 1e6:8.2f} {store_s:8.2f} {store_bytes / 1024:11.0f}")
+    if numpy_s is not None:
+        print(f"{'numpy':>10} {numpy_s / pairs * 1e6:8.2f} {numpy_s:8.2f} {store_bytes / 1024:11.0f}")
+    print(f"speedup: {baseline_s / store_s:.1f}x over {pairs} comparisons")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
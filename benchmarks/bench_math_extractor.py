@@ -0,0 +1,69 @@
+"""Benchmark MathExtractor on synthetic multi-megabyte LaTeX documents.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_math_extractor.py [--sizes 5 10 20 50]
+
+Each size (in MB) gets a generated .tex file mixing prose, inline math,
+display brackets, equation and align blocks. Throughput (MB/s) should stay
+roughly constant as the input grows, i.e. extraction scales linearly.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tars.validators.research.math.math_extractor import MathExtractor
+
+_SECTION = r"""
+\section{Results}
+The energy of a particle is $E = mc^2$ and the norm satisfies $\|x\|_2 \le \sqrt{n}$.
+Escaped dollars such as \$100 are not math, and $$ display $$ pairs are skipped.
+\[
+  a^2 + b^2 = c^2
+\]
+\begin{equation}
+f(x) = \int_0^x g(t)\, dt
+\end{equation}
+\begin{align}
+u &= v + w \\
+p &= q \cdot r
+\end{align}
+Some plain prose to pad the paragraph so that the document resembles a thesis
+chapter rather than a wall of formulas; inline $\alpha + \beta = \gamma$ closes it.
+"""
+
+
+def build_document(target_bytes: int) -> str:
+    repeats = max(1, target_bytes // len(_SECTION))
+    return "\\documentclass{article}\n\\begin{document}\n" + _SECTION * repeats + "\\end{document}\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 10, 20, 50], help="Document sizes in MB")
+    args = parser.parse_args(argv)
+
+    extractor = MathExtractor()
+    print(f"{'size_mb':>8} {'seconds':>9} {'mb_per_s':>9} {'expressions':>12}")
+    with tempfile.TemporaryDirectory() as td:
+        for size_mb in args.sizes:
+            tex_path = Path(td) / f"synthetic_{size_mb}mb.tex"
+            tex_path.write_text(build_document(size_mb * 1024 * 1024))
+            actual_mb = tex_path.stat().st_size / (1024 * 1024)
+
+            started = time.perf_counter()
+            expressions = extractor.extract(tex_path)
+            elapsed = time.perf_counter() - started
+
+            print(f"{actual_mb:8.1f} {elapsed:9.3f} {actual_mb / elapsed:9.1f} {len(expressions):12d}")
+            tex_path.unlink()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
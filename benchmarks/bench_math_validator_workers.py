@@ -0,0 +1,59 @@
+"""Benchmark MathValidator equation-level parallelism.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_math_validator_workers.py [--equations 500] [--workers 1 2 4]
+
+Generates a paper with the requested number of distinct equations and times a
+full validation for each worker count. With enough cores the wall time should
+drop close to linearly as workers are added.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tars.validators.research.math.math_validator import MathValidator
+
+
+def build_paper(equation_count: int) -> str:
+    blocks = []
+    for k in range(1, equation_count + 1):
+        if k % 3 == 0:
+            body = f"\\sin^2({k}x) + \\cos^2({k}x) = 1"
+        elif k % 3 == 1:
+            body = f"(x+{k})^2 = x^2 + {2 * k}x + {k * k}"
+        else:
+            body = f"\\frac{{x^2 - {k * k}}}{{x - {k}}} = x + {k}"
+        blocks.append(f"\\begin{{equation}}\n{body}\n\\end{{equation}}")
+    return "\\documentclass{article}\n\\begin{document}\n" + "\n".join(blocks) + "\n\\end{document}\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--equations", type=int, default=500)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as td:
+        paper = Path(td) / "paper.tex"
+        paper.write_text(build_paper(args.equations))
+
+        print(f"{'workers':>8} {'seconds':>9} {'speedup':>8} {'validated':>10}")
+        baseline = None
+        for workers in args.workers:
+            started = time.perf_counter()
+            result = MathValidator(workers=workers).validate(paper)
+            elapsed = time.perf_counter() - started
+            baseline = baseline or elapsed
+            validated = result.metadata["metrics"]["validated_equations"]
+            print(f"{workers:8d} {elapsed:9.2f} {baseline / elapsed:8.2f} {validated:10d}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,72 @@
+"""Benchmark the staged SymbolicValidator strategy against plain simplify.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_symbolic_stages.py [--repeat 3]
+
+Checks a mix of identities typical of papers (polynomial expansions, rational
+cancellations, trig identities, and a few wrong equations) once with the
+staged strategy and once with a bare ``simplify(lhs - rhs)``, and prints the
+median and total latency of each plus the stage that decided each check.
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import sympy as sp
+from sympy.core.cache import clear_cache
+
+from tars.validators.research.math.symbolic_validator import SymbolicValidator
+
+
+def build_cases() -> list[tuple[sp.Expr, sp.Expr]]:
+    x, y = sp.symbols("x y")
+    cases = []
+    for k in range(1, 11):
+        cases.append(((x + k) ** 2, x**2 + 2 * k * x + k * k))
+        cases.append(((x**2 - k * k) / (x - k), x + k))
+        cases.append((sp.sin(k * x) ** 2 + sp.cos(k * x) ** 2, sp.Integer(1)))
+        cases.append(((x + y) ** 3 - k, x**3 + 3 * x**2 * y + 3 * x * y**2 + y**3 - k))
+        cases.append(((x + k) ** 2, x**2 + k * k))
+    return cases
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    cases = build_cases()
+    validator = SymbolicValidator()
+    staged: list[float] = []
+    baseline: list[float] = []
+    stages: Counter[str] = Counter()
+    for lhs, rhs in cases:
+        for _ in range(args.repeat):
+            # Cold SymPy caches on every run, as for a fresh equation in a paper.
+            clear_cache()
+            started = time.perf_counter()
+            result = validator.validate_equivalence(lhs, rhs)
+            staged.append(time.perf_counter() - started)
+
+            clear_cache()
+            started = time.perf_counter()
+            SymbolicValidator._is_zero_expr(SymbolicValidator._simplify_difference(lhs, rhs, sp), sp)
+            baseline.append(time.perf_counter() - started)
+        stages[result.metadata["decided_by"]] += 1
+
+    print(f"{'strategy':>10} {'median_ms':>10} {'total_s':>8}")
+    for label, timings in (("simplify", baseline), ("staged", staged)):
+        print(f"{label:>10} {statistics.median(timings) * 1000:10.2f} {sum(timings):8.2f}")
+    print("decided_by: " + ", ".join(f"{stage}={count}" for stage, count in stages.most_common()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
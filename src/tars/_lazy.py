@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Any, Callable
+
+
+def lazy_exports(package: str, exports: dict[str, str]) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Return module ``__getattr__`` and ``__dir__`` functions that import exports on first use.
+
+    `exports` maps each public name of `package` to the submodule defining it
+    (relative names are resolved against `package`). A name is imported the
+    first time it is accessed and then cached on the package, so importing
+    one submodule of a package no longer imports all of its siblings.
+    """
+
+    def __getattr__(name: str) -> Any:
+        submodule = exports.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(submodule, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[package]), *exports})
+
+    return __getattr__, __dir__
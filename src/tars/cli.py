@@ -1,20 +1,51 @@
 from __future__ import annotations
 
 import argparse
+import os
+import sys
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from tars.validators.research.math.math_validator import MathValidator
+from tars.settings import DEFAULT_HOST, DEFAULT_PORT, REMOTE_ENV
+from tars.validators.cache import CACHE_DIR_ENV, default_cache_dir
 
+if TYPE_CHECKING:
+    from tars.validators.research.math.conversion_cache import ConversionCache
+    from tars.validators.research.math.result_store import EquationResultStore
+    from tars.validators.result import ValidationResult
+    from tars.watch import WatchUpdate
+
+# Command implementations are imported inside the handlers, so `tars --help`
+# and argument errors only pay for argparse.
+
+# Worker recycling (`ProcessPoolExecutor(max_tasks_per_child=...)`) is new in Python 3.11.
+_POOL_RECYCLES_WORKERS = sys.version_info >= (3, 11)
+
+
+def _conversion_cache(args: argparse.Namespace) -> ConversionCache | None:
+    from tars.validators.research.math.conversion_cache import ConversionCache
+
+    if args.cache_dir:
+        return ConversionCache(args.cache_dir)
+    return ConversionCache.from_env()
+
+
+def _result_store(args: argparse.Namespace) -> EquationResultStore | None:
+    if not (args.incremental or args.watch):
+        return None
+    from tars.validators.research.math.result_store import EquationResultStore
+
+    return EquationResultStore(args.cache_dir or default_cache_dir())
 
-def _cmd_validate_math(args: argparse.Namespace) -> int:
-    validator = MathValidator()
-    result = validator.validate(Path(args.paper))
 
+def _print_math_result(result: ValidationResult) -> None:
     metrics = result.metadata.get("metrics", {})
     total = metrics.get("total_equations", result.metadata.get("equation_count", 0))
     validated = metrics.get("validated_equations", 0)
     failed = metrics.get("failed_equations", 0)
     skipped = metrics.get("skipped_equations", 0)
+    timed_out = metrics.get("timed_out_equations", 0)
 
     print(f"Math validation: status={result.status or ('PASS' if result.passed else 'FAIL')}")
     if result.reason:
@@ -24,17 +55,215 @@ def _cmd_validate_math(args: argparse.Namespace) -> int:
         f"total_equations={total} "
         f"validated_equations={validated} "
         f"failed_equations={failed} "
-        f"skipped_equations={skipped}"
+        f"skipped_equations={skipped} "
+        f"timed_out_equations={timed_out}"
     )
+    cache_stats = result.metadata.get("cache_stats", {})
+    if "persistent_hits" in cache_stats:
+        print(
+            "Conversion cache: "
+            f"hits={cache_stats['persistent_hits']} "
+            f"misses={cache_stats['persistent_misses']}"
+        )
+    incremental = result.metadata.get("incremental")
+    if incremental is not None:
+        print(
+            "Incremental: "
+            f"reused_equations={incremental['reused_equations']} "
+            f"rechecked_equations={incremental['rechecked_equations']}"
+        )
 
     if result.errors:
         print("Errors:")
         for err in result.errors:
             print(f"- {err}")
 
+
+def _print_watch_update(update: WatchUpdate) -> None:
+    if not update.changed_files:
+        _print_math_result(update.result)
+        print(f"Watching {len(update.result.metadata.get('results', []))} equations; press Ctrl-C to stop.")
+        return
+
+    names = ", ".join(path.name for path in update.changed_files)
+    if update.skipped:
+        print(f"Changed: {names} (math unaffected)")
+        return
+    status = update.result.status or ("PASS" if update.result.passed else "FAIL")
+    print(f"Changed: {names} -> status={status} elapsed_seconds={update.elapsed_seconds:.2f}")
+    for line in update.changes or ["(no equation status changes)"]:
+        print(f"  {line}")
+
+
+def _validate_math_remotely(args: argparse.Namespace) -> int:
+    from tars.server import RemoteClient, RemoteError
+
+    try:
+        (result,) = RemoteClient(args.remote).validate(Path(args.paper), ["math_validator"])
+    except RemoteError as exc:
+        print(f"Remote validation failed: {exc}", file=sys.stderr)
+        return 1
+    _print_math_result(result)
+    return 0
+
+
+def _check_remote_options(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Refuse local-only options with --remote, which runs with the daemon's settings."""
+    local_only = {
+        "--watch": args.watch,
+        "--incremental": args.incremental,
+        "--symbolic-timeout": args.symbolic_timeout is not None,
+        "--max-expression-size": args.max_expression_size is not None,
+        "--cache-dir": args.cache_dir is not None,
+    }
+    given = [flag for flag, used in local_only.items() if used]
+    if given:
+        parser.error(f"{', '.join(given)} cannot be combined with --remote")
+
+
+def _cmd_validate_math(args: argparse.Namespace) -> int:
+    if args.remote:
+        return _validate_math_remotely(args)
+    from tars.validators.research.math.math_validator import MathValidator
+
+    cache = _conversion_cache(args)
+    results = _result_store(args)
+    validator = MathValidator(
+        symbolic_timeout=args.symbolic_timeout,
+        max_expression_size=args.max_expression_size,
+        cache=cache,
+        results=results,
+    )
+    try:
+        if args.watch:
+            from tars.watch import PaperWatcher
+
+            watcher = PaperWatcher(Path(args.paper), validator=validator, interval=args.poll_interval)
+            try:
+                watcher.watch(_print_watch_update)
+            except KeyboardInterrupt:
+                pass
+            return 0
+        result = validator.validate(Path(args.paper))
+    finally:
+        if cache is not None:
+            cache.close()
+        if results is not None:
+            results.close()
+
+    _print_math_result(result)
+    return 0
+
+
+def _cmd_validate_corpus(args: argparse.Namespace) -> int:
+    from tars.corpus import discover_papers, validate_corpus
+
+    papers = discover_papers(args.source)
+    cache = _conversion_cache(args)
+    try:
+        summary = validate_corpus(
+            papers,
+            args.output,
+            workers=args.workers,
+            resume=not args.no_resume,
+            max_tasks_per_child=args.max_tasks_per_child,
+            validator_options={
+                "symbolic_timeout": args.symbolic_timeout,
+                "max_expression_size": args.max_expression_size,
+                "cache": cache,
+            },
+        )
+    finally:
+        if cache is not None:
+            cache.close()
+
+    print(
+        "Corpus validation: "
+        f"papers={summary.papers} "
+        f"resumed={summary.resumed} "
+        f"failed={summary.failed} "
+        f"errored={summary.errored} "
+        f"equations={summary.equations}"
+    )
+    print(
+        "Throughput: "
+        f"elapsed_seconds={summary.elapsed_seconds:.2f} "
+        f"papers_per_second={summary.papers_per_second:.2f} "
+        f"equations_per_second={summary.equations_per_second:.2f}"
+    )
+    print(f"Results: {args.output}")
+    return 0
+
+
+def _cmd_serve(args: argparse.Namespace) -> int:
+    from tars.server import ValidationService, default_validator_factories, serve
+    from tars.validators.research.math.result_store import EquationResultStore
+
+    cache = _conversion_cache(args)
+    cache_dir = args.cache_dir or (cache.cache_dir if cache is not None else None)
+    results = EquationResultStore(cache_dir) if cache_dir is not None else None
+    service = ValidationService(
+        workers=args.workers,
+        max_queue=args.max_queue,
+        factories=default_validator_factories(
+            cache=cache,
+            results=results,
+            symbolic_timeout=args.symbolic_timeout,
+            max_expression_size=args.max_expression_size,
+        ),
+    )
+    address = f"unix://{Path(args.socket).resolve()}" if args.socket else f"http://{args.host}:{args.port}"
+
+    def ready(_server: object) -> None:
+        print(f"Validation daemon: listening={address} workers={args.workers} max_queue={args.max_queue}", flush=True)
+
+    try:
+        serve(host=args.host, port=args.port, unix_socket=args.socket, service=service, ready=ready)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if cache is not None:
+            cache.close()
+        if results is not None:
+            results.close()
     return 0
 
 
+def _cmd_build_citation_index(args: argparse.Namespace) -> int:
+    from tars.validators.research.citations.offline_index import OFFLINE_INDEX_ENV, build_offline_index
+
+    started = time.perf_counter()
+    counts = build_offline_index(args.dumps, args.output)
+    print(
+        "Citation index: "
+        f"dois={counts['doi']} "
+        f"arxiv_ids={counts['arxiv']} "
+        f"elapsed_seconds={time.perf_counter() - started:.2f}"
+    )
+    print(f"Index: {args.output} (use with ${OFFLINE_INDEX_ENV})")
+    return 0
+
+
+def _add_math_options(
+    parser: argparse.ArgumentParser,
+    *,
+    cache_dir_help: str = f"Persist LaTeX-to-SymPy conversions in this directory (default: ${CACHE_DIR_ENV} if set)",
+) -> None:
+    parser.add_argument(
+        "--symbolic-timeout",
+        type=float,
+        default=None,
+        help="Per-equation time budget in seconds for symbolic simplification",
+    )
+    parser.add_argument(
+        "--max-expression-size",
+        type=int,
+        default=None,
+        help="Skip symbolic simplification for equations above this SymPy operation count",
+    )
+    parser.add_argument("--cache-dir", default=None, help=cache_dir_help)
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="TARS command-line interface")
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -44,14 +273,99 @@ def build_parser() -> argparse.ArgumentParser:
         help="Run math validation pipeline on a LaTeX paper (.tex)",
     )
     validate_math.add_argument("paper", help="Path to paper .tex file")
+    _add_math_options(validate_math)
+    validate_math.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Re-check only equations that changed since the last run (results kept in the cache directory)",
+    )
+    validate_math.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-validate (incrementally) whenever the paper or a file it includes is saved",
+    )
+    validate_math.add_argument(
+        "--poll-interval",
+        type=float,
+        default=0.5,
+        help="Seconds between checks for changed files in --watch mode",
+    )
+    validate_math.add_argument(
+        "--remote",
+        default=os.environ.get(REMOTE_ENV),
+        help=(
+            "Run on a `tars serve` daemon (http://host:port or unix:///path) with the daemon's options "
+            f"(default: ${REMOTE_ENV} if set)"
+        ),
+    )
     validate_math.set_defaults(func=_cmd_validate_math)
 
+    validate_corpus = subparsers.add_parser(
+        "validate-corpus",
+        help="Run math validation over many papers and write JSON lines",
+    )
+    validate_corpus.add_argument(
+        "source",
+        help="Directory (searched for .tex recursively), glob pattern, or manifest file with one path per line",
+    )
+    validate_corpus.add_argument("--output", required=True, help="JSONL file receiving one result line per paper")
+    validate_corpus.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes (default: CPU count)",
+    )
+    validate_corpus.add_argument(
+        "--max-tasks-per-child",
+        type=int,
+        default=50 if _POOL_RECYCLES_WORKERS else None,
+        help="Papers a worker validates before it is replaced, bounding memory growth (Python 3.11+)",
+    )
+    validate_corpus.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Overwrite --output instead of skipping papers it already contains",
+    )
+    _add_math_options(validate_corpus)
+    validate_corpus.set_defaults(func=_cmd_validate_corpus)
+
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Run a long-lived validation daemon with a local JSON API",
+    )
+    serve_parser.add_argument("--host", default=DEFAULT_HOST, help="Interface to listen on (default: localhost only)")
+    serve_parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="TCP port to listen on")
+    serve_parser.add_argument("--socket", default=None, help="Listen on this Unix socket instead of TCP")
+    serve_parser.add_argument("--workers", type=int, default=1, help="Jobs validated concurrently")
+    serve_parser.add_argument("--max-queue", type=int, default=64, help="Jobs that may wait before submits are refused")
+    _add_math_options(
+        serve_parser,
+        cache_dir_help=f"Persist conversions and equation results in this directory (default: ${CACHE_DIR_ENV} if set)",
+    )
+    serve_parser.set_defaults(func=_cmd_serve)
+
+    build_index = subparsers.add_parser(
+        "build-citation-index",
+        help="Build an offline DOI/arXiv index from Crossref or arXiv metadata dumps",
+    )
+    build_index.add_argument(
+        "dumps",
+        nargs="+",
+        help="Dump files (.json, .jsonl, optionally .gz) or directories of them",
+    )
+    build_index.add_argument("--output", required=True, help="Index file to write (replaced atomically)")
+    build_index.set_defaults(func=_cmd_build_citation_index)
+
     return parser
 
 
 def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
+    if args.command == "validate-math" and args.remote:
+        _check_remote_options(parser, args)
+    if args.command == "validate-corpus" and args.max_tasks_per_child is not None and not _POOL_RECYCLES_WORKERS:
+        parser.error("--max-tasks-per-child needs Python 3.11 or newer")
     return int(args.func(args))
 
 
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import glob
+import json
+import os
+import sys
+import time
+import warnings
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from tars.validators.research.math.math_validator import MathValidator
+
+
+@dataclass
+class CorpusSummary:
+    """Totals and throughput for one `validate_corpus` run."""
+
+    papers: int = 0
+    resumed: int = 0
+    failed: int = 0
+    errored: int = 0
+    equations: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def papers_per_second(self) -> float:
+        return self.papers / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def equations_per_second(self) -> float:
+        return self.equations / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+def discover_papers(source: str | Path) -> list[Path]:
+    """Resolve a corpus source to .tex paths.
+
+    `source` may be a directory (searched recursively for ``*.tex``), a single
+    ``.tex`` file, a manifest file listing one path per line (blank lines and
+    ``#`` comments ignored, relative paths resolved against the manifest), or a
+    glob pattern.
+    """
+    path = Path(source)
+    if path.is_dir():
+        return sorted(path.rglob("*.tex"))
+    if path.is_file():
+        if path.suffix == ".tex":
+            return [path]
+        papers = []
+        for line in path.read_text(encoding="utf-8").splitlines():
+            entry = line.strip()
+            if entry and not entry.startswith("#"):
+                papers.append(path.parent / entry)
+        return papers
+    return sorted(Path(match) for match in glob.glob(str(source), recursive=True))
+
+
+def _drop_partial_line(output: Path) -> None:
+    """Truncate a trailing line without newline, left behind by a crash mid-write."""
+    if not output.exists():
+        return
+    with output.open("r+b") as handle:
+        end = handle.seek(0, os.SEEK_END)
+        pos = end
+        while pos > 0:
+            step = min(65536, pos)
+            pos -= step
+            handle.seek(pos)
+            chunk = handle.read(step)
+            if pos + step == end and chunk.endswith(b"\n"):
+                return
+            cut = chunk.rfind(b"\n")
+            if cut != -1:
+                handle.truncate(pos + cut + 1)
+                return
+        handle.truncate(0)
+
+
+def completed_papers(output: Path) -> set[str]:
+    """Paper paths already recorded in a results file (unparseable lines ignored)."""
+    done: set[str] = set()
+    if not output.exists():
+        return done
+    with output.open(encoding="utf-8", errors="ignore") as handle:
+        for line in handle:
+            try:
+                done.add(json.loads(line)["paper"])
+            except (ValueError, KeyError, TypeError):
+                continue
+    return done
+
+
+def _paper_record(validator: MathValidator, paper: str) -> dict[str, Any]:
+    started = time.perf_counter()
+    try:
+        result = validator.validate(Path(paper))
+    except Exception as exc:
+        return {
+            "paper": paper,
+            "status": "ERROR",
+            "passed": False,
+            "errors": [f"{type(exc).__name__}: {exc}"],
+            "wall_time_seconds": round(time.perf_counter() - started, 6),
+        }
+    return {
+        "paper": paper,
+        "status": result.status or ("PASS" if result.passed else "FAIL"),
+        "passed": result.passed,
+        "reason": result.reason,
+        "metrics": result.metadata.get("metrics", {}),
+        "errors": result.errors,
+        "results": result.metadata.get("results", []),
+        "wall_time_seconds": round(time.perf_counter() - started, 6),
+    }
+
+
+_worker_validator: MathValidator | None = None
+
+# `ProcessPoolExecutor(max_tasks_per_child=...)` is new in Python 3.11.
+_POOL_RECYCLES_WORKERS = sys.version_info >= (3, 11)
+
+
+def _init_corpus_worker(options: dict[str, Any]) -> None:
+    global _worker_validator
+    _worker_validator = MathValidator(**options)
+
+
+def _validate_paper(paper: str) -> dict[str, Any]:
+    return _paper_record(_worker_validator or MathValidator(), paper)
+
+
+def _iter_records(
+    papers: list[str], *, workers: int, max_tasks_per_child: int | None, options: dict[str, Any]
+) -> Iterator[dict[str, Any]]:
+    if workers <= 1:
+        validator = MathValidator(**options)
+        for paper in papers:
+            yield _paper_record(validator, paper)
+        return
+
+    pool_kwargs: dict[str, Any] = {}
+    if max_tasks_per_child is not None:
+        if _POOL_RECYCLES_WORKERS:
+            pool_kwargs["max_tasks_per_child"] = max_tasks_per_child
+        else:
+            warnings.warn(
+                "max_tasks_per_child needs Python 3.11 or newer; workers will not be recycled",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+
+    # Keep a bounded number of papers in flight so results (and their
+    # per-equation details) never pile up in memory for a large corpus.
+    max_in_flight = workers * 2
+    in_flight: set[Future[dict[str, Any]]] = set()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_corpus_worker,
+        initargs=(options,),
+        **pool_kwargs,
+    ) as pool:
+        for paper in papers:
+            in_flight.add(pool.submit(_validate_paper, paper))
+            if len(in_flight) >= max_in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in list(in_flight):
+            yield future.result()
+
+
+def validate_corpus(
+    papers: Iterable[str | Path],
+    output: str | Path,
+    *,
+    workers: int = 1,
+    resume: bool = True,
+    max_tasks_per_child: int | None = None,
+    validator_options: dict[str, Any] | None = None,
+    on_record: Callable[[dict[str, Any]], None] | None = None,
+) -> CorpusSummary:
+    """Validate many papers and stream one JSON line per paper to `output`.
+
+    Papers run through a process pool of `workers` processes that each build
+    one `MathValidator` (from `validator_options`) and reuse it, so interpreter
+    and SymPy startup are paid once per worker rather than per paper.
+    `max_tasks_per_child` recycles workers to bound memory growth.
+
+    With `resume`, papers already present in `output` are skipped and new
+    records are appended, so a crashed run can simply be restarted. Records
+    are written in completion order.
+    """
+    output = Path(output)
+    options = dict(validator_options or {})
+    summary = CorpusSummary()
+
+    paper_names = [str(paper) for paper in papers]
+    if resume:
+        done = completed_papers(output)
+        remaining = [paper for paper in paper_names if paper not in done]
+        summary.resumed = len(paper_names) - len(remaining)
+        _drop_partial_line(output)
+    else:
+        remaining = paper_names
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    handle = output.open("a" if resume else "w", encoding="utf-8")
+
+    started = time.perf_counter()
+    with handle:
+        for record in _iter_records(
+            remaining, workers=workers, max_tasks_per_child=max_tasks_per_child, options=options
+        ):
+            handle.write(json.dumps(record, default=str) + "\n")
+            handle.flush()
+
+            summary.papers += 1
+            summary.equations += record.get("metrics", {}).get("total_equations", 0)
+            if record["status"] == "ERROR":
+                summary.errored += 1
+            elif not record["passed"]:
+                summary.failed += 1
+            if on_record is not None:
+                on_record(record)
+    summary.elapsed_seconds = time.perf_counter() - started
+    return summary
@@ -0,0 +1,498 @@
+from __future__ import annotations
+
+import http.client
+import itertools
+import json
+import logging
+import os
+import queue
+import socket
+import socketserver
+import threading
+import time
+import urllib.parse
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from tars.settings import DEFAULT_HOST, DEFAULT_PORT
+from tars.validators.base import BaseValidator
+from tars.validators.context import ArtifactContext
+from tars.validators.project import ProjectLoader
+from tars.validators.result import ValidationResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VALIDATORS = ("math_validator",)
+
+# Validators a job may name, built lazily once per worker thread.
+ValidatorFactory = Callable[[], BaseValidator]
+
+
+class QueueFullError(RuntimeError):
+    """Raised by `ValidationService.submit` when the job queue is at capacity."""
+
+
+@dataclass
+class Job:
+    """One submitted paper and its progress through the service."""
+
+    id: str
+    paper: str
+    validators: list[str]
+    status: str = "queued"
+    submitted_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    events: list[dict[str, Any]] = field(default_factory=list)
+    results: list[dict[str, Any]] = field(default_factory=list)
+    error: str | None = None
+    changed: threading.Condition = field(default_factory=threading.Condition, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("done", "error")
+
+    def emit(self, event: dict[str, Any]) -> None:
+        with self.changed:
+            self.events.append(event)
+            self.changed.notify_all()
+
+    def to_dict(self, *, include_results: bool = True) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "id": self.id,
+            "paper": self.paper,
+            "validators": self.validators,
+            "status": self.status,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "event_count": len(self.events),
+            "error": self.error,
+        }
+        if include_results:
+            data["results"] = self.results
+        return data
+
+    def iter_events(self, *, timeout: float | None = None) -> Iterator[dict[str, Any]]:
+        """Yield events as they are emitted until the job finishes."""
+        sent = 0
+        while True:
+            with self.changed:
+                while sent == len(self.events) and not self.done:
+                    if not self.changed.wait(timeout):
+                        return
+                pending = self.events[sent:]
+                finished = self.done
+            yield from pending
+            sent += len(pending)
+            if finished and sent == len(self.events):
+                return
+
+
+def default_validator_factories(
+    cache: Any = None,
+    results: Any = None,
+    *,
+    symbolic_timeout: float | None = None,
+    max_expression_size: int | None = None,
+) -> dict[str, ValidatorFactory]:
+    """Factories for the built-in validators; the budgets bound each equation's symbolic check.
+
+    Without budgets one pathological equation can hold a worker indefinitely.
+    Budgeted checks run in child processes started from a forkserver (or
+    spawned), never forked from the threaded daemon.
+    """
+    from tars.validators.research.citations.citation_validator import CitationValidator
+    from tars.validators.research.math.math_converter import MathConverter
+    from tars.validators.research.math.math_extractor import MathExtractor
+    from tars.validators.research.math.math_validator import MathValidator
+
+    return {
+        "math_validator": lambda: MathValidator(
+            symbolic_timeout=symbolic_timeout,
+            max_expression_size=max_expression_size,
+            cache=cache,
+            results=results,
+        ),
+        "math_extractor": MathExtractor,
+        "math_converter": lambda: MathConverter(cache=cache),
+        "citation_validator": CitationValidator,
+    }
+
+
+class ValidationService:
+    """Validate papers on a bounded pool of long-lived worker threads.
+
+    Jobs wait in a queue of at most `max_queue` entries; `submit` raises
+    `QueueFullError` rather than letting work pile up. Each worker builds its
+    validators once and keeps them, and all workers share one `ProjectLoader`
+    and whatever persistent caches the factories close over, so after
+    `warm_up` a job pays neither import nor construction cost. Validators
+    hold per-run state, which is why they are per worker rather than shared.
+
+    Finished jobs are kept (oldest dropped first) up to `max_finished`, and the
+    loader keeps at most `max_cached_files` source files across all papers.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = 1,
+        max_queue: int = 64,
+        max_finished: int = 256,
+        max_cached_files: int = 1024,
+        factories: dict[str, ValidatorFactory] | None = None,
+    ) -> None:
+        self.workers = workers
+        self.max_finished = max_finished
+        self.factories = factories if factories is not None else default_validator_factories()
+        self.loader = ProjectLoader(max_files=max_cached_files)
+        self._queue: queue.Queue[Job | None] = queue.Queue(maxsize=max_queue)
+        self._jobs: dict[str, Job] = {}
+        self._finished: list[str] = []
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._local = threading.local()
+        self._threads: list[threading.Thread] = []
+
+    def warm_up(self) -> None:
+        """Import SymPy, latex2sympy2 and the ANTLR runtime now rather than on the first job."""
+        try:
+            from tars.validators.research.math.math_converter import convert_latex_to_sympy
+
+            convert_latex_to_sympy("x + 1")
+        except Exception:
+            logger.warning("Could not warm up the LaTeX converter", exc_info=True)
+
+    def start(self) -> None:
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"tars-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float | None = None) -> None:
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads.clear()
+
+    def submit(self, paper: str | Path, validators: list[str] | None = None) -> Job:
+        """Queue a job; None runs `DEFAULT_VALIDATORS`, an empty list is rejected."""
+        names = list(DEFAULT_VALIDATORS if validators is None else validators)
+        if not names:
+            raise ValueError("No validators requested")
+        unknown = [str(name) for name in names if name not in self.factories]
+        if unknown:
+            raise KeyError(f"Unknown validators: {', '.join(unknown)}")
+        job = Job(id=f"job-{next(self._ids)}", paper=str(Path(paper).expanduser().resolve()), validators=names)
+        with self._lock:
+            self._jobs[job.id] = job
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            with self._lock:
+                del self._jobs[job.id]
+            raise QueueFullError(f"Job queue is full ({self._queue.maxsize} waiting)") from None
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            statuses = [job.status for job in self._jobs.values()]
+        return {
+            "workers": self.workers,
+            "queued": statuses.count("queued"),
+            "running": statuses.count("running"),
+            "finished": len(statuses) - statuses.count("queued") - statuses.count("running"),
+            "validators": sorted(self.factories),
+        }
+
+    def _validator(self, name: str) -> BaseValidator:
+        validators = getattr(self._local, "validators", None)
+        if validators is None:
+            validators = self._local.validators = {}
+        if name not in validators:
+            validators[name] = self.factories[name]()
+        return validators[name]
+
+    def _work(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            self.run(job)
+
+    def run(self, job: Job) -> None:
+        """Run `job` in the calling thread, emitting one event per equation and per validator."""
+        with job.changed:
+            job.status = "running"
+            job.started_at = time.time()
+        try:
+            context = ArtifactContext(job.paper, loader=self.loader)
+            for name in job.validators:
+                validator = self._validator(name)
+                streams = hasattr(validator, "on_equation")
+                if streams:
+                    validator.on_equation = lambda item, name=name: job.emit(
+                        {"type": "equation", "validator": name, **item}
+                    )
+                try:
+                    result = validator.validate_context(context)
+                finally:
+                    if streams:
+                        validator.on_equation = None
+                job.results.append(result.to_dict())
+                job.emit({"type": "result", "validator": name, "status": result.status, "passed": result.passed})
+            status, error = "done", None
+        except Exception as exc:
+            logger.exception("Validation job %s failed", job.id)
+            status, error = "error", f"{type(exc).__name__}: {exc}"
+
+        with job.changed:
+            job.status = status
+            job.error = error
+            job.finished_at = time.time()
+            job.events.append({"type": "done", "status": status, "error": error})
+            job.changed.notify_all()
+        self._retire(job)
+
+    def _retire(self, job: Job) -> None:
+        with self._lock:
+            self._finished.append(job.id)
+            while len(self._finished) > self.max_finished:
+                self._jobs.pop(self._finished.pop(0), None)
+
+
+class ValidationRequestHandler(BaseHTTPRequestHandler):
+    """JSON API of the daemon.
+
+    - ``GET /health``: service statistics.
+    - ``POST /jobs`` with ``{"paper": path, "validators": [...]}``: queue a
+      job (202), 400 on bad input, 503 when the queue is full.
+    - ``GET /jobs/<id>``: job status, with full results once finished.
+    - ``GET /jobs/<id>/events``: newline-delimited JSON events streamed as
+      they happen, ending with a ``{"type": "done"}`` event.
+    """
+
+    service: ValidationService
+    protocol_version = "HTTP/1.0"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        logger.debug("%s " + format, self.command, *args)
+
+    def _send_json(self, status: int, payload: dict[str, Any]) -> None:
+        data = json.dumps(payload, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _job(self, job_id: str) -> Job | None:
+        job = self.service.get(job_id)
+        if job is None:
+            self._send_json(404, {"error": f"Unknown job: {job_id}"})
+        return job
+
+    def do_GET(self):  # noqa: N802
+        parts = [part for part in urllib.parse.urlsplit(self.path).path.split("/") if part]
+        if parts == ["health"]:
+            self._send_json(200, {"status": "ok", **self.service.stats()})
+        elif len(parts) == 2 and parts[0] == "jobs":
+            job = self._job(parts[1])
+            if job is not None:
+                self._send_json(200, job.to_dict())
+        elif len(parts) == 3 and parts[0] == "jobs" and parts[2] == "events":
+            job = self._job(parts[1])
+            if job is not None:
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson")
+                self.end_headers()
+                for event in job.iter_events():
+                    self.wfile.write(json.dumps(event, default=str).encode("utf-8") + b"\n")
+                    self.wfile.flush()
+        else:
+            self._send_json(404, {"error": f"Not found: {self.path}"})
+
+    def do_POST(self):  # noqa: N802
+        if urllib.parse.urlsplit(self.path).path.rstrip("/") != "/jobs":
+            self._send_json(404, {"error": f"Not found: {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", "0"))
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": "Request body must be a JSON object"})
+            return
+        paper = body.get("paper") if isinstance(body, dict) else None
+        validators = body.get("validators") if isinstance(body, dict) else None
+        valid_validators = validators is None or (
+            isinstance(validators, list) and validators and all(isinstance(name, str) for name in validators)
+        )
+        if not isinstance(paper, str) or not valid_validators:
+            self._send_json(
+                400, {"error": "Expected {\"paper\": path, \"validators\": [names]} with at least one name"}
+            )
+            return
+        try:
+            job = self.service.submit(paper, validators)
+        except KeyError as exc:
+            self._send_json(400, {"error": exc.args[0]})
+        except ValueError as exc:
+            self._send_json(400, {"error": str(exc)})
+        except QueueFullError as exc:
+            self._send_json(503, {"error": str(exc)})
+        else:
+            self._send_json(202, job.to_dict(include_results=False))
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self) -> tuple[socket.socket, Any]:
+        request, _address = super().get_request()
+        # BaseHTTPRequestHandler expects a (host, port) style client address.
+        return request, ("local", 0)
+
+
+def make_server(
+    service: ValidationService, *, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, unix_socket: str | None = None
+) -> socketserver.BaseServer:
+    """Bind the JSON API to localhost `host`:`port`, or to `unix_socket` if given."""
+    handler = type("BoundValidationRequestHandler", (ValidationRequestHandler,), {"service": service})
+    if unix_socket is not None:
+        if os.path.exists(unix_socket):
+            os.unlink(unix_socket)
+        return ThreadingUnixHTTPServer(unix_socket, handler)
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: float | None = None) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            sock.settimeout(self.timeout)
+        sock.connect(self._socket_path)
+        self.sock = sock
+
+
+class RemoteError(RuntimeError):
+    """The daemon rejected a request or could not be reached."""
+
+
+class RemoteClient:
+    """Client for a `tars serve` daemon at ``http://host:port`` or ``unix:///path/to.sock``."""
+
+    def __init__(self, url: str, *, timeout: float | None = 600.0) -> None:
+        self.url = url
+        self.timeout = timeout
+        parsed = urllib.parse.urlsplit(url)
+        if parsed.scheme == "unix":
+            self._socket_path: str | None = parsed.path
+            self._address = ("localhost", 0)
+        elif parsed.scheme == "http":
+            self._socket_path = None
+            self._address = (parsed.hostname or DEFAULT_HOST, parsed.port or DEFAULT_PORT)
+        else:
+            raise ValueError(f"Unsupported daemon URL: {url} (expected http://host:port or unix:///path)")
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self._socket_path is not None:
+            return _UnixHTTPConnection(self._socket_path, timeout=self.timeout)
+        return http.client.HTTPConnection(*self._address, timeout=self.timeout)
+
+    def _request(self, method: str, path: str, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        conn = self._connection()
+        try:
+            headers = {"Content-Type": "application/json"} if body is not None else {}
+            conn.request(method, path, body=None if body is None else json.dumps(body), headers=headers)
+            response = conn.getresponse()
+            payload = json.loads(response.read() or b"{}")
+        except OSError as exc:
+            raise RemoteError(f"Cannot reach validation daemon at {self.url}: {exc}") from exc
+        finally:
+            conn.close()
+        if response.status >= 400:
+            raise RemoteError(payload.get("error") or f"HTTP {response.status}")
+        return payload
+
+    def health(self) -> dict[str, Any]:
+        return self._request("GET", "/health")
+
+    def submit(self, paper: str | Path, validators: list[str] | None = None) -> dict[str, Any]:
+        body: dict[str, Any] = {"paper": str(Path(paper).expanduser().resolve())}
+        if validators is not None:
+            body["validators"] = validators
+        return self._request("POST", "/jobs", body)
+
+    def job(self, job_id: str) -> dict[str, Any]:
+        return self._request("GET", f"/jobs/{job_id}")
+
+    def events(self, job_id: str) -> Iterator[dict[str, Any]]:
+        conn = self._connection()
+        try:
+            try:
+                conn.request("GET", f"/jobs/{job_id}/events")
+                response = conn.getresponse()
+            except OSError as exc:
+                raise RemoteError(f"Cannot reach validation daemon at {self.url}: {exc}") from exc
+            if response.status >= 400:
+                raise RemoteError(json.loads(response.read() or b"{}").get("error") or f"HTTP {response.status}")
+            for line in response:
+                if line.strip():
+                    yield json.loads(line)
+        finally:
+            conn.close()
+
+    def validate(
+        self,
+        paper: str | Path,
+        validators: list[str] | None = None,
+        *,
+        on_event: Callable[[dict[str, Any]], None] | None = None,
+    ) -> list[ValidationResult]:
+        """Submit `paper`, follow its events until it finishes and return the results."""
+        job_id = self.submit(paper, validators)["id"]
+        for event in self.events(job_id):
+            if on_event is not None:
+                on_event(event)
+        job = self.job(job_id)
+        if job["status"] != "done":
+            raise RemoteError(job.get("error") or f"Job {job_id} ended with status {job['status']}")
+        return [ValidationResult(**result) for result in job["results"]]
+
+
+def serve(
+    *,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    unix_socket: str | None = None,
+    service: ValidationService | None = None,
+    ready: Callable[[socketserver.BaseServer], None] | None = None,
+) -> None:
+    """Run the daemon until interrupted."""
+    service = service or ValidationService()
+    service.warm_up()
+    service.start()
+    server = make_server(service, host=host, port=port, unix_socket=unix_socket)
+    try:
+        if ready is not None:
+            ready(server)
+        server.serve_forever()
+    finally:
+        server.server_close()
+        service.stop(timeout=5)
+        if unix_socket is not None and os.path.exists(unix_socket):
+            os.unlink(unix_socket)
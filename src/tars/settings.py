@@ -0,0 +1,11 @@
+"""Defaults and environment variable names shared by the entry points.
+
+This module must stay free of imports so that CLIs can build their argument
+parsers without importing the modules that implement the commands.
+"""
+
+# Address of a `tars serve` daemon for thin clients (`validate-math --remote`, tars_ui).
+REMOTE_ENV = "TARS_REMOTE"
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
@@ -4,13 +4,46 @@ This namespace hosts validator interfaces and implementations for paper artifact
 (LaTeX, citations, math, structure, reproducibility).
 """
 
-from .base import BaseValidator, ValidatorRegistry
-from .engine import ValidationEngine
-from .result import ValidationResult
+from typing import TYPE_CHECKING
+
+from tars._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base import BaseValidator, ValidatorRegistry
+    from .context import ArtifactContext
+    from .engine import ValidationEngine
+    from .project import LatexProject, ProjectLoader, find_main_tex, load_project
+    from .result import ValidationResult
+    from .source_index import SourceIndex
+
+# Exports (here and in the research subpackages) are imported on first
+# access, so importing one submodule, as the CLI entry points do, does not
+# import every sibling.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BaseValidator": ".base",
+        "ValidatorRegistry": ".base",
+        "ArtifactContext": ".context",
+        "ValidationEngine": ".engine",
+        "LatexProject": ".project",
+        "ProjectLoader": ".project",
+        "find_main_tex": ".project",
+        "load_project": ".project",
+        "ValidationResult": ".result",
+        "SourceIndex": ".source_index",
+    },
+)
 
 __all__ = [
     "ValidationResult",
+    "ArtifactContext",
     "BaseValidator",
     "ValidatorRegistry",
     "ValidationEngine",
+    "SourceIndex",
+    "LatexProject",
+    "ProjectLoader",
+    "load_project",
+    "find_main_tex",
 ]
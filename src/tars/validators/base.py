@@ -3,6 +3,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from pathlib import Path
 
+from .context import ArtifactContext
 from .result import ValidationResult
 
 
@@ -10,7 +11,8 @@ class BaseValidator(ABC):
     """Base class for validator plugins.
 
     Concrete validators should define a unique `name` and optional `artifact_type`
-    and implement `validate`.
+    and implement `validate`. Validators that can reuse parsed artifacts also
+    override `validate_context`.
     """
 
     name: str
@@ -21,6 +23,13 @@ class BaseValidator(ABC):
         """Validate an artifact and return a standardized ValidationResult."""
         raise NotImplementedError
 
+    def validate_context(self, context: ArtifactContext) -> ValidationResult:
+        """Validate using a shared, lazily parsed artifact context.
+
+        The default falls back to the path-based `validate`.
+        """
+        return self.validate(context.path)
+
 
 class ValidatorRegistry:
     """In-memory plugin registry for validator implementations."""
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+CACHE_DIR_ENV = "TARS_CACHE_DIR"
+
+
+def default_cache_dir() -> Path:
+    """Directory named by ``TARS_CACHE_DIR``, else ``~/.cache/tars``."""
+    configured = os.environ.get(CACHE_DIR_ENV)
+    if configured:
+        return Path(configured)
+    return Path.home() / ".cache" / "tars"
+
+
+def cache_dir_from_env() -> Path | None:
+    """The configured cache directory, or None when persistent caching is not opted into."""
+    if not os.environ.get(CACHE_DIR_ENV):
+        return None
+    return default_cache_dir()
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .project import LatexProject, ProjectLoader
+    from .research.citations.extractor import CitationExtraction
+    from .research.math.math_extractor import Equation, ExtractedMathExpression
+
+
+class ArtifactContext:
+    """Lazily parsed view of one artifact, shared by validators in a run.
+
+    Each derived artifact (the loaded project, its unified text, extracted
+    math, citation extraction) is computed on first access and then reused,
+    so a validation run reads and parses the paper at most once no matter how
+    many validators consume it.
+
+    A paper that ``\\input``s other files is loaded as a `LatexProject`, so
+    `text`, math and citations cover the whole document and `locate` maps
+    offsets of `text` back to source files. Pass a shared `loader` to reuse
+    per-file parses of unchanged files across runs.
+    """
+
+    def __init__(self, artifact_path: str | Path, *, loader: ProjectLoader | None = None) -> None:
+        self.path = Path(artifact_path)
+        self._loader = loader
+
+    def preload(self) -> None:
+        """Compute every derived artifact now instead of on first access."""
+        if not self.path.is_file():
+            return
+        # Touching the leaf properties loads the project and its files too.
+        self.equations
+        self.citations
+
+    @cached_property
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    @cached_property
+    def project(self) -> LatexProject:
+        from .project import ProjectLoader
+
+        return (self._loader or ProjectLoader()).load(self.path)
+
+    @cached_property
+    def text(self) -> str:
+        """The unified document: the main file with its includes spliced in."""
+        return self.project.text
+
+    def locate(self, offset: int) -> tuple[Path, int, int]:
+        """``(path, line, column)`` of an offset of `text` in the file it came from."""
+        return self.project.locate(offset)
+
+    @cached_property
+    def math_expressions(self) -> list[ExtractedMathExpression]:
+        return self.project.math_expressions()
+
+    @cached_property
+    def equations(self) -> list[Equation]:
+        from .research.math.math_extractor import MathExtractor
+
+        return MathExtractor().normalize_equations(self.math_expressions)
+
+    @cached_property
+    def citations(self) -> CitationExtraction:
+        return self.project.citations()
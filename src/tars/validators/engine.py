@@ -1,10 +1,22 @@
 from __future__ import annotations
 
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+import time
 
 from .base import BaseValidator, ValidatorRegistry
+from .context import ArtifactContext
 from .result import ValidationResult
 
+EXECUTORS = ("serial", "threads", "processes")
+
+
+def _run_validator(validator: BaseValidator, context: ArtifactContext) -> ValidationResult:
+    started = time.perf_counter()
+    result = validator.validate_context(context)
+    result.metadata["wall_time_seconds"] = round(time.perf_counter() - started, 6)
+    return result
+
 
 class ValidationEngine:
     """Orchestrates validator registration, execution, and result aggregation."""
@@ -23,13 +35,40 @@ class ValidationEngine:
         self,
         paper_path: str | Path,
         validator_names: list[str] | None = None,
+        *,
+        executor: str = "serial",
+        max_workers: int | None = None,
     ) -> list[ValidationResult]:
-        artifact = Path(paper_path)
+        """Run validators against one paper.
+
+        `executor` selects how validators are dispatched: `"serial"` runs them
+        in order in this thread, `"threads"` suits network-bound validators and
+        `"processes"` suits CPU-bound SymPy work. Results are always returned
+        in `validator_names` order, each with `wall_time_seconds` in metadata.
+        """
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor '{executor}'. Expected one of: {', '.join(EXECUTORS)}.")
+
+        # One context per run: validators that opt in share a single read and
+        # parse of the paper instead of each re-extracting it.
+        context = ArtifactContext(Path(paper_path))
         names = validator_names or self.registry.list_names()
-        results: list[ValidationResult] = []
-        for name in names:
-            results.append(self.registry.validate_with(name, artifact))
-        return results
+        validators = [self.registry.get(name) for name in names]
+
+        if executor == "serial" or len(validators) <= 1:
+            return [_run_validator(validator, context) for validator in validators]
+
+        # Parse up front so concurrent validators (and pickled copies of the
+        # context sent to worker processes) share one parse.
+        context.preload()
+        pool: Executor
+        if executor == "threads":
+            pool = ThreadPoolExecutor(max_workers=max_workers)
+        else:
+            pool = ProcessPoolExecutor(max_workers=max_workers)
+        with pool:
+            futures = [pool.submit(_run_validator, validator, context) for validator in validators]
+            return [future.result() for future in futures]
 
     @staticmethod
     def aggregate(results: list[ValidationResult]) -> dict:
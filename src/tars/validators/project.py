@@ -0,0 +1,369 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from functools import cached_property
+import hashlib
+import os
+from pathlib import Path
+import re
+import threading
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+from .source_index import SourceIndex, format_source_location
+
+if TYPE_CHECKING:
+    from .research.citations.extractor import CitationExtraction
+    from .research.math.math_extractor import ExtractedMathExpression
+
+T = TypeVar("T")
+
+_INCLUDE_PATTERN = re.compile(
+    r"\\(?P<command>input|include|subfile)\s*\{(?P<target>[^{}]+)\}"
+    r"|\\(?P<import>import|subimport)\s*\{(?P<directory>[^{}]*)\}\s*\{(?P<import_target>[^{}]+)\}"
+)
+_BIBLIOGRAPHY_PATTERN = re.compile(
+    r"\\(?P<command>bibliography|addbibresource)\s*(?:\[[^\]]*\]\s*)?\{(?P<names>[^{}]+)\}"
+)
+_UNESCAPED_PERCENT = re.compile(r"(?<!\\)%")
+_DOCUMENTCLASS = re.compile(r"^[^%\n]*\\documentclass", re.MULTILINE)
+_BEGIN_DOCUMENT = re.compile(r"^[^%\n]*\\begin\s*\{document\}", re.MULTILINE)
+_MAIN_NAMES = ("main", "ms", "paper", "article")
+
+
+def _is_commented(text: str, offset: int) -> bool:
+    line_start = text.rfind("\n", 0, offset) + 1
+    return _UNESCAPED_PERCENT.search(text, line_start, offset) is not None
+
+
+@dataclass
+class Directive:
+    """An include or bibliography command found in one file."""
+
+    command: str
+    start: int
+    end: int
+    targets: list[str]
+    directory: str | None = None
+
+
+class ProjectFile:
+    """One source file of a project, keyed by content.
+
+    Derived data (line index, directives, per-file parses registered through
+    `memo`) is computed on first use and kept for as long as the loader keeps
+    this file, i.e. until its content changes.
+    """
+
+    def __init__(self, path: Path, data: bytes, *, mtime_ns: int = 0, size: int = 0) -> None:
+        self.path = path
+        self.data = data
+        self.digest = hashlib.sha256(data).hexdigest()
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self._memo: dict[str, Any] = {}
+        self._memo_lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state.pop("_memo_lock", None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._memo_lock = threading.Lock()
+
+    @cached_property
+    def text(self) -> str:
+        return self.data.decode("utf-8", errors="ignore")
+
+    @cached_property
+    def index(self) -> SourceIndex:
+        return SourceIndex(self.text)
+
+    @cached_property
+    def directives(self) -> list[Directive]:
+        found: list[Directive] = []
+        for match in _INCLUDE_PATTERN.finditer(self.text):
+            if _is_commented(self.text, match.start()):
+                continue
+            command = match.group("command") or match.group("import")
+            target = (match.group("target") or match.group("import_target")).strip()
+            found.append(Directive(command, match.start(), match.end(), [target], match.group("directory")))
+        for match in _BIBLIOGRAPHY_PATTERN.finditer(self.text):
+            if not _is_commented(self.text, match.start()):
+                names = [name.strip() for name in match.group("names").split(",") if name.strip()]
+                found.append(Directive(match.group("command"), match.start(), match.end(), names))
+        found.sort(key=lambda directive: directive.start)
+        return found
+
+    def memo(self, name: str, factory: Callable[[], T]) -> T:
+        """Return the cached result of `factory` for this file version."""
+        with self._memo_lock:
+            if name in self._memo:
+                return self._memo[name]
+        value = factory()
+        with self._memo_lock:
+            return self._memo.setdefault(name, value)
+
+
+@dataclass
+class Segment:
+    """A contiguous slice ``[start, end)`` of one file placed at `offset` in the unified text."""
+
+    file: ProjectFile
+    start: int
+    end: int
+    offset: int
+
+
+@dataclass
+class LatexProject:
+    """A main ``.tex`` file with everything it pulls in, in document order.
+
+    `segments` splice the text of ``\\input``/``\\include``/``\\subfile``/
+    ``\\import`` targets (and the ``.bbl`` for ``\\bibliography``) in place of
+    the directives, forming the unified document `text` that validators
+    read; `locate` maps an offset of that text back to its file, line and
+    column. `missing` lists include and bibliography targets that could not
+    be found, relative to `root`.
+    """
+
+    main: ProjectFile
+    root: Path
+    files: list[ProjectFile]
+    segments: list[Segment]
+    bib_files: list[ProjectFile]
+    missing: list[str] = field(default_factory=list)
+
+    @cached_property
+    def text(self) -> str:
+        return "".join(segment.file.text[segment.start : segment.end] for segment in self.segments)
+
+    @cached_property
+    def _segment_offsets(self) -> list[int]:
+        return [segment.offset for segment in self.segments]
+
+    def locate(self, offset: int) -> tuple[Path, int, int]:
+        """Return ``(path, line, column)`` for an offset of the unified `text`."""
+        if offset < 0 or offset > len(self.text):
+            raise IndexError(f"Offset {offset} outside document of length {len(self.text)}.")
+        segment = self.segments[max(bisect_right(self._segment_offsets, offset) - 1, 0)]
+        line, column = segment.file.index.position(segment.start + offset - segment.offset)
+        return segment.file.path, line, column
+
+    def label(self, file: ProjectFile) -> str | None:
+        """How locations in `file` are prefixed: None for the main file, else its path."""
+        if file is self.main:
+            return None
+        return _relative_to(file.path, self.root)
+
+    def location(self, file: ProjectFile, offset: int, label: str) -> str:
+        """A `source_location` string, prefixed with the file path outside the main file."""
+        line, column = file.index.position(offset)
+        location = format_source_location(line, column, label)
+        prefix = self.label(file)
+        return location if prefix is None else f"{prefix}:{location}"
+
+    def math_expressions(self) -> list[ExtractedMathExpression]:
+        """Math expressions of every file, in document order, parsed once per file version."""
+        from .research.math.math_extractor import MathExtractor
+
+        expressions: list[ExtractedMathExpression] = []
+        for segment in self.segments:
+            file = segment.file
+            per_file = file.memo(
+                "math_expressions", lambda file=file: MathExtractor().extract_text(file.text, file.index)
+            )
+            start = file.index.position(segment.start)
+            end = file.index.position(segment.end) if segment.end < len(file.text) else None
+            label = self.label(file)
+            for expression in per_file:
+                position = (expression.line_number, expression.column_number)
+                if position >= start and (end is None or position < end):
+                    expressions.append(expression if label is None else replace(expression, source_file=label))
+        return expressions
+
+    def citations(self) -> CitationExtraction:
+        from .research.citations.extractor import extract_project_citations
+
+        return extract_project_citations(self)
+
+
+def _relative_to(path: Path, root: Path) -> str:
+    """`path` relative to `root` in POSIX form, or the whole path if it lies outside."""
+    path, root = Path(os.path.normpath(path)), Path(os.path.normpath(root))
+    try:
+        return path.relative_to(root).as_posix()
+    except ValueError:
+        return str(path)
+
+
+class ProjectLoader:
+    """Load `LatexProject` objects, re-reading only files that changed.
+
+    Files are cached by resolved path and revalidated by mtime and size; a
+    file whose bytes still hash the same is kept as-is, so its parses survive
+    a touch. Share one loader across runs (watch mode, a daemon) to make
+    re-validation after editing one section re-parse only that file.
+
+    At most `max_files` files are kept; the least recently used is dropped
+    first, so a long-running loader does not grow with every paper it sees.
+    """
+
+    MAX_DEPTH = 32
+
+    def __init__(self, max_files: int = 1024) -> None:
+        self.max_files = max_files
+        self._files: OrderedDict[Path, ProjectFile] = OrderedDict()
+        self._lock = threading.Lock()
+        self.reads = 0
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"max_files": self.max_files}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(state.get("max_files", 1024))
+
+    def file(self, path: str | Path) -> ProjectFile:
+        """The current version of `path` (raises `OSError` if it cannot be read)."""
+        key = Path(path).resolve()
+        stat = key.stat()
+        with self._lock:
+            cached = self._files.get(key)
+            if cached is not None:
+                self._files.move_to_end(key)
+        if cached is not None and (cached.mtime_ns, cached.size) == (stat.st_mtime_ns, stat.st_size):
+            return cached
+
+        data = Path(path).read_bytes()
+        self.reads += 1
+        if cached is not None and cached.digest == hashlib.sha256(data).hexdigest():
+            cached.mtime_ns, cached.size = stat.st_mtime_ns, stat.st_size
+            return cached
+        loaded = ProjectFile(Path(path), data, mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        with self._lock:
+            self._files[key] = loaded
+            self._files.move_to_end(key)
+            while len(self._files) > self.max_files:
+                self._files.popitem(last=False)
+        return loaded
+
+    @staticmethod
+    def _candidates(base: Path, target: str, suffix: str) -> list[Path]:
+        path = base / target
+        return [path] if path.suffix == suffix else [path.with_name(path.name + suffix), path]
+
+    def _first_existing(self, candidates: list[Path]) -> ProjectFile | None:
+        for candidate in candidates:
+            if candidate.is_file():
+                return self.file(candidate)
+        return None
+
+    def load(self, main_path: str | Path) -> LatexProject:
+        main = self.file(main_path)
+        root = main.path.parent
+        files: list[ProjectFile] = []
+        segments: list[Segment] = []
+        bib_files: list[ProjectFile] = []
+        missing: list[str] = []
+        offset = 0
+
+        def emit(file: ProjectFile, start: int, end: int) -> None:
+            nonlocal offset
+            if end > start:
+                segments.append(Segment(file, start, end, offset))
+                offset += end - start
+
+        def visit(file: ProjectFile, stack: tuple[Path, ...]) -> None:
+            if file not in files:
+                files.append(file)
+            position = 0
+            for directive in file.directives:
+                if directive.command in ("bibliography", "addbibresource"):
+                    for name in directive.targets:
+                        bib = self._first_existing(self._candidates(root, name, ".bib"))
+                        if bib is None:
+                            missing.append(name if name.endswith(".bib") else f"{name}.bib")
+                        elif bib not in bib_files:
+                            bib_files.append(bib)
+                    bbl = main.path.with_suffix(".bbl")
+                    if directive.command == "bibliography" and bbl.is_file():
+                        emit(file, position, directive.start)
+                        position = directive.end
+                        bbl_file = self.file(bbl)
+                        if bbl_file not in files:
+                            files.append(bbl_file)
+                        emit(bbl_file, 0, len(bbl_file.text))
+                    continue
+
+                if directive.command == "subimport":
+                    base = file.path.parent / (directive.directory or "")
+                elif directive.command == "import":
+                    base = Path(directive.directory or "")
+                    base = base if base.is_absolute() else root / base
+                else:
+                    base = root
+                target = directive.targets[0]
+                child = self._first_existing(self._candidates(base, target, ".tex"))
+                if child is None:
+                    missing.append(_relative_to(base / target, root))
+                    continue
+                if child.path.resolve() in stack or len(stack) >= self.MAX_DEPTH:
+                    continue
+                emit(file, position, directive.start)
+                position = directive.end
+                visit(child, (*stack, child.path.resolve()))
+            emit(file, position, len(file.text))
+
+        visit(main, (main.path.resolve(),))
+
+        sibling_bib = main.path.with_suffix(".bib")
+        if not bib_files and sibling_bib.is_file():
+            bib_files.append(self.file(sibling_bib))
+        return LatexProject(
+            main=main, root=root, files=files, segments=segments, bib_files=bib_files, missing=missing
+        )
+
+
+def load_project(main_path: str | Path, loader: ProjectLoader | None = None) -> LatexProject:
+    return (loader or ProjectLoader()).load(main_path)
+
+
+def find_main_tex(source_dir: str | Path) -> Path:
+    """Pick the root file of a LaTeX source tree.
+
+    Candidates are ``.tex`` files with an uncommented ``\\documentclass``,
+    preferring ones that also ``\\begin{document}``, are not pulled in by
+    another candidate, and have a conventional name (main, ms, paper,
+    article); remaining ties go to the largest file. Without any
+    ``\\documentclass`` the largest ``.tex`` file is returned.
+    """
+    tex_files = sorted(Path(source_dir).rglob("*.tex"))
+    if not tex_files:
+        raise FileNotFoundError("No .tex files found in arXiv source")
+
+    loader = ProjectLoader()
+    texts = {path: loader.file(path).text for path in tex_files}
+    candidates = [path for path in tex_files if _DOCUMENTCLASS.search(texts[path])]
+    if not candidates:
+        return max(tex_files, key=lambda path: path.stat().st_size)
+
+    included: set[Path] = set()
+    for path in candidates:
+        try:
+            project = loader.load(path)
+        except OSError:
+            continue
+        included.update(file.path.resolve() for file in project.files if file is not project.main)
+
+    def rank(path: Path) -> tuple[bool, bool, bool, int]:
+        return (
+            bool(_BEGIN_DOCUMENT.search(texts[path])),
+            path.resolve() not in included,
+            path.stem.lower() in _MAIN_NAMES,
+            path.stat().st_size,
+        )
+
+    return max(candidates, key=rank)
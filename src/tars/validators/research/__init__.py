@@ -1,5 +1,19 @@
 """Research-focused validator modules."""
 
-from .citations import CitationValidator
+from typing import TYPE_CHECKING
 
-__all__ = ["CitationValidator"]
+from tars._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .citations import CitationValidator
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "CitationValidator": ".citations",
+    },
+)
+
+__all__ = [
+    "CitationValidator",
+]
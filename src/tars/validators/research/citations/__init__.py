@@ -1,8 +1,39 @@
 """Citation validation helpers and validator implementation."""
 
-from .citation_validator import CitationValidator
-from .extractor import CitationExtraction, extract_citations
-from .resolver import arxiv_exists, doi_resolves
+from typing import TYPE_CHECKING
+
+from tars._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .arxiv_batch import ArxivBatchResolver, ArxivRecord, parse_atom_feed
+    from .bibtex import BibEntry, iter_bib_entries, parse_bib
+    from .citation_validator import CitationValidator
+    from .extractor import CitationExtraction, extract_citations
+    from .offline_index import OfflineIndex, build_offline_index
+    from .resolution_cache import ResolutionCache
+    from .resolver import CitationResolver, ConnectionPool, arxiv_exists, doi_resolves
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ArxivBatchResolver": ".arxiv_batch",
+        "ArxivRecord": ".arxiv_batch",
+        "parse_atom_feed": ".arxiv_batch",
+        "BibEntry": ".bibtex",
+        "iter_bib_entries": ".bibtex",
+        "parse_bib": ".bibtex",
+        "CitationValidator": ".citation_validator",
+        "CitationExtraction": ".extractor",
+        "extract_citations": ".extractor",
+        "OfflineIndex": ".offline_index",
+        "build_offline_index": ".offline_index",
+        "ResolutionCache": ".resolution_cache",
+        "CitationResolver": ".resolver",
+        "ConnectionPool": ".resolver",
+        "arxiv_exists": ".resolver",
+        "doi_resolves": ".resolver",
+    },
+)
 
 __all__ = [
     "CitationValidator",
@@ -10,4 +41,15 @@ __all__ = [
     "extract_citations",
     "doi_resolves",
     "arxiv_exists",
+    "CitationResolver",
+    "ConnectionPool",
+    "ResolutionCache",
+    "ArxivBatchResolver",
+    "ArxivRecord",
+    "parse_atom_feed",
+    "OfflineIndex",
+    "build_offline_index",
+    "BibEntry",
+    "iter_bib_entries",
+    "parse_bib",
 ]
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import http.client
+import re
+import threading
+import time
+from typing import Iterable
+from urllib.parse import urlencode
+import xml.etree.ElementTree as ET
+
+from .resolver import ARXIV_PATTERN, _HEADERS, CheckResult, ConnectionPool
+
+ARXIV_QUERY_URL = "https://export.arxiv.org/api/query"
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_ARXIV = "{http://arxiv.org/schemas/atom}"
+_ENTRY_ID = re.compile(r"/abs/(?P<base>.+?)(?:v(?P<version>\d+))?$")
+_VERSION = re.compile(r"^(?P<base>.+?)(?:v(?P<version>\d+))?$")
+_WITHDRAWN_COMMENT = re.compile(r"\bwithdrawn\b", re.IGNORECASE)
+_WITHDRAWN_SUMMARY = re.compile(
+    r"^\s*this (?:paper|article|submission|manuscript) (?:has been|is) withdrawn", re.IGNORECASE
+)
+
+NOT_FOUND_REASON = "arXiv ID not found"
+WITHDRAWN_REASON = "arXiv paper withdrawn"
+
+
+class ArxivQueryError(RuntimeError):
+    """The arXiv query API returned an error or an unparseable response."""
+
+
+@dataclass(frozen=True)
+class ArxivRecord:
+    """What the arXiv query API reports about one eprint."""
+
+    arxiv_id: str
+    exists: bool
+    latest_version: int | None = None
+    withdrawn: bool = False
+    title: str | None = None
+
+
+def split_version(arxiv_id: str) -> tuple[str, int | None]:
+    """Split ``1706.03762v5`` into ``("1706.03762", 5)``; the version may be absent."""
+    match = _VERSION.match(arxiv_id.strip())
+    if match is None:
+        return arxiv_id.strip(), None
+    version = match.group("version")
+    return match.group("base"), int(version) if version else None
+
+
+def is_withdrawn(comment: str = "", summary: str = "") -> bool:
+    """Whether an eprint's comment or abstract marks it as withdrawn."""
+    return bool(_WITHDRAWN_COMMENT.search(comment or "") or _WITHDRAWN_SUMMARY.search(summary or ""))
+
+
+def _text(element: ET.Element, tag: str) -> str:
+    child = element.find(tag)
+    return " ".join((child.text or "").split()) if child is not None else ""
+
+
+def parse_atom_feed(data: bytes | str) -> dict[str, ArxivRecord]:
+    """Parse an ``id_list`` query response into records keyed by lowercased base ID.
+
+    Only eprints present in the feed are returned. A feed-level error entry
+    (e.g. a malformed ID in the query) raises `ArxivQueryError`.
+    """
+    try:
+        root = ET.fromstring(data)
+    except ET.ParseError as exc:
+        raise ArxivQueryError(f"Unparseable arXiv response: {exc}") from exc
+
+    records: dict[str, ArxivRecord] = {}
+    for entry in root.iter(f"{_ATOM}entry"):
+        entry_id = _text(entry, f"{_ATOM}id")
+        if "/api/errors" in entry_id:
+            raise ArxivQueryError(_text(entry, f"{_ATOM}summary") or entry_id)
+        match = _ENTRY_ID.search(entry_id)
+        if match is None:
+            # The API answers unknown (but well-formed) IDs with an empty entry.
+            continue
+        version = match.group("version")
+        comment = _text(entry, f"{_ARXIV}comment")
+        summary = _text(entry, f"{_ATOM}summary")
+        base = match.group("base")
+        records[base.lower()] = ArxivRecord(
+            arxiv_id=base,
+            exists=True,
+            latest_version=int(version) if version else None,
+            withdrawn=is_withdrawn(comment, summary),
+            title=_text(entry, f"{_ATOM}title") or None,
+        )
+    return records
+
+
+def record_check(arxiv_id: str, record: ArxivRecord) -> CheckResult:
+    """Turn a record into the ``(ok, reason)`` pair `CitationValidator` reports."""
+    if not record.exists:
+        return False, NOT_FOUND_REASON
+    if record.withdrawn:
+        return False, WITHDRAWN_REASON
+    _, version = split_version(arxiv_id)
+    if version is not None and record.latest_version is not None and version > record.latest_version:
+        return False, f"arXiv version v{version} not found (latest is v{record.latest_version})"
+    return True, None
+
+
+class ArxivBatchResolver:
+    """Resolve many arXiv IDs through the query API's ``id_list`` interface.
+
+    IDs are stripped of their version, deduplicated and sent `chunk_size` at
+    a time, so a bibliography of hundreds of eprints costs a handful of
+    requests. Consecutive requests are spaced by `request_interval` seconds,
+    as the arXiv API terms ask. Records are memoized on the instance, so one
+    resolver shared across a corpus run (or warmed with `prefetch`) never
+    asks twice about the same eprint.
+    """
+
+    def __init__(
+        self,
+        *,
+        chunk_size: int = 100,
+        timeout: float = 10.0,
+        request_interval: float = 3.0,
+        base_url: str = ARXIV_QUERY_URL,
+        pool: ConnectionPool | None = None,
+    ) -> None:
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+        self.request_interval = request_interval
+        self.base_url = base_url
+        self.pool = pool or ConnectionPool(per_host_limit=1)
+        self.requests = 0
+        self._records: dict[str, ArxivRecord] = {}
+        self._lock = threading.Lock()
+        self._last_request = 0.0
+
+    def __getstate__(self) -> dict[str, object]:
+        return {
+            "chunk_size": self.chunk_size,
+            "timeout": self.timeout,
+            "request_interval": self.request_interval,
+            "base_url": self.base_url,
+        }
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        self.__init__(**state)  # type: ignore[arg-type]
+
+    def _query(self, base_ids: list[str]) -> dict[str, ArxivRecord]:
+        url = f"{self.base_url}?{urlencode({'id_list': ','.join(base_ids), 'max_results': len(base_ids)})}"
+        with self._lock:
+            wait = self._last_request + self.request_interval - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                status, body = self.pool.fetch("GET", url, timeout=self.timeout, headers=_HEADERS)
+            finally:
+                self._last_request = time.monotonic()
+                self.requests += 1
+        if status != 200:
+            raise ArxivQueryError(f"arXiv query HTTP error: {status}")
+        return parse_atom_feed(body)
+
+    @staticmethod
+    def _bases(arxiv_ids: Iterable[str]) -> dict[str, str]:
+        return {
+            value: split_version(value.strip())[0] for value in arxiv_ids if ARXIV_PATTERN.match(value.strip())
+        }
+
+    def _memoized(self, bases: dict[str, str]) -> dict[str, ArxivRecord]:
+        return {value: self._records[base.lower()] for value, base in bases.items() if base.lower() in self._records}
+
+    def lookup(self, arxiv_ids: Iterable[str]) -> dict[str, ArxivRecord]:
+        """Return a record per well-formed requested ID (malformed IDs are omitted).
+
+        Raises `ArxivQueryError`, `OSError` or `http.client.HTTPException` if
+        a chunk cannot be fetched; chunks fetched before the failure stay
+        memoized.
+        """
+        bases = self._bases(arxiv_ids)
+        missing = list(dict.fromkeys(base for base in bases.values() if base.lower() not in self._records))
+
+        for start in range(0, len(missing), self.chunk_size):
+            chunk = missing[start : start + self.chunk_size]
+            found = self._query(chunk)
+            for base in chunk:
+                key = base.lower()
+                self._records[key] = found.get(key, ArxivRecord(arxiv_id=base, exists=False))
+
+        return self._memoized(bases)
+
+    def prefetch(self, arxiv_ids: Iterable[str]) -> None:
+        """Resolve `arxiv_ids` ahead of time, e.g. for every paper in a corpus."""
+        self.lookup(arxiv_ids)
+
+    def check(self, arxiv_ids: Iterable[str]) -> dict[str, CheckResult]:
+        """``(ok, reason)`` per ID, in the same form as `arxiv_exists`.
+
+        If the query API cannot be reached, IDs not already memoized fail
+        with an "arXiv lookup failed" reason, which is never cached.
+        """
+        ids = list(dict.fromkeys(arxiv_ids))
+        failure: str | None = None
+        try:
+            records = self.lookup(ids)
+        except (ArxivQueryError, OSError, http.client.HTTPException) as exc:
+            records = self._memoized(self._bases(ids))
+            failure = f"arXiv lookup failed: {exc}"
+
+        results: dict[str, CheckResult] = {}
+        for value in ids:
+            if value in records:
+                results[value] = record_check(value, records[value])
+            elif failure is not None and ARXIV_PATTERN.match(value.strip()):
+                results[value] = (False, failure)
+            else:
+                results[value] = (False, "Malformed arXiv ID")
+        return results
+
+    def close(self) -> None:
+        self.pool.close()
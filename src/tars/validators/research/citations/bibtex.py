@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import io
+from pathlib import Path
+import re
+from typing import Iterable, Iterator, TextIO
+
+# Month macros every standard BibTeX style defines.
+DEFAULT_MACROS = {
+    name: full
+    for name, full in zip(
+        ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"),
+        (
+            "January",
+            "February",
+            "March",
+            "April",
+            "May",
+            "June",
+            "July",
+            "August",
+            "September",
+            "October",
+            "November",
+            "December",
+        ),
+    )
+}
+
+_HEADER = re.compile(r"@\s*([A-Za-z][\w:-]*)\s*([{(])")
+_PARTIAL_HEADER = re.compile(r"@\s*(?:[A-Za-z][\w:-]*\s*)?\Z")
+_BRACE_DELIMS = re.compile(r"[{}]")
+_PAREN_DELIMS = re.compile(r"[{})]")
+_QUOTE_DELIMS = re.compile(r'[{}"]')
+_FIELD_NAME = re.compile(r"\s*([^\s=,{}\"#()]+)\s*=\s*")
+_BARE_VALUE = re.compile(r"[^\s,#{}\"]+")
+_SEPARATOR = re.compile(r"\s*(#|,|\Z)")
+
+
+@dataclass
+class BibEntry:
+    """One parsed BibTeX entry; field names are lowercased, values macro-expanded."""
+
+    entry_type: str
+    key: str
+    fields: dict[str, str] = field(default_factory=dict)
+    line: int = 1
+
+    def as_item(self) -> dict[str, str]:
+        """The flat dict shape used by `CitationExtraction.bib_items`."""
+        return {"entry_type": self.entry_type, "key": self.key, **self.fields}
+
+
+def _read_chunks(handle: TextIO, chunk_size: int) -> Iterator[str]:
+    while chunk := handle.read(chunk_size):
+        yield chunk
+
+
+def _raw_entries(chunks: Iterable[str]) -> Iterator[tuple[str, str, int]]:
+    """Yield ``(entry_type, body, line)`` for each ``@type{...}`` block.
+
+    Bodies are delimited by brace balancing (or a top-level ``)`` for
+    ``@type(...)``), carried across chunk boundaries, so every character is
+    scanned once. Text outside entries is ignored, as BibTeX does.
+    """
+    buf = ""
+    line = 1
+    parts: list[str] | None = None
+    entry_type = ""
+    entry_line = 1
+    depth = 0
+    delims = _BRACE_DELIMS
+    closer = "}"
+
+    for chunk in chunks:
+        buf += chunk
+        pos = 0
+        while True:
+            if parts is None:
+                at = buf.find("@", pos)
+                if at == -1:
+                    line += buf.count("\n", pos)
+                    buf = ""
+                    break
+                line += buf.count("\n", pos, at)
+                header = _HEADER.match(buf, at)
+                if header is None:
+                    if _PARTIAL_HEADER.match(buf, at):
+                        buf = buf[at:]
+                        break
+                    pos = at + 1
+                    continue
+                entry_type = header.group(1).lower()
+                entry_line = line
+                line += buf.count("\n", at, header.end())
+                closer = "}" if header.group(2) == "{" else ")"
+                delims = _BRACE_DELIMS if closer == "}" else _PAREN_DELIMS
+                depth = 0
+                parts = []
+                pos = header.end()
+
+            end = -1
+            for match in delims.finditer(buf, pos):
+                char = match.group()
+                if char == "{":
+                    depth += 1
+                elif depth == 0 and char == closer:
+                    end = match.start()
+                    break
+                elif char == "}":
+                    depth = max(depth - 1, 0)
+            if end == -1:
+                parts.append(buf[pos:])
+                line += buf.count("\n", pos)
+                buf = ""
+                break
+            parts.append(buf[pos:end])
+            line += buf.count("\n", pos, end + 1)
+            yield entry_type, "".join(parts), entry_line
+            parts = None
+            pos = end + 1
+
+
+def _closing_brace(text: str, start: int) -> int:
+    """Index of the ``}`` matching the ``{`` at `start` (or len(text) if unbalanced)."""
+    depth = 0
+    for match in _BRACE_DELIMS.finditer(text, start):
+        depth += 1 if match.group() == "{" else -1
+        if depth == 0:
+            return match.start()
+    return len(text)
+
+
+def _closing_quote(text: str, start: int) -> int:
+    """Index of the ``"`` ending the quoted string opened at `start`."""
+    depth = 0
+    for match in _QUOTE_DELIMS.finditer(text, start + 1):
+        char = match.group()
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth = max(depth - 1, 0)
+        elif depth == 0:
+            return match.start()
+    return len(text)
+
+
+def _unwrap(value: str) -> str:
+    """Drop braces that enclose the whole value, e.g. ``{{Deep Learning}}``."""
+    while value.startswith("{") and _closing_brace(value, 0) == len(value) - 1:
+        value = value[1:-1].strip()
+    return value
+
+
+def _parse_value(text: str, pos: int, macros: dict[str, str]) -> tuple[str, int]:
+    """Parse ``piece # piece # ...`` at `pos`; return the raw joined value and the end offset."""
+    pieces: list[str] = []
+    while True:
+        while pos < len(text) and text[pos].isspace():
+            pos += 1
+        if pos >= len(text):
+            break
+        char = text[pos]
+        if char == "{":
+            end = _closing_brace(text, pos)
+            pieces.append(text[pos + 1 : end])
+            pos = end + 1
+        elif char == '"':
+            end = _closing_quote(text, pos)
+            pieces.append(text[pos + 1 : end])
+            pos = end + 1
+        else:
+            bare = _BARE_VALUE.match(text, pos)
+            if bare is None:
+                break
+            token = bare.group()
+            pieces.append(token if token.isdigit() else macros.get(token.lower(), token))
+            pos = bare.end()
+        separator = _SEPARATOR.match(text, pos)
+        if separator is None or separator.group(1) != "#":
+            break
+        pos = separator.end()
+    return "".join(pieces), pos
+
+
+def _parse_fields(body: str, pos: int, macros: dict[str, str], *, raw: bool = False) -> dict[str, str]:
+    fields: dict[str, str] = {}
+    while pos < len(body):
+        name = _FIELD_NAME.match(body, pos)
+        if name is None:
+            comma = body.find(",", pos)
+            if comma == -1:
+                break
+            pos = comma + 1
+            continue
+        value, pos = _parse_value(body, name.end(), macros)
+        # Macro bodies keep their exact text so concatenation spacing survives.
+        fields[name.group(1).lower()] = value if raw else _unwrap(" ".join(value.split()))
+    return fields
+
+
+def iter_bib_entries(
+    source: str | Path | TextIO,
+    *,
+    macros: dict[str, str] | None = None,
+    chunk_size: int = 1 << 16,
+) -> Iterator[BibEntry]:
+    """Stream the entries of a ``.bib`` file (a path or an open text file).
+
+    The file is read in `chunk_size` pieces and each entry is yielded as soon
+    as its closing delimiter is seen, so memory stays bounded by the largest
+    entry. ``@string`` definitions (plus the standard month macros and any
+    `macros` given) are expanded and ``#`` concatenation is applied;
+    ``@comment`` and ``@preamble`` blocks are skipped.
+    """
+    if isinstance(source, (str, Path)):
+        with Path(source).open(encoding="utf-8", errors="ignore") as handle:
+            yield from iter_bib_entries(handle, macros=macros, chunk_size=chunk_size)
+        return
+
+    known = {**DEFAULT_MACROS, **{name.lower(): value for name, value in (macros or {}).items()}}
+    for entry_type, body, line in _raw_entries(_read_chunks(source, chunk_size)):
+        if entry_type in ("comment", "preamble"):
+            continue
+        if entry_type == "string":
+            known.update(_parse_fields(body, 0, known, raw=True))
+            continue
+        comma = body.find(",")
+        key = (body if comma == -1 else body[:comma]).strip()
+        fields = {} if comma == -1 else _parse_fields(body, comma + 1, known)
+        yield BibEntry(entry_type=entry_type, key=key, fields=fields, line=line)
+
+
+def parse_bib(text: str, *, macros: dict[str, str] | None = None) -> list[BibEntry]:
+    """Parse BibTeX source held in memory."""
+    return list(iter_bib_entries(io.StringIO(text), macros=macros))
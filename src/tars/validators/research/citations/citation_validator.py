@@ -4,21 +4,45 @@ from pathlib import Path
 from typing import Any
 
 from tars.validators.base import BaseValidator
+from tars.validators.context import ArtifactContext
 from tars.validators.result import ValidationResult
 
 from .extractor import extract_citations
-from .resolver import arxiv_exists, doi_resolves
+from .offline_index import OfflineIndex
+from .resolution_cache import ResolutionCache
+from .resolver import CitationResolver, arxiv_exists, doi_resolves
 
 
 class CitationValidator(BaseValidator):
-    """Deterministic citation quality and resolvability validator for LaTeX papers."""
+    """Deterministic citation quality and resolvability validator for LaTeX papers.
+
+    DOIs and arXiv IDs are resolved concurrently through a `CitationResolver`
+    (pooled keep-alive connections, per-host limits, overall deadline); pass
+    one to tune limits, point it at other endpoints or attach a
+    `ResolutionCache`, whose per-run hit counts are then reported as
+    ``resolution_cache`` in the metadata. The default resolver caches in
+    ``$TARS_CACHE_DIR`` when that is set.
+
+    With an `OfflineIndex` (or ``$TARS_CITATION_INDEX`` naming one), the
+    resolver is bypassed and every identifier is checked against the local
+    index, so validation needs no network.
+    """
 
     name = "citation_validator"
     artifact_type = "research-paper"
 
+    def __init__(
+        self, *, resolver: CitationResolver | None = None, offline_index: OfflineIndex | None = None
+    ) -> None:
+        self.offline_index = offline_index if offline_index is not None else OfflineIndex.from_env()
+        self.resolver = resolver or CitationResolver(cache=ResolutionCache.from_env())
+
     def validate(self, artifact_path: Path) -> ValidationResult:
-        path = Path(artifact_path)
-        if not path.exists():
+        return self.validate_context(ArtifactContext(artifact_path))
+
+    def validate_context(self, context: ArtifactContext) -> ValidationResult:
+        path = context.path
+        if not context.exists:
             return ValidationResult(
                 name=self.name,
                 passed=False,
@@ -28,11 +52,15 @@ class CitationValidator(BaseValidator):
                 metadata={"artifact_path": str(path)},
             )
 
-        extraction = extract_citations(path)
+        extraction = context.citations
 
         errors: list[str] = []
         warnings: list[str] = []
 
+        missing_includes = list(context.project.missing)
+        if missing_includes:
+            warnings.append(f"Included files not found, their citations are not checked: {', '.join(missing_includes)}")
+
         missing_keys = sorted(extraction.cite_keys - extraction.bib_keys)
         if missing_keys:
             errors.append(f"In-text citations missing bibliography entries: {', '.join(missing_keys)}")
@@ -41,6 +69,23 @@ class CitationValidator(BaseValidator):
         doi_checks: list[dict[str, Any]] = []
         arxiv_checks: list[dict[str, Any]] = []
 
+        dois = [doi for entry in extraction.bib_items if (doi := entry.get("doi", "").strip())]
+        arxiv_ids = [
+            eprint
+            for entry in extraction.bib_items
+            if (eprint := entry.get("eprint", "").strip()) and entry.get("archiveprefix", "").strip().lower() == "arxiv"
+        ]
+        cache = None
+        cache_before = None
+        if self.offline_index is not None:
+            doi_results, arxiv_results = self.offline_index.resolve(dois, arxiv_ids)
+        else:
+            cache = self.resolver.cache
+            cache_before = None if cache is None else (cache.hits, cache.misses, cache.coalesced)
+            doi_results, arxiv_results = self.resolver.resolve(
+                dois, arxiv_ids, doi_check=doi_resolves, arxiv_check=arxiv_exists
+            )
+
         for entry in extraction.bib_items:
             key = entry.get("key", "")
 
@@ -58,7 +103,7 @@ class CitationValidator(BaseValidator):
 
             doi = entry.get("doi", "").strip()
             if doi:
-                ok, reason = doi_resolves(doi)
+                ok, reason = doi_results[doi]
                 doi_checks.append({"key": key, "doi": doi, "ok": ok, "reason": reason})
                 if not ok:
                     warnings.append(f"DOI check failed for '{key}': {reason}")
@@ -66,7 +111,7 @@ class CitationValidator(BaseValidator):
             eprint = entry.get("eprint", "").strip()
             archive_prefix = entry.get("archiveprefix", "").strip().lower()
             if eprint and archive_prefix == "arxiv":
-                ok, reason = arxiv_exists(eprint)
+                ok, reason = arxiv_results[eprint]
                 arxiv_checks.append({"key": key, "arxiv_id": eprint, "ok": ok, "reason": reason})
                 if not ok:
                     warnings.append(f"arXiv check failed for '{key}': {reason}")
@@ -74,20 +119,32 @@ class CitationValidator(BaseValidator):
         passed = not errors
         status = "PASS" if passed else "FAIL"
 
+        metadata: dict[str, Any] = {
+            "artifact_path": str(path),
+            "total_in_text_citations": len(extraction.cite_keys),
+            "total_bibliography_entries": len(extraction.bib_keys),
+            "missing_citation_keys": missing_keys,
+            "missing_citation_locations": {key: extraction.cite_locations.get(key, []) for key in missing_keys},
+            "missing_includes": missing_includes,
+            "malformed_entries": malformed_entries,
+            "doi_checks": doi_checks,
+            "arxiv_checks": arxiv_checks,
+            "warnings": warnings,
+        }
+        if self.offline_index is not None:
+            metadata["offline_index"] = str(self.offline_index.path)
+        if cache is not None and cache_before is not None:
+            metadata["resolution_cache"] = {
+                "hits": cache.hits - cache_before[0],
+                "misses": cache.misses - cache_before[1],
+                "coalesced": cache.coalesced - cache_before[2],
+            }
+
         return ValidationResult(
             name=self.name,
             passed=passed,
             status=status,
             reason=None,
             errors=errors,
-            metadata={
-                "artifact_path": str(path),
-                "total_in_text_citations": len(extraction.cite_keys),
-                "total_bibliography_entries": len(extraction.bib_keys),
-                "missing_citation_keys": missing_keys,
-                "malformed_entries": malformed_entries,
-                "doi_checks": doi_checks,
-                "arxiv_checks": arxiv_checks,
-                "warnings": warnings,
-            },
+            metadata=metadata,
         )
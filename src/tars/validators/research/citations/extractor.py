@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import io
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from tars.validators.source_index import SourceIndex
+
+from .bibtex import iter_bib_entries
+
+if TYPE_CHECKING:
+    from tars.validators.project import LatexProject
 
 
 @dataclass
@@ -10,43 +19,89 @@ class CitationExtraction:
     cite_keys: set[str]
     bib_keys: set[str]
     bib_items: list[dict[str, str]]
+    cite_locations: dict[str, list[str]] = field(default_factory=dict)
 
 
 _CITE_PATTERN = re.compile(r"\\cite[a-zA-Z*]*\{([^}]*)\}")
 _BIBITEM_PATTERN = re.compile(r"\\bibitem\{([^}]*)\}")
-_BIB_ENTRY_PATTERN = re.compile(r"@(\w+)\s*\{\s*([^,\s]+)\s*,(.*?)\}\s*(?=@|\Z)", re.DOTALL)
-_FIELD_PATTERN = re.compile(r"(\w+)\s*=\s*(\{.*?\}|\".*?\"|[^,\n]+)\s*,?", re.DOTALL)
 
 
 def _split_keys(value: str) -> list[str]:
     return [k.strip() for k in value.split(",") if k.strip()]
 
 
-def extract_citations(tex_path: Path) -> CitationExtraction:
-    text = tex_path.read_text(encoding="utf-8", errors="ignore")
+def _scan(text: str) -> tuple[list[tuple[str, int]], set[str]]:
+    """Return ``(key, offset)`` for every ``\\cite`` key and the set of ``\\bibitem`` keys."""
+    cites = [(key, m.start()) for m in _CITE_PATTERN.finditer(text) for key in _split_keys(m.group(1))]
+    bibitems = {m.group(1).strip() for m in _BIBITEM_PATTERN.finditer(text)}
+    return cites, bibitems
 
-    cite_keys: set[str] = set()
-    for m in _CITE_PATTERN.finditer(text):
-        cite_keys.update(_split_keys(m.group(1)))
 
-    bib_keys: set[str] = set()
-    for m in _BIBITEM_PATTERN.finditer(text):
-        bib_keys.add(m.group(1).strip())
+def extract_citations(
+    tex_path: Path,
+    *,
+    text: str | None = None,
+    index: SourceIndex | None = None,
+) -> CitationExtraction:
+    """Extract in-text citation keys and bibliography entries for a paper.
+
+    `text` and `index` may be passed when the paper has already been read.
+    """
+    if text is None:
+        text = tex_path.read_text(encoding="utf-8", errors="ignore")
+
+    index = index or SourceIndex(text)
+    cites, bib_keys = _scan(text)
+    cite_keys: set[str] = set()
+    cite_locations: dict[str, list[str]] = {}
+    for key, offset in cites:
+        cite_keys.add(key)
+        cite_locations.setdefault(key, []).append(index.location(offset, "cite"))
 
     bib_items: list[dict[str, str]] = []
     bib_path = tex_path.with_suffix(".bib")
     if bib_path.exists():
-        bib_text = bib_path.read_text(encoding="utf-8", errors="ignore")
-        for entry_match in _BIB_ENTRY_PATTERN.finditer(bib_text):
-            entry_type = entry_match.group(1).strip().lower()
-            key = entry_match.group(2).strip()
-            body = entry_match.group(3)
-            fields: dict[str, str] = {}
-            for field_match in _FIELD_PATTERN.finditer(body):
-                fname = field_match.group(1).strip().lower()
-                raw_val = field_match.group(2).strip()
-                fields[fname] = raw_val.strip("{}\"")
-            bib_items.append({"entry_type": entry_type, "key": key, **fields})
-            bib_keys.add(key)
-
-    return CitationExtraction(cite_keys=cite_keys, bib_keys=bib_keys, bib_items=bib_items)
+        for entry in iter_bib_entries(bib_path):
+            bib_items.append(entry.as_item())
+            bib_keys.add(entry.key)
+
+    return CitationExtraction(
+        cite_keys=cite_keys,
+        bib_keys=bib_keys,
+        bib_items=bib_items,
+        cite_locations=cite_locations,
+    )
+
+
+def extract_project_citations(project: LatexProject) -> CitationExtraction:
+    """Extract citations across every file of a multi-file project.
+
+    Cite keys are collected from the main file and everything it includes
+    (locations carry the file path outside the main file); bibliography
+    entries come from ``\\bibitem``s, the spliced ``.bbl`` and every ``.bib``
+    named by ``\\bibliography``/``\\addbibresource``. Each file is scanned
+    once per version.
+    """
+    cite_keys: set[str] = set()
+    bib_keys: set[str] = set()
+    cite_locations: dict[str, list[str]] = {}
+    for file in project.files:
+        cites, bibitems = file.memo("citations", lambda file=file: _scan(file.text))
+        for key, offset in cites:
+            cite_keys.add(key)
+            cite_locations.setdefault(key, []).append(project.location(file, offset, "cite"))
+        bib_keys |= bibitems
+
+    bib_items: list[dict[str, str]] = []
+    for file in project.bib_files:
+        entries = file.memo("bib_entries", lambda file=file: list(iter_bib_entries(io.StringIO(file.text))))
+        for entry in entries:
+            bib_items.append(entry.as_item())
+            bib_keys.add(entry.key)
+
+    return CitationExtraction(
+        cite_keys=cite_keys,
+        bib_keys=bib_keys,
+        bib_items=bib_items,
+        cite_locations=cite_locations,
+    )
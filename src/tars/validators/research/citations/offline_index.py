@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+from pathlib import Path
+import sqlite3
+import threading
+from typing import IO, Any, Iterable, Iterator
+
+from .arxiv_batch import ArxivRecord, is_withdrawn, record_check, split_version
+from .resolution_cache import normalize_identifier
+from .resolver import ARXIV_PATTERN, DOI_PATTERN, CheckResult
+
+OFFLINE_INDEX_ENV = "TARS_CITATION_INDEX"
+
+DOI_MISSING_REASON = "DOI not in offline index"
+ARXIV_MISSING_REASON = "arXiv ID not in offline index"
+
+# (kind, identifier, latest_version, withdrawn)
+IndexRow = tuple[str, str, int | None, int]
+
+
+def _index_key(kind: str, identifier: str) -> str:
+    key = normalize_identifier(kind, identifier)
+    if kind == "arxiv":
+        key = split_version(key)[0].lower()
+    return key
+
+
+def _open_text(path: Path) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    return path.open(encoding="utf-8")
+
+
+def _iter_json_records(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield metadata records from a JSON-lines or single-document JSON dump.
+
+    The arXiv metadata snapshot is JSON lines (despite its ``.json`` name);
+    Crossref dump files are one document with an ``items`` array.
+    """
+    with _open_text(path) as handle:
+        first = handle.readline()
+        try:
+            record = json.loads(first)
+        except ValueError:
+            record = None
+        if isinstance(record, dict) and "items" not in record:
+            yield record
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
+            return
+        document = json.loads(first + handle.read())
+
+    if isinstance(document, dict):
+        document = document.get("items") or document.get("message", {}).get("items", [])
+    for item in document:
+        if isinstance(item, dict):
+            yield item
+
+
+def _record_rows(record: dict[str, Any]) -> Iterator[IndexRow]:
+    arxiv_id = str(record.get("id") or "").strip()
+    if arxiv_id and ARXIV_PATTERN.match(arxiv_id):
+        versions = [
+            int(str(v.get("version", "")).lstrip("v"))
+            for v in record.get("versions") or []
+            if isinstance(v, dict) and str(v.get("version", "")).lstrip("v").isdigit()
+        ]
+        withdrawn = is_withdrawn(str(record.get("comments") or ""), str(record.get("abstract") or ""))
+        yield "arxiv", _index_key("arxiv", arxiv_id), max(versions) if versions else None, int(withdrawn)
+
+    doi = str(record.get("DOI") or record.get("doi") or "").strip()
+    if doi:
+        # arXiv records may list several journal DOIs separated by spaces.
+        for value in doi.split():
+            key = _index_key("doi", value)
+            if DOI_PATTERN.match(key):
+                yield "doi", key, None, 0
+
+
+def iter_dump_rows(path: str | Path) -> Iterator[IndexRow]:
+    """Index rows from a dump file, or from every ``*.json[l][.gz]`` under a directory."""
+    path = Path(path)
+    files = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+    for file in files:
+        if not any(suffix in (".json", ".jsonl") for suffix in file.suffixes):
+            continue
+        for record in _iter_json_records(file):
+            yield from _record_rows(record)
+
+
+def build_offline_index(
+    dumps: Iterable[str | Path], output: str | Path, *, batch_size: int = 50_000
+) -> dict[str, int]:
+    """Ingest Crossref / arXiv metadata dumps into an index at `output`.
+
+    The index is written to a temporary file and moved into place, so readers
+    never see a partial build. Returns the number of DOIs and arXiv IDs.
+    """
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    staging = output.with_name(f".{output.name}.{os.getpid()}.tmp")
+    staging.unlink(missing_ok=True)
+
+    conn = sqlite3.connect(staging, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute(
+            "CREATE TABLE identifiers (kind TEXT NOT NULL, identifier TEXT NOT NULL, "
+            "latest_version INTEGER, withdrawn INTEGER NOT NULL, PRIMARY KEY (kind, identifier)) WITHOUT ROWID"
+        )
+        insert = (
+            "INSERT INTO identifiers VALUES (?, ?, ?, ?) ON CONFLICT (kind, identifier) DO UPDATE SET "
+            "latest_version = max(coalesce(latest_version, 0), coalesce(excluded.latest_version, 0)), "
+            "withdrawn = max(withdrawn, excluded.withdrawn)"
+        )
+        conn.execute("BEGIN")
+        batch: list[IndexRow] = []
+        for dump in dumps:
+            for row in iter_dump_rows(dump):
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    conn.executemany(insert, batch)
+                    batch.clear()
+        conn.executemany(insert, batch)
+        conn.execute("UPDATE identifiers SET latest_version = NULL WHERE latest_version = 0")
+        conn.execute("COMMIT")
+        counts = dict(conn.execute("SELECT kind, COUNT(*) FROM identifiers GROUP BY kind").fetchall())
+        conn.execute("VACUUM")
+        conn.close()
+    except BaseException:
+        conn.close()
+        staging.unlink(missing_ok=True)
+        raise
+    os.replace(staging, output)
+    return {"doi": counts.get("doi", 0), "arxiv": counts.get("arxiv", 0)}
+
+
+class OfflineIndex:
+    """Read-only DOI / arXiv index for validating citations without network access.
+
+    The index is a SQLite B-tree (built by `build_offline_index`) opened
+    immutable and memory-mapped, so each lookup is an O(log n) probe that
+    takes a few microseconds. `resolve` mirrors `CitationResolver.resolve`.
+    Identifiers absent from the index fail with a "not in offline index"
+    reason, which `ResolutionCache` never stores.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        if not self.path.is_file():
+            raise FileNotFoundError(f"Offline citation index not found: {self.path}")
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._pid: int | None = None
+
+    @classmethod
+    def from_env(cls) -> OfflineIndex | None:
+        """Return the index named by ``$TARS_CITATION_INDEX`` if it is set, else None."""
+        configured = os.environ.get(OFFLINE_INDEX_ENV)
+        return cls(Path(configured).expanduser()) if configured else None
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"path": self.path}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(state["path"])
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None or self._pid != os.getpid():
+            uri = f"{self.path.resolve().as_uri()}?mode=ro&immutable=1"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            conn.execute("PRAGMA mmap_size=268435456")
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def _row(self, kind: str, identifier: str) -> tuple[int | None, int] | None:
+        with self._lock:
+            return self._connection().execute(
+                "SELECT latest_version, withdrawn FROM identifiers WHERE kind = ? AND identifier = ?",
+                (kind, _index_key(kind, identifier)),
+            ).fetchone()
+
+    def has_doi(self, doi: str) -> bool:
+        return self._row("doi", doi) is not None
+
+    def arxiv_record(self, arxiv_id: str) -> ArxivRecord | None:
+        """What the index knows about an eprint, or None if it is absent."""
+        row = self._row("arxiv", arxiv_id)
+        if row is None:
+            return None
+        return ArxivRecord(
+            arxiv_id=_index_key("arxiv", arxiv_id), exists=True, latest_version=row[0], withdrawn=bool(row[1])
+        )
+
+    def check_doi(self, doi: str) -> CheckResult:
+        if not DOI_PATTERN.match(normalize_identifier("doi", doi)):
+            return False, "Malformed DOI"
+        return (True, None) if self.has_doi(doi) else (False, DOI_MISSING_REASON)
+
+    def check_arxiv(self, arxiv_id: str) -> CheckResult:
+        value = normalize_identifier("arxiv", arxiv_id)
+        if not ARXIV_PATTERN.match(value):
+            return False, "Malformed arXiv ID"
+        record = self.arxiv_record(value)
+        return (False, ARXIV_MISSING_REASON) if record is None else record_check(value, record)
+
+    def resolve(
+        self, dois: Iterable[str], arxiv_ids: Iterable[str]
+    ) -> tuple[dict[str, CheckResult], dict[str, CheckResult]]:
+        """Return ``(doi_results, arxiv_results)`` keyed by identifier."""
+        return (
+            {doi: self.check_doi(doi) for doi in dict.fromkeys(dois)},
+            {arxiv_id: self.check_arxiv(arxiv_id) for arxiv_id in dict.fromkeys(arxiv_ids)},
+        )
+
+    def counts(self) -> dict[str, int]:
+        with self._lock:
+            rows = self._connection().execute("SELECT kind, COUNT(*) FROM identifiers GROUP BY kind").fetchall()
+        counts = dict(rows)
+        return {"doi": counts.get("doi", 0), "arxiv": counts.get("arxiv", 0)}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+            self._pid = None
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import os
+from pathlib import Path
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Callable
+import uuid
+
+from tars.validators.cache import cache_dir_from_env
+
+CheckResult = tuple[bool, str | None]
+
+# Only answers that will not change on retry are cached: success, and a
+# registry that says the identifier does not exist. Timeouts, 5xx responses
+# and deadline misses are always re-checked.
+_DEFINITIVE_NEGATIVE = re.compile(
+    r"HTTP error: (404|410)$|^Malformed |^arXiv (ID|version .*) not found|^arXiv paper withdrawn$"
+)
+_DOI_PREFIX = re.compile(r"^(?:https?://(?:dx\.)?doi\.org/|doi:)", re.IGNORECASE)
+_ARXIV_PREFIX = re.compile(r"^(?:https?://arxiv\.org/abs/|arxiv:)", re.IGNORECASE)
+
+
+def normalize_identifier(kind: str, identifier: str) -> str:
+    """Canonical cache key for a DOI (``kind="doi"``) or arXiv ID (``kind="arxiv"``).
+
+    DOIs are case-insensitive, so they are lowercased after dropping resolver
+    prefixes; arXiv IDs keep their case but lose ``arXiv:``/URL prefixes.
+    """
+    value = identifier.strip()
+    if kind == "doi":
+        return _DOI_PREFIX.sub("", value).lower()
+    if kind == "arxiv":
+        return _ARXIV_PREFIX.sub("", value)
+    raise ValueError(f"Unknown identifier kind '{kind}'")
+
+
+@dataclass
+class _Flight:
+    done: threading.Event = field(default_factory=threading.Event)
+    result: CheckResult | None = None
+
+
+class ResolutionCache:
+    """Persistent TTL cache for DOI / arXiv resolution outcomes.
+
+    Results live in a SQLite database in `cache_dir` keyed on the normalized
+    identifier. Positive results expire after `positive_ttl` seconds and
+    definitive negative ones (404/410, malformed, not found or withdrawn on
+    arXiv) after `negative_ttl`; transient failures are never stored.
+
+    Concurrent requests for the same identifier are coalesced: within a
+    process one thread resolves while the others wait for its answer, and
+    across processes a lease row in the database lets one worker resolve
+    while the others poll for the stored result (taking over if the lease
+    expires after `lease_seconds`).
+
+    `hits`, `misses` and `coalesced` count lookups made through this
+    instance; `coalesced` are lookups answered by another in-flight
+    resolution.
+    """
+
+    FILENAME = "citations.sqlite3"
+    POLL_INTERVAL = 0.05
+    PURGE_INTERVAL = 256
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        *,
+        positive_ttl: float = 30 * 24 * 3600.0,
+        negative_ttl: float = 24 * 3600.0,
+        lease_seconds: float = 30.0,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.path = self.cache_dir / self.FILENAME
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self.lease_seconds = lease_seconds
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._flights: dict[tuple[str, str], _Flight] = {}
+        self._conn: sqlite3.Connection | None = None
+        self._pid: int | None = None
+
+    @classmethod
+    def from_env(cls, **kwargs: Any) -> ResolutionCache | None:
+        """Return a cache in ``$TARS_CACHE_DIR`` if it is set, else None."""
+        cache_dir = cache_dir_from_env()
+        return None if cache_dir is None else cls(cache_dir, **kwargs)
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {
+            "cache_dir": self.cache_dir,
+            "positive_ttl": self.positive_ttl,
+            "negative_ttl": self.negative_ttl,
+            "lease_seconds": self.lease_seconds,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        cache_dir = state.pop("cache_dir")
+        self.__init__(cache_dir, **state)
+
+    def _connection(self) -> sqlite3.Connection:
+        # A connection inherited through fork must not be reused.
+        if self._conn is None or self._pid != os.getpid():
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS resolutions ("
+                "kind TEXT NOT NULL, identifier TEXT NOT NULL, ok INTEGER NOT NULL, reason TEXT, "
+                "expires_at REAL NOT NULL, PRIMARY KEY (kind, identifier))"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS leases ("
+                "kind TEXT NOT NULL, identifier TEXT NOT NULL, owner TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, PRIMARY KEY (kind, identifier))"
+            )
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _lookup(self, kind: str, key: str) -> CheckResult | None:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT ok, reason FROM resolutions WHERE kind = ? AND identifier = ? AND expires_at > ?",
+                (kind, key, time.time()),
+            ).fetchone()
+        return None if row is None else (bool(row[0]), row[1])
+
+    @staticmethod
+    def is_cacheable(result: CheckResult) -> bool:
+        ok, reason = result
+        return ok or bool(reason and _DEFINITIVE_NEGATIVE.search(reason))
+
+    def get(self, kind: str, identifier: str) -> CheckResult | None:
+        """Return an unexpired cached result, or None (counted as a hit or miss)."""
+        cached = self._lookup(kind, normalize_identifier(kind, identifier))
+        self._count("misses" if cached is None else "hits")
+        return cached
+
+    def put(self, kind: str, identifier: str, result: CheckResult) -> bool:
+        """Store `result` with the TTL for its polarity; returns False if it is not cacheable."""
+        if not self.is_cacheable(result):
+            return False
+        ok, reason = result
+        now = time.time()
+        expires_at = now + (self.positive_ttl if ok else self.negative_ttl)
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO resolutions (kind, identifier, ok, reason, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (kind, normalize_identifier(kind, identifier), int(ok), reason, expires_at),
+            )
+            self._writes += 1
+            if self._writes % self.PURGE_INTERVAL == 0:
+                conn.execute("DELETE FROM resolutions WHERE expires_at <= ?", (now,))
+        return True
+
+    def _try_lease(self, kind: str, key: str, owner: str) -> bool:
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT expires_at FROM leases WHERE kind = ? AND identifier = ?", (kind, key)
+                ).fetchone()
+                acquired = row is None or row[0] <= now
+                if acquired:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO leases (kind, identifier, owner, expires_at) VALUES (?, ?, ?, ?)",
+                        (kind, key, owner, now + self.lease_seconds),
+                    )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return acquired
+
+    def _release_lease(self, kind: str, key: str, owner: str) -> None:
+        with self._lock:
+            self._connection().execute(
+                "DELETE FROM leases WHERE kind = ? AND identifier = ? AND owner = ?", (kind, key, owner)
+            )
+
+    def get_or_resolve(self, kind: str, identifier: str, resolve: Callable[[], CheckResult]) -> CheckResult:
+        """Return the cached result for `identifier`, calling `resolve` at most once across waiters."""
+        key = normalize_identifier(kind, identifier)
+        cached = self._lookup(kind, key)
+        if cached is not None:
+            self._count("hits")
+            return cached
+
+        with self._lock:
+            flight = self._flights.get((kind, key))
+            leader = flight is None
+            if leader:
+                flight = self._flights[(kind, key)] = _Flight()
+        if not leader:
+            flight.done.wait()
+            if flight.result is not None:
+                self._count("coalesced")
+                return flight.result
+            return self.get_or_resolve(kind, identifier, resolve)
+
+        try:
+            flight.result = self._resolve_with_lease(kind, key, resolve)
+            return flight.result
+        finally:
+            with self._lock:
+                del self._flights[(kind, key)]
+            flight.done.set()
+
+    def _resolve_with_lease(self, kind: str, key: str, resolve: Callable[[], CheckResult]) -> CheckResult:
+        owner = f"{os.getpid()}:{uuid.uuid4().hex}"
+        while not self._try_lease(kind, key, owner):
+            # Another process is resolving this identifier; wait for its answer.
+            time.sleep(self.POLL_INTERVAL)
+            cached = self._lookup(kind, key)
+            if cached is not None:
+                self._count("coalesced")
+                return cached
+
+        try:
+            cached = self._lookup(kind, key)
+            if cached is not None:
+                self._count("coalesced")
+                return cached
+            self._count("misses")
+            result = resolve()
+            self.put(kind, key, result)
+            return result
+        finally:
+            self._release_lease(kind, key, owner)
+
+    def stats(self) -> dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "coalesced": self.coalesced, "path": str(self.path)}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+            self._pid = None
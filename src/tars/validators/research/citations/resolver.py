@@ -1,45 +1,293 @@
 from __future__ import annotations
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+import http.client
 import re
+import threading
+from typing import TYPE_CHECKING, Callable, Iterable
 from urllib.error import URLError, HTTPError
+from urllib.parse import urlsplit
 from urllib.request import Request, urlopen
 
+if TYPE_CHECKING:
+    from .arxiv_batch import ArxivBatchResolver
+    from .resolution_cache import ResolutionCache
+
 DOI_PATTERN = re.compile(r"^10\.\d{4,9}/[-._;()/:A-Za-z0-9]+$")
 ARXIV_PATTERN = re.compile(r"^(\d{4}\.\d{4,5}|[a-z\-]+(\.[A-Z]{2})?/\d{7})(v\d+)?$", re.IGNORECASE)
 
+DOI_BASE_URL = "https://doi.org/"
+ARXIV_ABS_URL = "https://arxiv.org/abs/"
+_HEADERS = {"User-Agent": "TARS-CitationValidator/1.0"}
 
-def doi_resolves(doi: str, timeout: float = 5.0) -> tuple[bool, str | None]:
-    if not DOI_PATTERN.match(doi.strip()):
-        return False, "Malformed DOI"
+CheckResult = tuple[bool, str | None]
+
+
+class ConnectionPool:
+    """Thread-safe pool of keep-alive HTTP(S) connections, one idle list per host.
+
+    At most `per_host_limit` requests are in flight to any one host; the
+    connections they use are returned to the pool for reuse unless the server
+    asked to close them. Redirects are not followed, so a 3xx status is
+    reported as-is.
+    """
+
+    def __init__(self, *, per_host_limit: int = 4) -> None:
+        self.per_host_limit = per_host_limit
+        self._lock = threading.Lock()
+        self._idle: dict[tuple[str, str, int | None], list[http.client.HTTPConnection]] = defaultdict(list)
+        self._limits: dict[tuple[str, str, int | None], threading.BoundedSemaphore] = {}
+
+    # Pickles by configuration (e.g. into worker processes); connections and
+    # locks are recreated empty on the other side.
+    def __getstate__(self) -> dict[str, int]:
+        return {"per_host_limit": self.per_host_limit}
+
+    def __setstate__(self, state: dict[str, int]) -> None:
+        self.__init__(per_host_limit=state["per_host_limit"])
+
+    def _limit(self, host_key: tuple[str, str, int | None]) -> threading.BoundedSemaphore:
+        with self._lock:
+            if host_key not in self._limits:
+                self._limits[host_key] = threading.BoundedSemaphore(self.per_host_limit)
+            return self._limits[host_key]
 
-    url = f"https://doi.org/{doi.strip()}"
-    req = Request(url, method="HEAD", headers={"User-Agent": "TARS-CitationValidator/1.0"})
+    def _acquire(self, host_key: tuple[str, str, int | None], timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle[host_key]
+            if idle:
+                conn = idle.pop()
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+        scheme, host, port = host_key
+        factory = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return factory(host, port, timeout=timeout), False
+
+    def _release(self, host_key: tuple[str, str, int | None], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            self._idle[host_key].append(conn)
+
+    def request(self, method: str, url: str, *, timeout: float = 5.0, headers: dict[str, str] | None = None) -> int:
+        """Send one request and return its status code.
+
+        A failure on a reused connection moves on to the next idle pooled
+        connection, and finally to a fresh one. Failures on a fresh connection
+        raise `OSError` or `http.client.HTTPException`.
+        """
+        return self.fetch(method, url, timeout=timeout, headers=headers)[0]
+
+    def fetch(
+        self, method: str, url: str, *, timeout: float = 5.0, headers: dict[str, str] | None = None
+    ) -> tuple[int, bytes]:
+        """Like `request`, but return ``(status, body)``."""
+        parts = urlsplit(url)
+        host_key = (parts.scheme, parts.hostname or "", parts.port)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+        with self._limit(host_key):
+            while True:
+                conn, reused = self._acquire(host_key, timeout)
+                try:
+                    conn.request(method, path, headers=headers or {})
+                    response = conn.getresponse()
+                    body = response.read()
+                except (OSError, http.client.HTTPException):
+                    conn.close()
+                    if reused:
+                        continue
+                    raise
+                if response.will_close:
+                    conn.close()
+                else:
+                    self._release(host_key, conn)
+                return response.status, body
+
+    def close(self) -> None:
+        with self._lock:
+            for connections in self._idle.values():
+                for conn in connections:
+                    conn.close()
+            self._idle.clear()
+
+
+def _head_status(url: str, timeout: float, pool: ConnectionPool | None) -> int:
+    if pool is not None:
+        return pool.request("HEAD", url, timeout=timeout, headers=_HEADERS)
+    req = Request(url, method="HEAD", headers=_HEADERS)
     try:
         with urlopen(req, timeout=timeout) as resp:  # nosec B310
-            code = getattr(resp, "status", 200)
-            if 200 <= code < 400:
-                return True, None
-            return False, f"DOI returned status {code}"
+            return getattr(resp, "status", 200)
     except HTTPError as exc:
-        return False, f"DOI HTTP error: {exc.code}"
+        return exc.code
+
+
+def doi_resolves(
+    doi: str, timeout: float = 5.0, *, pool: ConnectionPool | None = None, base_url: str = DOI_BASE_URL
+) -> tuple[bool, str | None]:
+    if not DOI_PATTERN.match(doi.strip()):
+        return False, "Malformed DOI"
+
+    try:
+        code = _head_status(f"{base_url}{doi.strip()}", timeout, pool)
     except URLError as exc:
         return False, f"DOI resolution failed: {exc.reason}"
+    except (OSError, http.client.HTTPException) as exc:
+        return False, f"DOI resolution failed: {exc}"
+    if 200 <= code < 400:
+        return True, None
+    if code >= 400:
+        return False, f"DOI HTTP error: {code}"
+    return False, f"DOI returned status {code}"
 
 
-def arxiv_exists(arxiv_id: str, timeout: float = 5.0) -> tuple[bool, str | None]:
+def arxiv_exists(
+    arxiv_id: str, timeout: float = 5.0, *, pool: ConnectionPool | None = None, base_url: str = ARXIV_ABS_URL
+) -> tuple[bool, str | None]:
     value = arxiv_id.strip()
     if not ARXIV_PATTERN.match(value):
         return False, "Malformed arXiv ID"
 
-    url = f"https://arxiv.org/abs/{value}"
-    req = Request(url, method="HEAD", headers={"User-Agent": "TARS-CitationValidator/1.0"})
     try:
-        with urlopen(req, timeout=timeout) as resp:  # nosec B310
-            code = getattr(resp, "status", 200)
-            if 200 <= code < 400:
-                return True, None
-            return False, f"arXiv returned status {code}"
-    except HTTPError as exc:
-        return False, f"arXiv HTTP error: {exc.code}"
+        code = _head_status(f"{base_url}{value}", timeout, pool)
     except URLError as exc:
         return False, f"arXiv lookup failed: {exc.reason}"
+    except (OSError, http.client.HTTPException) as exc:
+        return False, f"arXiv lookup failed: {exc}"
+    if 200 <= code < 400:
+        return True, None
+    if code >= 400:
+        return False, f"arXiv HTTP error: {code}"
+    return False, f"arXiv returned status {code}"
+
+
+class CitationResolver:
+    """Check many DOIs and arXiv IDs concurrently.
+
+    Lookups run on a thread pool of `max_workers` threads and share one
+    `ConnectionPool`, so requests to the same host reuse keep-alive
+    connections and never exceed `per_host_limit` at once. Every identifier
+    is checked at most once per call. Lookups still pending when `deadline`
+    seconds have passed are reported as failed with reason
+    "Resolution deadline exceeded".
+
+    With a `ResolutionCache`, cached answers are served without network
+    access and fresh definitive answers are stored for later runs. With an
+    `ArxivBatchResolver`, arXiv IDs are checked in a few ``id_list`` queries
+    instead of one request each.
+    """
+
+    DEADLINE_REASON = "Resolution deadline exceeded"
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = 16,
+        per_host_limit: int = 4,
+        timeout: float = 5.0,
+        deadline: float | None = 60.0,
+        doi_base_url: str = DOI_BASE_URL,
+        arxiv_base_url: str = ARXIV_ABS_URL,
+        cache: ResolutionCache | None = None,
+        arxiv_batch: ArxivBatchResolver | None = None,
+    ) -> None:
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.deadline = deadline
+        self.doi_base_url = doi_base_url
+        self.arxiv_base_url = arxiv_base_url
+        self.pool = ConnectionPool(per_host_limit=per_host_limit)
+        self.cache = cache
+        self.arxiv_batch = arxiv_batch
+
+    def _check(self, kind: str, check: Callable[..., CheckResult], identifier: str, base_url: str) -> CheckResult:
+        def run() -> CheckResult:
+            return check(identifier, timeout=self.timeout, pool=self.pool, base_url=base_url)
+
+        if self.cache is None:
+            return run()
+        return self.cache.get_or_resolve(kind, identifier, run)
+
+    def _check_arxiv_batch(self, arxiv_ids: list[str]) -> dict[str, CheckResult]:
+        assert self.arxiv_batch is not None
+        results: dict[str, CheckResult] = {}
+        pending = []
+        for arxiv_id in arxiv_ids:
+            cached = None if self.cache is None else self.cache.get("arxiv", arxiv_id)
+            if cached is None:
+                pending.append(arxiv_id)
+            else:
+                results[arxiv_id] = cached
+        if pending:
+            fresh = self.arxiv_batch.check(pending)
+            if self.cache is not None:
+                for arxiv_id, result in fresh.items():
+                    self.cache.put("arxiv", arxiv_id, result)
+            results.update(fresh)
+        return results
+
+    def resolve(
+        self,
+        dois: Iterable[str],
+        arxiv_ids: Iterable[str],
+        *,
+        doi_check: Callable[..., CheckResult] = doi_resolves,
+        arxiv_check: Callable[..., CheckResult] = arxiv_exists,
+    ) -> tuple[dict[str, CheckResult], dict[str, CheckResult]]:
+        """Return ``(doi_results, arxiv_results)`` keyed by identifier."""
+        unique_dois = list(dict.fromkeys(dois))
+        unique_arxiv = list(dict.fromkeys(arxiv_ids))
+        doi_results: dict[str, CheckResult] = {}
+        arxiv_results: dict[str, CheckResult] = {}
+        if not unique_dois and not unique_arxiv:
+            return doi_results, arxiv_results
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="citation-resolver")
+        try:
+            futures = {
+                executor.submit(self._check, "doi", doi_check, doi, self.doi_base_url): (doi_results, doi)
+                for doi in unique_dois
+            }
+            batch = None
+            if self.arxiv_batch is not None and unique_arxiv:
+                batch = executor.submit(self._check_arxiv_batch, unique_arxiv)
+            else:
+                futures.update(
+                    {
+                        executor.submit(self._check, "arxiv", arxiv_check, arxiv_id, self.arxiv_base_url): (
+                            arxiv_results,
+                            arxiv_id,
+                        )
+                        for arxiv_id in unique_arxiv
+                    }
+                )
+            pending = list(futures) if batch is None else [*futures, batch]
+            done, _ = wait(pending, timeout=self.deadline)
+        finally:
+            # Do not wait for stragglers; they are bounded by the socket timeout.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        for future, (results, identifier) in futures.items():
+            if future in done:
+                try:
+                    results[identifier] = future.result()
+                except Exception as exc:
+                    results[identifier] = (False, f"Resolution failed: {exc}")
+            else:
+                results[identifier] = (False, self.DEADLINE_REASON)
+        if batch is not None:
+            if batch in done and batch.exception() is None:
+                arxiv_results.update(batch.result())
+            else:
+                reason = self.DEADLINE_REASON if batch not in done else f"Resolution failed: {batch.exception()}"
+                arxiv_results.update(dict.fromkeys(unique_arxiv, (False, reason)))
+        return doi_results, arxiv_results
+
+    def close(self) -> None:
+        self.pool.close()
+        if self.arxiv_batch is not None:
+            self.arxiv_batch.close()
+        if self.cache is not None:
+            self.cache.close()
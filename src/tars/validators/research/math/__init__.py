@@ -1,10 +1,29 @@
 """Math validator module namespace for research artifact validation."""
 
-from .math_converter import MathConverter, convert_equation, convert_latex_to_sympy, normalize_latex_for_sympy
-from .math_extractor import MathExtractor
-from .math_validator import MathValidator
-from .numeric_validator import NumericValidator
-from .symbolic_validator import SymbolicValidator
+from typing import TYPE_CHECKING
+
+from tars._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .math_converter import MathConverter, convert_equation, convert_latex_to_sympy, normalize_latex_for_sympy
+    from .math_extractor import MathExtractor
+    from .math_validator import MathValidator
+    from .numeric_validator import NumericValidator
+    from .symbolic_validator import SymbolicValidator
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "MathConverter": ".math_converter",
+        "convert_equation": ".math_converter",
+        "convert_latex_to_sympy": ".math_converter",
+        "normalize_latex_for_sympy": ".math_converter",
+        "MathExtractor": ".math_extractor",
+        "MathValidator": ".math_validator",
+        "NumericValidator": ".numeric_validator",
+        "SymbolicValidator": ".symbolic_validator",
+    },
+)
 
 __all__ = [
     "MathExtractor",
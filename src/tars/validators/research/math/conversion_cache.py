@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from tars.validators.cache import cache_dir_from_env
+
+from .math_converter import (
+    ConversionError,
+    EquationConversionResult,
+    convert_latex_to_sympy,
+    expression_from_srepr,
+    expression_to_srepr,
+    normalize_latex_for_sympy,
+)
+
+# Bump when normalization or conversion semantics change so stale entries are
+# never served; the latex2sympy2 and SymPy versions are folded in as well.
+CACHE_FORMAT_VERSION = "1"
+
+
+def converter_version() -> str:
+    """Identify the converter stack whose output the cache stores."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    parts = [f"format={CACHE_FORMAT_VERSION}"]
+    for package in ("latex2sympy2", "sympy"):
+        try:
+            parts.append(f"{package}={version(package)}")
+        except PackageNotFoundError:
+            parts.append(f"{package}=missing")
+    return ";".join(parts)
+
+
+class ConversionCache:
+    """Persistent, content-addressed LaTeX→SymPy conversion cache.
+
+    Entries are keyed on a hash of the normalized LaTeX and `converter_version`
+    and store either the expression's `srepr` or the `ConversionError` the
+    conversion produced. The store is a SQLite database in `cache_dir`, so one
+    cache can be shared by the CLI, the UI and pool workers; instances pickle
+    by path and reconnect lazily in each process.
+
+    The least recently used entries are evicted once the table grows past
+    `max_entries` (checked every `EVICTION_INTERVAL` writes and on `close`).
+    `hits` and `misses` count lookups made through this instance.
+    """
+
+    FILENAME = "conversions.sqlite3"
+    EVICTION_INTERVAL = 256
+
+    def __init__(self, cache_dir: str | Path, *, max_entries: int = 100_000, version: str | None = None) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.path = self.cache_dir / self.FILENAME
+        self.max_entries = max_entries
+        self.version = version or converter_version()
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._pid: int | None = None
+
+    @classmethod
+    def from_env(cls, **kwargs: Any) -> ConversionCache | None:
+        """Return a cache in ``$TARS_CACHE_DIR`` if it is set, else None."""
+        cache_dir = cache_dir_from_env()
+        return None if cache_dir is None else cls(cache_dir, **kwargs)
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"cache_dir": self.cache_dir, "max_entries": self.max_entries, "version": self.version}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(state["cache_dir"], max_entries=state["max_entries"], version=state["version"])
+
+    def _connection(self) -> sqlite3.Connection:
+        # A connection inherited through fork must not be reused.
+        if self._conn is None or self._pid != os.getpid():
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS conversions ("
+                "key TEXT PRIMARY KEY, kind TEXT NOT NULL, payload TEXT NOT NULL, "
+                "error_type TEXT, last_used REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS conversions_last_used ON conversions (last_used)")
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def key(self, latex: str) -> str:
+        normalized = normalize_latex_for_sympy(latex)
+        return hashlib.sha256(f"{self.version}\0{normalized}".encode("utf-8")).hexdigest()
+
+    def get(self, latex: str) -> Any | None:
+        """Return the cached conversion of `latex`, or None on a miss."""
+        key = self.key(latex)
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute("SELECT kind, payload, error_type FROM conversions WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                conn.execute("UPDATE conversions SET last_used = ? WHERE key = ?", (time.time(), key))
+
+        value = None
+        if row is not None:
+            kind, payload, error_type = row
+            if kind == "error":
+                value = ConversionError(latex=latex, error_type=error_type, message=payload)
+            else:
+                value = expression_from_srepr(payload)
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def put(self, latex: str, value: Any) -> None:
+        """Store a conversion result; expressions that do not round-trip are skipped."""
+        if isinstance(value, ConversionError):
+            row = ("error", value.message, value.error_type)
+        else:
+            try:
+                payload = expression_to_srepr(value)
+            except Exception:
+                return
+            if expression_from_srepr(payload) is None:
+                return
+            row = ("srepr", payload, None)
+
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO conversions (key, kind, payload, error_type, last_used) VALUES (?, ?, ?, ?, ?)",
+                (self.key(latex), *row, time.time()),
+            )
+            self._writes += 1
+            if self._writes % self.EVICTION_INTERVAL == 0:
+                self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        (count,) = conn.execute("SELECT COUNT(*) FROM conversions").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM conversions WHERE key IN "
+                "(SELECT key FROM conversions ORDER BY last_used ASC LIMIT ?)",
+                (excess,),
+            )
+
+    def convert(self, latex: str, converter: Callable[[str], Any] = convert_latex_to_sympy) -> Any:
+        """Return the conversion of `latex`, running `converter` only on a miss."""
+        value = self.get(latex)
+        if value is None:
+            value = converter(latex)
+            self.put(latex, value)
+        return value
+
+    def convert_equation(
+        self, lhs_latex: str, rhs_latex: str, converter: Callable[[str], Any] = convert_latex_to_sympy
+    ) -> EquationConversionResult:
+        """Cached counterpart of `convert_equation`."""
+        lhs = self.convert(lhs_latex, converter)
+        if isinstance(lhs, ConversionError):
+            return EquationConversionResult(error=lhs)
+        rhs = self.convert(rhs_latex, converter)
+        if isinstance(rhs, ConversionError):
+            return EquationConversionResult(error=rhs)
+        return EquationConversionResult(lhs_sympy=lhs, rhs_sympy=rhs)
+
+    def entry_count(self) -> int:
+        with self._lock:
+            (count,) = self._connection().execute("SELECT COUNT(*) FROM conversions").fetchone()
+        return int(count)
+
+    def stats(self) -> dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "entries": self.entry_count(), "path": str(self.path)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection().execute("DELETE FROM conversions")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._evict(self._conn)
+                self._conn.close()
+            self._conn = None
+            self._pid = None
@@ -5,6 +5,7 @@ from pathlib import Path
 import re
 
 from tars.validators.base import BaseValidator
+from tars.validators.context import ArtifactContext
 from tars.validators.result import ValidationResult
 
 from .math_extractor import MathExtractor
@@ -69,7 +70,11 @@ class LeanExportValidator(BaseValidator):
         self.extractor = MathExtractor()
 
     def validate(self, artifact_path: Path) -> ValidationResult:
-        extraction = self.extractor.validate(artifact_path)
+        return self.validate_context(ArtifactContext(artifact_path))
+
+    def validate_context(self, context: ArtifactContext) -> ValidationResult:
+        artifact_path = context.path
+        extraction = self.extractor.validate_context(context)
         if not extraction.passed:
             return ValidationResult(
                 name=self.name,
@@ -82,7 +87,7 @@ class LeanExportValidator(BaseValidator):
 
         equations = extraction.metadata.get("equations", [])
         lean_content = export_equations_to_lean(equations)
-        output_path = Path(artifact_path).with_suffix(".lean")
+        output_path = artifact_path.with_suffix(".lean")
         output_path.write_text(lean_content)
 
         exported: list[dict] = []
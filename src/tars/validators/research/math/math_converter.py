@@ -4,13 +4,16 @@ from dataclasses import asdict, dataclass
 import logging
 from pathlib import Path
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from tars.validators.base import BaseValidator
+from tars.validators.context import ArtifactContext
 from tars.validators.result import ValidationResult
 
 from .math_extractor import MathExtractor
 
+if TYPE_CHECKING:
+    from .conversion_cache import ConversionCache
 
 logger = logging.getLogger(__name__)
 
@@ -193,6 +196,33 @@ def convert_equation(lhs_latex: str, rhs_latex: str) -> EquationConversionResult
     return EquationConversionResult(lhs_sympy=lhs, rhs_sympy=rhs)
 
 
+def expression_to_srepr(expr: Any) -> str:
+    """Serialize a SymPy expression with `srepr` for another process."""
+    import sympy as sp  # type: ignore
+
+    return sp.srepr(expr)
+
+
+def expression_from_srepr(text: str) -> Any | None:
+    """Rebuild a SymPy expression from `srepr` output.
+
+    latex2sympy2 builds some expressions unevaluated, so decoding is tried with
+    and without evaluation. Returns None unless the round trip is structurally
+    exact, letting callers fall back to converting the LaTeX again.
+    """
+    import sympy as sp  # type: ignore
+
+    for evaluate in (False, True):
+        try:
+            with sp.evaluate(evaluate):
+                expr = sp.sympify(text)
+        except Exception:
+            continue
+        if sp.srepr(expr) == text:
+            return expr
+    return None
+
+
 def convert_latex_to_sympy_result(latex_str: str) -> ConversionResult:
     """Always-return structured conversion result wrapper."""
     converted = convert_latex_to_sympy(latex_str)
@@ -206,17 +236,23 @@ class MathConverter(BaseValidator):
 
     This validator uses `MathExtractor` to collect equations and then attempts
     conversion for each equation side (`lhs`, `rhs`) with `latex2sympy2`.
+    Pass a `ConversionCache` to reuse conversions across runs.
     """
 
     name = "math_converter"
     artifact_type = "research-paper"
 
-    def __init__(self) -> None:
+    def __init__(self, *, cache: ConversionCache | None = None) -> None:
         self.extractor = MathExtractor()
+        self.cache = cache
 
     def validate(self, artifact_path: Path) -> ValidationResult:
         """Run extraction + conversion and return structured outcomes."""
-        extraction = self.extractor.validate(artifact_path)
+        return self.validate_context(ArtifactContext(artifact_path))
+
+    def validate_context(self, context: ArtifactContext) -> ValidationResult:
+        artifact_path = context.path
+        extraction = self.extractor.validate_context(context)
         if not extraction.passed:
             return ValidationResult(
                 name=self.name,
@@ -231,7 +267,10 @@ class MathConverter(BaseValidator):
         errors: list[str] = []
         failed = 0
         for equation in extraction.metadata.get("equations", []):
-            eq_result = convert_equation(equation["lhs"], equation["rhs"])
+            if self.cache is None:
+                eq_result = convert_equation(equation["lhs"], equation["rhs"])
+            else:
+                eq_result = self.cache.convert_equation(equation["lhs"], equation["rhs"])
 
             insight = None
             if eq_result.error:
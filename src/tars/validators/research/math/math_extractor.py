@@ -5,7 +5,11 @@ from dataclasses import asdict, dataclass
 from pathlib import Path
 
 from tars.validators.base import BaseValidator
+from tars.validators.context import ArtifactContext
 from tars.validators.result import ValidationResult
+from tars.validators.source_index import SourceIndex, format_source_location
+
+from .math_tokenizer import iter_math_spans
 
 
 @dataclass
@@ -15,6 +19,8 @@ class ExtractedMathExpression:
     raw_latex: str
     line_number: int
     environment_type: str
+    column_number: int = 1
+    source_file: str | None = None
 
 
 @dataclass
@@ -37,85 +43,16 @@ class MathExtractor(BaseValidator):
     - inline: `$...$`
 
     Extraction is robust to multiline display/equation/align blocks and records
-    source line numbers for each match.
+    source line and column numbers for each match. The document is scanned once by
+    `iter_math_spans`, so cost grows linearly with file size.
     """
 
     name = "math_extractor"
     artifact_type = "research-paper"
 
-    _BLOCK_PATTERNS = [
-        ("display_brackets", re.compile(r"\\\[(.*?)\\\]", re.DOTALL)),
-        (
-            "equation",
-            re.compile(r"\\begin\{equation\}(.*?)\\end\{equation\}", re.DOTALL),
-        ),
-        ("align", re.compile(r"\\begin\{align\}(.*?)\\end\{align\}", re.DOTALL)),
-    ]
-
-    @staticmethod
-    def _line_number(text: str, index: int) -> int:
-        return text.count("\n", 0, index) + 1
-
-    def _extract_blocks(self, text: str) -> tuple[list[ExtractedMathExpression], list[tuple[int, int]]]:
-        expressions: list[ExtractedMathExpression] = []
-        consumed_spans: list[tuple[int, int]] = []
-
-        for env_type, pattern in self._BLOCK_PATTERNS:
-            for match in pattern.finditer(text):
-                raw = match.group(0)
-                start, end = match.span()
-                expressions.append(
-                    ExtractedMathExpression(
-                        raw_latex=raw,
-                        line_number=self._line_number(text, start),
-                        environment_type=env_type,
-                    )
-                )
-                consumed_spans.append((start, end))
-        return expressions, consumed_spans
-
-    @staticmethod
-    def _inside_spans(pos: int, spans: list[tuple[int, int]]) -> bool:
-        return any(start <= pos < end for start, end in spans)
-
-    def _extract_inline(self, text: str, consumed_spans: list[tuple[int, int]]) -> list[ExtractedMathExpression]:
-        expressions: list[ExtractedMathExpression] = []
-        i = 0
-        n = len(text)
-
-        while i < n:
-            if text[i] != "$" or self._inside_spans(i, consumed_spans):
-                i += 1
-                continue
-
-            if i > 0 and text[i - 1] == "\\":
-                i += 1
-                continue
-
-            if i + 1 < n and text[i + 1] == "$":
-                i += 2
-                continue
-
-            start = i
-            i += 1
-            while i < n:
-                if self._inside_spans(i, consumed_spans):
-                    i += 1
-                    continue
-                if text[i] == "$" and not (i > 0 and text[i - 1] == "\\"):
-                    raw = text[start : i + 1]
-                    expressions.append(
-                        ExtractedMathExpression(
-                            raw_latex=raw,
-                            line_number=self._line_number(text, start),
-                            environment_type="inline",
-                        )
-                    )
-                    i += 1
-                    break
-                i += 1
-
-        return expressions
+    # Historical ordering for expressions that share a source line: block
+    # environments first (in this order), then inline math.
+    _ENVIRONMENT_ORDER = {"display_brackets": 0, "equation": 1, "align": 2, "inline": 3}
 
     @staticmethod
     def _strip_delimiters(raw_latex: str, environment_type: str) -> str:
@@ -136,7 +73,12 @@ class MathExtractor(BaseValidator):
             return text.strip()
         return text
 
-    def _normalize_equations(self, expressions: list[ExtractedMathExpression]) -> list[Equation]:
+    @staticmethod
+    def _source_location(expr: ExtractedMathExpression) -> str:
+        location = format_source_location(expr.line_number, expr.column_number, expr.environment_type)
+        return location if expr.source_file is None else f"{expr.source_file}:{location}"
+
+    def normalize_equations(self, expressions: list[ExtractedMathExpression]) -> list[Equation]:
         equations: list[Equation] = []
         for expr in expressions:
             body = self._strip_delimiters(expr.raw_latex, expr.environment_type)
@@ -155,25 +97,44 @@ class MathExtractor(BaseValidator):
                         raw=part.strip(),
                         lhs=lhs.strip(),
                         rhs=rhs.strip(),
-                        source_location=f"line:{expr.line_number}:{expr.environment_type}",
+                        source_location=self._source_location(expr),
                     )
                 )
         return equations
 
-    def extract(self, artifact_path: Path) -> list[ExtractedMathExpression]:
-        text = artifact_path.read_text()
-        block_expressions, consumed_spans = self._extract_blocks(text)
-        inline_expressions = self._extract_inline(text, consumed_spans)
-        expressions = block_expressions + inline_expressions
-        expressions.sort(key=lambda item: item.line_number)
+    def extract_text(self, text: str, index: SourceIndex | None = None) -> list[ExtractedMathExpression]:
+        """Extract math expressions from LaTeX source text.
+
+        Pass a prebuilt `index` for `text` to reuse it across extractors.
+        """
+        index = index or SourceIndex(text)
+        expressions: list[ExtractedMathExpression] = []
+        for span in iter_math_spans(text):
+            line, column = index.position(span.start)
+            expressions.append(
+                ExtractedMathExpression(
+                    raw_latex=text[span.start : span.end],
+                    line_number=line,
+                    environment_type=span.environment_type,
+                    column_number=column,
+                )
+            )
+        expressions.sort(key=lambda item: (item.line_number, self._ENVIRONMENT_ORDER[item.environment_type]))
         return expressions
 
+    def extract(self, artifact_path: Path) -> list[ExtractedMathExpression]:
+        """Extract math from a paper and every file it ``\\input``s, in document order."""
+        return ArtifactContext(artifact_path).math_expressions
+
     def validate(self, artifact_path: Path) -> ValidationResult:
         """Extract math expressions and normalized equations from a .tex artifact."""
-        path = Path(artifact_path)
+        return self.validate_context(ArtifactContext(artifact_path))
+
+    def validate_context(self, context: ArtifactContext) -> ValidationResult:
+        path = context.path
         errors: list[str] = []
 
-        if not path.exists():
+        if not context.exists:
             return ValidationResult(
                 name=self.name,
                 passed=False,
@@ -184,8 +145,8 @@ class MathExtractor(BaseValidator):
         if path.suffix.lower() != ".tex":
             errors.append("Expected a .tex file")
 
-        expressions = self.extract(path)
-        equations = self._normalize_equations(expressions)
+        expressions = context.math_expressions
+        equations = context.equations
 
         return ValidationResult(
             name=self.name,
@@ -197,5 +158,6 @@ class MathExtractor(BaseValidator):
                 "expressions": [asdict(expr) for expr in expressions],
                 "equation_count": len(equations),
                 "equations": [asdict(eq) for eq in equations],
+                "missing_includes": list(context.project.missing),
             },
         )
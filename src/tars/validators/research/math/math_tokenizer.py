@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Iterator
+
+
+@dataclass
+class MathSpan:
+    """Character span of one math region found by `iter_math_spans`."""
+
+    environment_type: str
+    start: int
+    end: int
+
+
+_OPENER_PATTERN = re.compile(r"\\\[|\\begin\{(equation|align)\}|\$")
+_BLOCK_CLOSERS = {
+    "display_brackets": "\\]",
+    "equation": "\\end{equation}",
+    "align": "\\end{align}",
+}
+
+
+def iter_math_spans(text: str) -> Iterator[MathSpan]:
+    """Yield math spans from LaTeX source in a single left-to-right pass.
+
+    The scanner jumps between candidate delimiters (`\\[`, `\\begin{equation}`,
+    `\\begin{align}`, `$`) instead of inspecting every character, so the cost
+    is linear in the length of the document. Offsets can be turned into line
+    and column numbers with `SourceIndex`.
+
+    Semantics follow the historical regex/scan extractor:
+    - block environments take precedence over inline math; a `$` inside a block
+      is ignored, and a block opened inside pending inline math is still
+      reported (the inline span then covers it);
+    - a block opener without a matching closer is treated as plain text;
+    - `\\$` is never a delimiter and `$$` outside inline math is skipped;
+    - an unterminated `$` produces no inline span.
+
+    Spans are yielded in the order they close. That is the order of their start
+    offset, except that a block inside pending inline math is yielded before
+    the inline span that encloses it.
+    """
+    unclosed: set[str] = set()
+    inline_start: int | None = None
+    pos = 0
+
+    while True:
+        match = _OPENER_PATTERN.search(text, pos)
+        if match is None:
+            return
+        start = match.start()
+
+        if match.group(0) == "$":
+            if start > 0 and text[start - 1] == "\\":
+                pos = start + 1
+            elif inline_start is not None:
+                yield MathSpan("inline", inline_start, start + 1)
+                inline_start = None
+                pos = start + 1
+            elif text.startswith("$", start + 1):
+                pos = start + 2
+            else:
+                inline_start = start
+                pos = start + 1
+            continue
+
+        env_type = match.group(1) or "display_brackets"
+        closer = _BLOCK_CLOSERS[env_type]
+        close = -1 if env_type in unclosed else text.find(closer, match.end())
+        if close == -1:
+            # No closer anywhere after this point, so later openers of the same
+            # type cannot close either; remember that to stay linear.
+            unclosed.add(env_type)
+            pos = start + 1
+            continue
+
+        end = close + len(closer)
+        yield MathSpan(env_type, start, end)
+        pos = end
@@ -1,23 +1,58 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
 import logging
 import re
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable, Iterator
 
 from tars.validators.base import BaseValidator
+from tars.validators.context import ArtifactContext
 from tars.validators.result import ValidationResult
 
-from .math_converter import convert_equation, convert_latex_to_sympy
+from .math_converter import (
+    ConversionError,
+    EquationConversionResult,
+    convert_equation,
+    convert_latex_to_sympy,
+    expression_from_srepr,
+    expression_to_srepr,
+)
 from .math_extractor import MathExtractor
 from .numeric_validator import NumericValidator
 from .symbolic_validator import SymbolicValidator
 
+if TYPE_CHECKING:
+    from .conversion_cache import ConversionCache
+    from .result_store import EquationResultStore
+
 logger = logging.getLogger(__name__)
 
 
 class MathValidator(BaseValidator):
-    """Coordinate extraction/conversion/symbolic/numeric validation for math equations."""
+    """Coordinate extraction/conversion/symbolic/numeric validation for math equations.
+
+    With `workers > 1`, equations are checked in a process pool (SymPy work is
+    GIL-bound). LaTeX is still converted once in this process, so conversion
+    caches behave as in a serial run; converted expressions are shipped to
+    workers as `srepr` strings and results are merged back in source order.
+
+    `symbolic_timeout` and `max_expression_size` set a per-equation budget for
+    the symbolic check. Equations that exhaust it are marked `timed_out` and
+    decided by the numeric validator instead.
+
+    `cache` is an optional persistent `ConversionCache` consulted whenever the
+    per-run caches miss, so conversions are reused across runs and papers.
+
+    `results` is an optional `EquationResultStore` that makes runs
+    incremental: equations whose content was validated before are not
+    re-checked, their stored outcome is carried forward with ``cached: True``
+    (and the current source location), and only new or edited equations run.
+
+    `on_equation`, if set, is called with each per-equation result as soon as
+    it is available (carried-forward results first), e.g. to stream progress.
+    """
 
     name = "math_validator"
     artifact_type = "research-paper"
@@ -25,10 +60,26 @@ class MathValidator(BaseValidator):
     _DERIVATIVE_PATTERN = re.compile(r"\\frac\s*\{d\}\s*\{d\s*([A-Za-z])\}\s*(.+)$", re.DOTALL)
     _INTEGRAL_PATTERN = re.compile(r"\\int\s+(.+?)\s*(?:\\,\s*)?d\s*([A-Za-z])\s*$", re.DOTALL)
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        workers: int = 1,
+        symbolic_timeout: float | None = None,
+        max_expression_size: int | None = None,
+        cache: ConversionCache | None = None,
+        results: EquationResultStore | None = None,
+        on_equation: Callable[[dict[str, Any]], None] | None = None,
+    ) -> None:
         self.extractor = MathExtractor()
-        self.symbolic_validator = SymbolicValidator()
+        self.symbolic_validator = SymbolicValidator(
+            timeout=symbolic_timeout,
+            max_expression_size=max_expression_size,
+        )
         self.numeric_validator = NumericValidator()
+        self.workers = workers
+        self.cache = cache
+        self.results = results
+        self.on_equation = on_equation
         self._latex_cache: dict[str, Any] = {}
         self._equation_cache: dict[tuple[str, str], Any] = {}
 
@@ -47,19 +98,139 @@ class MathValidator(BaseValidator):
         error_text = " ".join(symbolic_result.errors).lower()
         return "symbolic validation failed" in error_text or "sympy is not available" in error_text
 
+    @staticmethod
+    def _symbolic_timed_out(symbolic_result: ValidationResult) -> bool:
+        return symbolic_result.status == "TIMEOUT"
+
+    def _numeric_fallback(self, eq_result: dict[str, Any], lhs_sympy: Any, rhs_sympy: Any) -> None:
+        eq_result["decision_path"].append("numeric_attempt")
+        numeric = self.numeric_validator.validate_equivalence(lhs_sympy, rhs_sympy)
+        eq_result["numeric"] = numeric.to_dict()
+
+        if numeric.passed:
+            eq_result["decision_path"].append("numeric_pass")
+            eq_result["status"] = "PASS"
+            eq_result["passed"] = True
+            return
+
+        eq_result["decision_path"].append("numeric_fail")
+        eq_result["status"] = "FAIL"
+        eq_result["errors"].extend(numeric.errors)
+
 
     def _convert_latex_cached(self, latex: str) -> Any:
         key = latex.strip()
         if key not in self._latex_cache:
-            self._latex_cache[key] = convert_latex_to_sympy(key)
+            if self.cache is None:
+                self._latex_cache[key] = convert_latex_to_sympy(key)
+            else:
+                self._latex_cache[key] = self.cache.convert(key, convert_latex_to_sympy)
         return self._latex_cache[key]
 
     def _convert_equation_cached(self, lhs_latex: str, rhs_latex: str) -> Any:
         key = (lhs_latex.strip(), rhs_latex.strip())
         if key not in self._equation_cache:
-            self._equation_cache[key] = convert_equation(key[0], key[1])
+            if self.cache is None:
+                self._equation_cache[key] = convert_equation(key[0], key[1])
+            else:
+                self._equation_cache[key] = self.cache.convert_equation(key[0], key[1], convert_latex_to_sympy)
         return self._equation_cache[key]
 
+    @staticmethod
+    def _encode_conversion(value: Any) -> dict[str, Any] | None:
+        if hasattr(value, "error_type"):
+            return {"error": asdict(value)}
+        try:
+            return {"srepr": expression_to_srepr(value)}
+        except Exception:
+            return None
+
+    @staticmethod
+    def _decode_conversion(encoded: dict[str, Any]) -> Any | None:
+        if "error" in encoded:
+            return ConversionError(**encoded["error"])
+        return expression_from_srepr(encoded["srepr"])
+
+    def _prefetch_conversions(self, equation: dict[str, Any]) -> dict[str, Any]:
+        """Convert the LaTeX one equation needs and encode it for a worker.
+
+        Mirrors the conversion order of `_validate_one_equation` so the caches
+        of this validator end up exactly as after a serial run.
+        """
+        latex: dict[str, dict[str, Any]] = {}
+        equations: dict[tuple[str, str], dict[str, Any]] = {}
+
+        lhs_latex = equation["lhs"].strip()
+        sub_latex = None
+        match = self._DERIVATIVE_PATTERN.match(lhs_latex)
+        if match:
+            sub_latex = match.group(2).strip()
+        else:
+            match = self._INTEGRAL_PATTERN.match(lhs_latex)
+            if match:
+                sub_latex = match.group(1).strip()
+
+        if sub_latex is not None:
+            for key in (sub_latex, equation["rhs"].strip()):
+                value = self._convert_latex_cached(key)
+                encoded = self._encode_conversion(value)
+                if encoded is not None:
+                    latex[key] = encoded
+                if hasattr(value, "error_type"):
+                    break
+            return {"latex": latex, "equations": equations}
+
+        key = (equation["lhs"].strip(), equation["rhs"].strip())
+        conversion = self._convert_equation_cached(*key)
+        if conversion.error is not None:
+            equations[key] = {"error": asdict(conversion.error)}
+        else:
+            lhs = self._encode_conversion(conversion.lhs_sympy)
+            rhs = self._encode_conversion(conversion.rhs_sympy)
+            if lhs is not None and rhs is not None:
+                equations[key] = {"lhs": lhs, "rhs": rhs}
+        return {"latex": latex, "equations": equations}
+
+    def _seed_conversions(self, conversions: dict[str, Any]) -> None:
+        """Populate caches from `_prefetch_conversions` output.
+
+        Entries that do not round-trip are left out and converted locally.
+        """
+        for key, encoded in conversions["latex"].items():
+            value = self._decode_conversion(encoded)
+            if value is not None:
+                self._latex_cache[key] = value
+
+        for key, encoded in conversions["equations"].items():
+            if "error" in encoded:
+                self._equation_cache[key] = EquationConversionResult(error=ConversionError(**encoded["error"]))
+                continue
+            lhs = self._decode_conversion(encoded["lhs"])
+            rhs = self._decode_conversion(encoded["rhs"])
+            if lhs is not None and rhs is not None:
+                self._equation_cache[key] = EquationConversionResult(lhs_sympy=lhs, rhs_sympy=rhs)
+
+    def _worker_options(self) -> dict[str, Any]:
+        """Constructor options for the validators that run inside pool workers."""
+        return {
+            "symbolic_timeout": self.symbolic_validator.timeout,
+            "max_expression_size": self.symbolic_validator.max_expression_size,
+            "cache": self.cache,
+        }
+
+    def _iter_equations_in_pool(self, equations: list[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        payloads = [{"equation": eq, "conversions": self._prefetch_conversions(eq)} for eq in equations]
+        chunksize = max(1, len(payloads) // (self.workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_equation_worker,
+            initargs=(self._worker_options(),),
+        ) as pool:
+            yield from pool.map(_validate_equation_payload, payloads, chunksize=chunksize)
+
+    def _validate_equations_in_pool(self, equations: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        return list(self._iter_equations_in_pool(equations))
+
     def _validate_derivative_equation(self, equation: dict[str, Any], eq_result: dict[str, Any]) -> bool:
         lhs_latex = equation["lhs"].strip()
         match = self._DERIVATIVE_PATTERN.match(lhs_latex)
@@ -103,6 +274,12 @@ class MathValidator(BaseValidator):
             eq_result["passed"] = True
             return True
 
+        if self._symbolic_timed_out(symbolic):
+            eq_result["decision_path"].append("derivative_timeout")
+            eq_result["timed_out"] = True
+            self._numeric_fallback(eq_result, derivative_expr, rhs_expr)
+            return True
+
         eq_result["decision_path"].append("derivative_fail")
         eq_result["status"] = "FAIL"
         eq_result["errors"].extend(symbolic.errors)
@@ -151,6 +328,12 @@ class MathValidator(BaseValidator):
             eq_result["passed"] = True
             return True
 
+        if self._symbolic_timed_out(symbolic):
+            eq_result["decision_path"].append("integral_timeout")
+            eq_result["timed_out"] = True
+            self._numeric_fallback(eq_result, integrated_expr, rhs_expr)
+            return True
+
         eq_result["decision_path"].append("integral_fail")
         eq_result["status"] = "FAIL"
         eq_result["errors"].extend(symbolic.errors)
@@ -194,26 +377,18 @@ class MathValidator(BaseValidator):
                 eq_result["passed"] = True
                 return eq_result
 
-            if not self._symbolic_inconclusive(symbolic):
+            if self._symbolic_timed_out(symbolic):
+                eq_result["decision_path"].append("symbolic_timeout")
+                eq_result["timed_out"] = True
+            elif not self._symbolic_inconclusive(symbolic):
                 eq_result["decision_path"].append("symbolic_fail")
                 eq_result["status"] = "FAIL"
                 eq_result["errors"].extend(symbolic.errors)
                 return eq_result
+            else:
+                eq_result["decision_path"].append("symbolic_inconclusive")
 
-            eq_result["decision_path"].append("symbolic_inconclusive")
-            eq_result["decision_path"].append("numeric_attempt")
-            numeric = self.numeric_validator.validate_equivalence(lhs_sympy, rhs_sympy)
-            eq_result["numeric"] = numeric.to_dict()
-
-            if numeric.passed:
-                eq_result["decision_path"].append("numeric_pass")
-                eq_result["status"] = "PASS"
-                eq_result["passed"] = True
-                return eq_result
-
-            eq_result["decision_path"].append("numeric_fail")
-            eq_result["status"] = "FAIL"
-            eq_result["errors"].extend(numeric.errors)
+            self._numeric_fallback(eq_result, lhs_sympy, rhs_sympy)
             return eq_result
         except Exception as exc:
             logger.exception("math_validator decision path: equation_processing_exception")
@@ -222,13 +397,63 @@ class MathValidator(BaseValidator):
             eq_result["errors"].append(f"Equation processing failed: {exc}")
             return eq_result
 
+    def _validate_equations(self, equations: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if self.workers > 1 and len(equations) > 1:
+            items: Iterator[dict[str, Any]] = self._iter_equations_in_pool(equations)
+        else:
+            items = map(self._validate_one_equation, equations)
+        details: list[dict[str, Any]] = []
+        for item in items:
+            if self.on_equation is not None:
+                self.on_equation(item)
+            details.append(item)
+        return details
+
+    def _result_options(self) -> dict[str, Any]:
+        """The options that can change an equation's outcome, folded into its fingerprint."""
+        return {
+            "symbolic_timeout": self.symbolic_validator.timeout,
+            "max_expression_size": self.symbolic_validator.max_expression_size,
+        }
+
+    def _validate_incrementally(
+        self, equations: list[dict[str, Any]], results: EquationResultStore
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Validate only equations without a stored result; return details and the reuse count."""
+        options = self._result_options()
+        fingerprints = [results.fingerprint(eq, options) for eq in equations]
+        stored = results.get_many(fingerprints)
+
+        details: list[dict[str, Any] | None] = []
+        pending: list[int] = []
+        for i, (eq, fingerprint) in enumerate(zip(equations, fingerprints)):
+            if fingerprint not in stored:
+                details.append(None)
+                pending.append(i)
+                continue
+            carried = {"source_location": eq["source_location"], **stored[fingerprint], "cached": True}
+            if self.on_equation is not None:
+                self.on_equation(carried)
+            details.append(carried)
+
+        fresh = self._validate_equations([equations[i] for i in pending])
+        results.put_many((fingerprints[i], item) for i, item in zip(pending, fresh))
+        for i, item in zip(pending, fresh):
+            details[i] = item
+        return details, len(equations) - len(pending)  # type: ignore[return-value]
+
     def validate(self, artifact_path: Path) -> ValidationResult:
+        return self.validate_context(ArtifactContext(artifact_path))
+
+    def validate_context(self, context: ArtifactContext) -> ValidationResult:
+        artifact_path = context.path
         # Per-run caches reduce repeated LaTeX→SymPy conversions when validating
         # large papers (100+ equations) with duplicated forms.
         self._latex_cache = {}
         self._equation_cache = {}
+        persistent_before = None if self.cache is None else (self.cache.hits, self.cache.misses)
 
-        extraction = self.extractor.validate(artifact_path)
+        extraction = self.extractor.validate_context(context)
         if not extraction.passed:
             return ValidationResult(
                 name=self.name,
@@ -240,12 +465,17 @@ class MathValidator(BaseValidator):
             )
 
         equations = extraction.metadata.get("equations", [])
-        details = [self._validate_one_equation(eq) for eq in equations]
+        reused = 0
+        if self.results is not None:
+            details, reused = self._validate_incrementally(equations, self.results)
+        else:
+            details = self._validate_equations(equations)
 
         errors: list[str] = []
         total_equations = len(equations)
         skipped_equations = 0
         failed_equations = 0
+        timed_out_equations = sum(1 for item in details if item.get("timed_out"))
 
         for item in details:
             if item.get("status") == "SKIPPED":
@@ -261,25 +491,49 @@ class MathValidator(BaseValidator):
         status = "FAIL" if errors else ("SKIPPED" if skipped_equations else "PASS")
         reason = "conversion failure" if status == "SKIPPED" else None
 
+        cache_stats: dict[str, Any] = {
+            "latex_cache_size": len(self._latex_cache),
+            "equation_cache_size": len(self._equation_cache),
+        }
+        if self.cache is not None and persistent_before is not None:
+            cache_stats["persistent_hits"] = self.cache.hits - persistent_before[0]
+            cache_stats["persistent_misses"] = self.cache.misses - persistent_before[1]
+
+        metadata: dict[str, Any] = {
+            "artifact_path": str(artifact_path),
+            "equation_count": len(equations),
+            "results": details,
+            "metrics": {
+                "total_equations": total_equations,
+                "validated_equations": validated_equations,
+                "failed_equations": failed_equations,
+                "skipped_equations": skipped_equations,
+                "timed_out_equations": timed_out_equations,
+            },
+            "cache_stats": cache_stats,
+        }
+        if self.results is not None:
+            metadata["incremental"] = {"reused_equations": reused, "rechecked_equations": total_equations - reused}
+
         return ValidationResult(
             name=self.name,
             passed=not errors,
             status=status,
             reason=reason,
             errors=errors,
-            metadata={
-                "artifact_path": str(artifact_path),
-                "equation_count": len(equations),
-                "results": details,
-                "metrics": {
-                    "total_equations": total_equations,
-                    "validated_equations": validated_equations,
-                    "failed_equations": failed_equations,
-                    "skipped_equations": skipped_equations,
-                },
-                "cache_stats": {
-                    "latex_cache_size": len(self._latex_cache),
-                    "equation_cache_size": len(self._equation_cache),
-                },
-            },
+            metadata=metadata,
         )
+
+
+_worker_validator: MathValidator | None = None
+
+
+def _init_equation_worker(options: dict[str, Any]) -> None:
+    global _worker_validator
+    _worker_validator = MathValidator(**options)
+
+
+def _validate_equation_payload(payload: dict[str, Any]) -> dict[str, Any]:
+    validator = _worker_validator or MathValidator()
+    validator._seed_conversions(payload["conversions"])
+    return validator._validate_one_equation(payload["equation"])
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterable
+
+from tars.validators.cache import cache_dir_from_env
+
+from .conversion_cache import converter_version
+
+# Bump when the per-equation result format or decision logic changes.
+RESULT_FORMAT_VERSION = "1"
+
+# Outcomes that depend on the machine or the moment rather than the equation.
+_UNSTABLE_DECISIONS = {"equation_processing_exception", "derivative_sympy_unavailable", "integral_sympy_unavailable"}
+
+
+def is_reusable(result: dict[str, Any]) -> bool:
+    """Whether an equation result may be carried forward to a later run."""
+    if result.get("timed_out"):
+        return False
+    return not _UNSTABLE_DECISIONS.intersection(result.get("decision_path", ()))
+
+
+class EquationResultStore:
+    """Persistent per-equation outcomes for incremental math validation.
+
+    Each result is keyed by a fingerprint of the equation's content (its
+    ``raw``, ``lhs`` and ``rhs`` LaTeX, not its location), the validator
+    options that affect the outcome and `converter_version`, so an equation
+    that moved or reappears elsewhere is still a hit while any edit to it is
+    a miss. Results that hit a time budget or failed for environmental
+    reasons are never stored.
+
+    Like `ConversionCache`, the store is a SQLite database in `cache_dir`;
+    instances pickle by path and reconnect lazily in each process. The least
+    recently used entries are evicted past `max_entries` on `close`.
+    """
+
+    FILENAME = "equation_results.sqlite3"
+
+    def __init__(self, cache_dir: str | Path, *, max_entries: int = 200_000, version: str | None = None) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.path = self.cache_dir / self.FILENAME
+        self.max_entries = max_entries
+        self.version = version or f"results={RESULT_FORMAT_VERSION};{converter_version()}"
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._pid: int | None = None
+
+    @classmethod
+    def from_env(cls, **kwargs: Any) -> EquationResultStore | None:
+        """Return a store in ``$TARS_CACHE_DIR`` if it is set, else None."""
+        cache_dir = cache_dir_from_env()
+        return None if cache_dir is None else cls(cache_dir, **kwargs)
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"cache_dir": self.cache_dir, "max_entries": self.max_entries, "version": self.version}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(state["cache_dir"], max_entries=state["max_entries"], version=state["version"])
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None or self._pid != os.getpid():
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "fingerprint TEXT PRIMARY KEY, payload TEXT NOT NULL, last_used REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def fingerprint(self, equation: dict[str, Any], options: dict[str, Any] | None = None) -> str:
+        content = json.dumps(
+            [self.version, options or {}, equation["raw"].strip(), equation["lhs"].strip(), equation["rhs"].strip()],
+            sort_keys=True,
+        )
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def get_many(self, fingerprints: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Return the stored results among `fingerprints` (location fields omitted)."""
+        wanted = list(dict.fromkeys(fingerprints))
+        found: dict[str, dict[str, Any]] = {}
+        with self._lock:
+            conn = self._connection()
+            # Stay under SQLite's default host-parameter limit.
+            for start in range(0, len(wanted), 500):
+                chunk = wanted[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT fingerprint, payload FROM results WHERE fingerprint IN ({placeholders})", chunk
+                ).fetchall()
+                found.update((fingerprint, json.loads(payload)) for fingerprint, payload in rows)
+            if found:
+                now = time.time()
+                conn.executemany(
+                    "UPDATE results SET last_used = ? WHERE fingerprint = ?", [(now, key) for key in found]
+                )
+        return found
+
+    def put_many(self, results: Iterable[tuple[str, dict[str, Any]]]) -> int:
+        """Store reusable results; returns how many were written."""
+        now = time.time()
+        rows = [
+            (fingerprint, json.dumps({k: v for k, v in result.items() if k != "source_location"}), now)
+            for fingerprint, result in results
+            if is_reusable(result)
+        ]
+        if rows:
+            with self._lock:
+                self._connection().executemany(
+                    "INSERT OR REPLACE INTO results (fingerprint, payload, last_used) VALUES (?, ?, ?)", rows
+                )
+        return len(rows)
+
+    def entry_count(self) -> int:
+        with self._lock:
+            (count,) = self._connection().execute("SELECT COUNT(*) FROM results").fetchone()
+        return int(count)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection().execute("DELETE FROM results")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        (count,) = conn.execute("SELECT COUNT(*) FROM results").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM results WHERE fingerprint IN "
+                "(SELECT fingerprint FROM results ORDER BY last_used ASC LIMIT ?)",
+                (excess,),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._evict(self._conn)
+                self._conn.close()
+            self._conn = None
+            self._pid = None
@@ -1,23 +1,51 @@
 from __future__ import annotations
 
+import cmath
+import multiprocessing
+import random
+import threading
 from pathlib import Path
 from typing import Any
 
 from tars.validators.base import BaseValidator
 from tars.validators.result import ValidationResult
 
+from .math_converter import expression_from_srepr, expression_to_srepr
+
+# How long a budgeted check may take to start its child process; the budget
+# itself only covers the decision.
+_STARTUP_TIMEOUT = 120.0
+
 
 class SymbolicValidator(BaseValidator):
     """Symbolically validate equation equivalence with SymPy.
 
-    Core check is based on simplifying ``lhs - rhs`` and testing whether the
-    resulting expression is mathematically zero. Matrix/scalar expressions are
-    both supported.
+    Core check tests whether ``lhs - rhs`` is mathematically zero. Rewrites are
+    tried cheapest first (`STAGES`): structural equality, ``expand``,
+    ``together``/``cancel``, ``trigsimp``, a numeric probe that can only
+    disprove equivalence, and finally full ``simplify``. The stage that
+    settled the check is reported as ``decided_by`` in the result metadata.
+    Matrix/scalar expressions are both supported.
+
+    Optional per-equation budgets bound the cost of one check: `timeout`
+    (seconds) runs the check in a child process that is terminated when the
+    budget is spent, and `max_expression_size` (SymPy operation count of
+    ``lhs - rhs``) refuses oversized inputs up front. Either budget being
+    exceeded yields a result with status ``TIMEOUT``.
     """
 
     name = "symbolic_validator"
     artifact_type = "research-paper"
 
+    STAGES = ("structural", "expand", "cancel", "trigsimp", "numeric_probe", "simplify")
+    PROBE_POINTS = 3
+    PROBE_SEED = 0
+    PROBE_TOLERANCE = 1e-9
+
+    def __init__(self, *, timeout: float | None = None, max_expression_size: int | None = None) -> None:
+        self.timeout = timeout
+        self.max_expression_size = max_expression_size
+
     @staticmethod
     def _is_zero_expr(expr: Any, sp_module: Any) -> bool:
         if expr == 0:
@@ -55,6 +83,142 @@ class SymbolicValidator(BaseValidator):
 
         return simplified
 
+    @staticmethod
+    def _is_trivially_zero(expr: Any, sp_module: Any) -> bool:
+        """Structural zero test used between stages; never queries assumptions."""
+        if isinstance(expr, sp_module.MatrixBase):
+            return all(entry == 0 for entry in expr)
+        return expr == 0
+
+    @staticmethod
+    def _rewrite(expr: Any, transform: Any, sp_module: Any) -> Any:
+        if isinstance(expr, sp_module.MatrixBase):
+            return expr.applyfunc(transform)
+        return transform(expr)
+
+    @classmethod
+    def _probe_counterexample(cls, lhs_sympy: Any, rhs_sympy: Any, sp_module: Any) -> dict[str, str] | None:
+        """Evaluate both sides at a few random points; return a point where they differ.
+
+        Points where either side is undefined or not finite are skipped, so the
+        probe can disprove equivalence but never prove it.
+        """
+        if isinstance(lhs_sympy, sp_module.MatrixBase) or isinstance(rhs_sympy, sp_module.MatrixBase):
+            return None
+
+        symbols = sorted((lhs_sympy - rhs_sympy).free_symbols, key=str)
+        rng = random.Random(cls.PROBE_SEED)
+        for _ in range(cls.PROBE_POINTS):
+            point = {
+                symbol: sp_module.Float(rng.uniform(0.1, 2.0) if symbol.is_positive else rng.uniform(-2.0, 2.0))
+                for symbol in symbols
+            }
+            try:
+                lhs_value = complex(sp_module.N(lhs_sympy.subs(point)))
+                rhs_value = complex(sp_module.N(rhs_sympy.subs(point)))
+            except Exception:
+                continue
+            if not (cmath.isfinite(lhs_value) and cmath.isfinite(rhs_value)):
+                continue
+            scale = max(1.0, abs(lhs_value), abs(rhs_value))
+            if abs(lhs_value - rhs_value) > cls.PROBE_TOLERANCE * scale:
+                return {str(symbol): str(value) for symbol, value in point.items()}
+        return None
+
+    @classmethod
+    def _decide(cls, lhs_sympy: Any, rhs_sympy: Any, sp_module: Any) -> tuple[bool, str, str]:
+        """Return whether ``lhs - rhs`` is zero, the reduced difference and the deciding stage."""
+        if lhs_sympy == rhs_sympy:
+            return True, "0", "structural"
+
+        diff = lhs_sympy - rhs_sympy
+        if cls._is_trivially_zero(diff, sp_module):
+            return True, str(diff), "structural"
+
+        from sympy.functions.elementary.hyperbolic import HyperbolicFunction  # type: ignore
+        from sympy.functions.elementary.trigonometric import TrigonometricFunction  # type: ignore
+
+        # Skip stages that cannot change the verdict for this difference.
+        has_fraction = any(power.exp.is_negative for power in diff.atoms(sp_module.Pow))
+        has_trig = diff.has(TrigonometricFunction, HyperbolicFunction)
+        rewrites = (
+            ("expand", sp_module.expand, True),
+            ("cancel", lambda expr: sp_module.cancel(sp_module.together(expr)), has_fraction),
+            ("trigsimp", lambda expr: sp_module.trigsimp(expr, method="fu"), has_trig),
+        )
+        for stage, transform, applies in rewrites:
+            if not applies:
+                continue
+            reduced = cls._rewrite(diff, transform, sp_module)
+            if cls._is_trivially_zero(reduced, sp_module):
+                return True, str(reduced), stage
+
+        if cls._probe_counterexample(lhs_sympy, rhs_sympy, sp_module) is not None:
+            return False, str(diff), "numeric_probe"
+
+        simplified = cls._simplify_difference(lhs_sympy, rhs_sympy, sp_module)
+        return cls._is_zero_expr(simplified, sp_module), str(simplified), "simplify"
+
+    @staticmethod
+    def _process_context() -> Any:
+        # Forking avoids re-importing SymPy in every budgeted check, but forking a
+        # process that runs other threads (the threads executor, daemon workers) can
+        # leave the child stuck on a lock one of them held. Those processes use a
+        # forkserver with SymPy preloaded instead, or spawn where there is none.
+        methods = multiprocessing.get_all_start_methods()
+        if "fork" in methods and threading.active_count() == 1:
+            return multiprocessing.get_context("fork")
+        if "forkserver" in methods:
+            ctx = multiprocessing.get_context("forkserver")
+            ctx.set_forkserver_preload(["sympy", __name__])
+            return ctx
+        return multiprocessing.get_context("spawn")
+
+    def _decide_with_timeout(self, lhs_sympy: Any, rhs_sympy: Any) -> tuple[bool, str, str] | None:
+        """Run `_decide` in a child process; return None if it exceeds the budget."""
+        ctx = self._process_context()
+        if ctx.get_start_method() != "fork":
+            # Expressions cross the process boundary as `srepr` text.
+            lhs_sympy, rhs_sympy = expression_to_srepr(lhs_sympy), expression_to_srepr(rhs_sympy)
+        receiver, sender = ctx.Pipe(duplex=False)
+        process = ctx.Process(target=_decide_in_child, args=(lhs_sympy, rhs_sympy, sender), daemon=True)
+        process.start()
+        sender.close()
+        try:
+            try:
+                if not receiver.poll(_STARTUP_TIMEOUT):
+                    raise RuntimeError("simplification worker did not start")
+                outcome, payload = receiver.recv()
+                if outcome == "started":
+                    if not receiver.poll(self.timeout):
+                        return None
+                    outcome, payload = receiver.recv()
+            except EOFError:
+                process.join()
+                raise RuntimeError(f"simplification worker exited with code {process.exitcode}") from None
+        finally:
+            receiver.close()
+            if process.is_alive():
+                process.terminate()
+            process.join(1.0)
+            if process.is_alive():
+                process.kill()
+                process.join()
+
+        if outcome == "error":
+            raise RuntimeError(payload)
+        return payload
+
+    def _budget_exceeded(self, lhs_sympy: Any, rhs_sympy: Any, reason: str, error: str, **metadata: Any) -> ValidationResult:
+        return ValidationResult(
+            name=self.name,
+            passed=False,
+            status="TIMEOUT",
+            reason=reason,
+            errors=[error],
+            metadata={"lhs": str(lhs_sympy), "rhs": str(rhs_sympy), **metadata},
+        )
+
     def validate_equivalence(self, lhs_sympy: Any, rhs_sympy: Any) -> ValidationResult:
         """Validate whether lhs and rhs are mathematically equivalent."""
         try:
@@ -68,8 +232,32 @@ class SymbolicValidator(BaseValidator):
             )
 
         try:
-            diff = self._simplify_difference(lhs_sympy, rhs_sympy, sp)
-            passed = self._is_zero_expr(diff, sp)
+            if self.max_expression_size is not None:
+                size = int(sp.count_ops(lhs_sympy - rhs_sympy))
+                if size > self.max_expression_size:
+                    return self._budget_exceeded(
+                        lhs_sympy,
+                        rhs_sympy,
+                        "expression size budget exceeded",
+                        f"Expression size {size} exceeds the budget of {self.max_expression_size} operations",
+                        expression_size=size,
+                        max_expression_size=self.max_expression_size,
+                    )
+
+            if self.timeout is None:
+                passed, difference, stage = self._decide(lhs_sympy, rhs_sympy, sp)
+            else:
+                decided = self._decide_with_timeout(lhs_sympy, rhs_sympy)
+                if decided is None:
+                    return self._budget_exceeded(
+                        lhs_sympy,
+                        rhs_sympy,
+                        "time budget exceeded",
+                        f"Symbolic simplification exceeded the {self.timeout}s time budget",
+                        timeout_seconds=self.timeout,
+                    )
+                passed, difference, stage = decided
+
             return ValidationResult(
                 name=self.name,
                 passed=passed,
@@ -77,7 +265,8 @@ class SymbolicValidator(BaseValidator):
                 metadata={
                     "lhs": str(lhs_sympy),
                     "rhs": str(rhs_sympy),
-                    "difference": str(diff),
+                    "difference": difference,
+                    "decided_by": stage,
                 },
             )
         except Exception as exc:
@@ -99,3 +288,22 @@ class SymbolicValidator(BaseValidator):
             ],
             metadata={"artifact_path": str(artifact_path)},
         )
+
+
+def _decide_in_child(lhs_sympy: Any, rhs_sympy: Any, conn: Any) -> None:
+    """Decide ``lhs == rhs``, after sending a start marker so imports do not count against the budget."""
+    try:
+        import sympy as sp  # type: ignore
+
+        if isinstance(lhs_sympy, str):
+            # An inexact round trip is still an evaluated form of the same expression.
+            lhs_sympy, rhs_sympy = (
+                expression if (expression := expression_from_srepr(text)) is not None else sp.sympify(text)
+                for text in (lhs_sympy, rhs_sympy)
+            )
+        conn.send(("started", None))
+        conn.send(("ok", SymbolicValidator._decide(lhs_sympy, rhs_sympy, sp)))
+    except Exception as exc:
+        conn.send(("error", str(exc)))
+    finally:
+        conn.close()
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+import re
+
+_NEWLINE = re.compile(r"\n")
+
+
+class SourceIndex:
+    """Map character offsets of one document to line/column positions.
+
+    Newline offsets are collected once into a compact array; each lookup is a
+    binary search, so reporting locations for many matches stays O(log n) per
+    match instead of recounting newlines from the start of the document.
+    Lines and columns are 1-based.
+    """
+
+    def __init__(self, text: str) -> None:
+        self._line_starts = array("q", [0])
+        self._line_starts.extend(match.end() for match in _NEWLINE.finditer(text))
+        self._length = len(text)
+
+    @property
+    def line_count(self) -> int:
+        return len(self._line_starts)
+
+    def position(self, offset: int) -> tuple[int, int]:
+        """Return `(line, column)` for a character offset."""
+        if offset < 0 or offset > self._length:
+            raise IndexError(f"Offset {offset} outside document of length {self._length}.")
+        line = bisect_right(self._line_starts, offset)
+        return line, offset - self._line_starts[line - 1] + 1
+
+    def line_number(self, offset: int) -> int:
+        return self.position(offset)[0]
+
+    def location(self, offset: int, label: str) -> str:
+        """Format a `source_location` string such as `line:12:col:5:inline`."""
+        line, column = self.position(offset)
+        return format_source_location(line, column, label)
+
+
+def format_source_location(line: int, column: int, label: str) -> str:
+    return f"line:{line}:col:{column}:{label}"
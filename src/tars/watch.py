@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from tars.validators.context import ArtifactContext
+from tars.validators.project import ProjectLoader
+from tars.validators.research.math.math_validator import MathValidator
+from tars.validators.result import ValidationResult
+
+# Files whose edits can change math results; bibliography edits cannot.
+_MATH_SUFFIXES = {".tex", ".bbl"}
+
+Snapshot = dict[Path, tuple[int, int] | None]
+
+
+def _status(item: dict[str, Any]) -> str:
+    return item.get("status") or ("PASS" if item.get("passed") else "FAIL")
+
+
+def _keyed(details: list[dict[str, Any]]) -> dict[tuple[str, int], dict[str, Any]]:
+    """Key equation results by content and occurrence, so moved lines still match."""
+    seen: Counter[str] = Counter()
+    keyed: dict[tuple[str, int], dict[str, Any]] = {}
+    for item in details:
+        raw = item.get("raw", "")
+        keyed[(raw, seen[raw])] = item
+        seen[raw] += 1
+    return keyed
+
+
+def diff_results(previous: ValidationResult | None, current: ValidationResult) -> list[str]:
+    """Describe how per-equation statuses changed between two runs of the math validator."""
+    if previous is None:
+        return []
+    lines: list[str] = []
+    before = _keyed(previous.metadata.get("results", []))
+    after = _keyed(current.metadata.get("results", []))
+    for key, item in after.items():
+        old = before.get(key)
+        if old is None:
+            lines.append(f"+ {item['source_location']}: {_status(item)} {key[0]}")
+        elif _status(old) != _status(item):
+            lines.append(f"~ {item['source_location']}: {_status(old)} -> {_status(item)} {key[0]}")
+    for key, item in before.items():
+        if key not in after:
+            lines.append(f"- {item['source_location']}: {key[0]}")
+    return lines
+
+
+@dataclass
+class WatchUpdate:
+    """One validation run of a `PaperWatcher`."""
+
+    result: ValidationResult
+    changed_files: list[Path] = field(default_factory=list)
+    changes: list[str] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+    skipped: bool = False
+
+
+class PaperWatcher:
+    """Re-validate a paper's math whenever it or a file it includes is saved.
+
+    The watcher polls the modification time and size of every file in the
+    paper's project (the main file, its includes, ``.bbl`` and ``.bib``
+    files, and includes that do not exist yet), which costs a handful of
+    ``stat`` calls per `interval`. A burst of saves is coalesced: validation
+    starts once no file has changed for `debounce` seconds.
+
+    One validator and one `ProjectLoader` are reused for the whole session,
+    so SymPy and the converter stay imported, unchanged files are not
+    re-parsed, and, when the validator has an `EquationResultStore`, only
+    new or edited equations are re-checked. Edits that touch only ``.bib``
+    files do not re-run math validation.
+    """
+
+    def __init__(
+        self,
+        paper: str | Path,
+        *,
+        validator: MathValidator | None = None,
+        loader: ProjectLoader | None = None,
+        interval: float = 0.5,
+        debounce: float = 0.3,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.paper = Path(paper)
+        self.validator = validator or MathValidator()
+        self.loader = loader or ProjectLoader()
+        self.interval = interval
+        self.debounce = debounce
+        self._sleep = sleep
+        self._watched: list[Path] = [self.paper]
+        self._baseline: Snapshot | None = None
+        self.last_result: ValidationResult | None = None
+
+    def snapshot(self) -> Snapshot:
+        state: Snapshot = {}
+        for path in self._watched:
+            try:
+                stat = path.stat()
+            except OSError:
+                state[path] = None
+            else:
+                state[path] = (stat.st_mtime_ns, stat.st_size)
+        return state
+
+    @staticmethod
+    def changed(before: Snapshot, after: Snapshot) -> list[Path]:
+        return [path for path in after if before.get(path) != after[path]]
+
+    def run(self, changed_files: list[Path] | None = None) -> WatchUpdate:
+        """Validate now; skip math when only non-math files changed since the last run."""
+        changed_files = changed_files or []
+        # Taken before validating, so saves made while the run is in progress count as changes.
+        self._baseline = self.snapshot()
+        if (
+            self.last_result is not None
+            and changed_files
+            and not any(path.suffix in _MATH_SUFFIXES for path in changed_files)
+        ):
+            return WatchUpdate(result=self.last_result, changed_files=changed_files, skipped=True)
+
+        started = time.perf_counter()
+        context = ArtifactContext(self.paper, loader=self.loader)
+        result = self.validator.validate_context(context)
+        if context.exists:
+            project = context.project
+            self._watched = [file.path for file in (*project.files, *project.bib_files)]
+            # Includes that do not exist yet are watched too, at every path the loader
+            # would try, so creating one triggers a run.
+            for name in project.missing:
+                suffix = ".bib" if name.endswith(".bib") else ".tex"
+                self._watched.extend(ProjectLoader._candidates(project.root, name, suffix))
+            # Files first seen in this run are compared with the version that was validated.
+            loaded = {file.path: (file.mtime_ns, file.size) for file in (*project.files, *project.bib_files)}
+            self._baseline = {path: loaded.get(path, self._baseline.get(path)) for path in self._watched}
+        update = WatchUpdate(
+            result=result,
+            changed_files=changed_files,
+            changes=diff_results(self.last_result, result),
+            elapsed_seconds=time.perf_counter() - started,
+        )
+        self.last_result = result
+        return update
+
+    def wait_for_change(self, stop: threading.Event | None = None) -> list[Path] | None:
+        """Block until watched files change and settle; None if `stop` is set first.
+
+        Changes are measured from the start of the last `run`, not from this
+        call, so nothing saved while it was validating is lost.
+        """
+        baseline = self._baseline if self._baseline is not None else self.snapshot()
+        while stop is None or not stop.is_set():
+            self._sleep(self.interval)
+            current = self.snapshot()
+            if current == baseline:
+                continue
+            # Debounce: wait until a poll sees no further change.
+            while True:
+                self._sleep(self.debounce)
+                settled = self.snapshot()
+                if settled == current:
+                    return self.changed(baseline, settled)
+                current = settled
+        return None
+
+    def watch(
+        self,
+        on_update: Callable[[WatchUpdate], None],
+        *,
+        stop: threading.Event | None = None,
+        max_runs: int | None = None,
+    ) -> None:
+        """Validate once, then again after every settled change until `stop` is set."""
+        runs = 0
+        changed: list[Path] | None = []
+        while changed is not None:
+            on_update(self.run(changed))
+            runs += 1
+            if max_runs is not None and runs >= max_runs:
+                return
+            changed = self.wait_for_change(stop)
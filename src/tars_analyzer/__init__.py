@@ -1,13 +1,41 @@
 """TARS conversation analyzer."""
 
-from .analyzer import analyze_conversations
-from .claim_deduplication import analyze_claim_deduplication
+from __future__ import annotations
 
-from .models import ConversationClaimDedup, ConversationProgress, ProgressionEvaluation
+from typing import TYPE_CHECKING
+
+from tars._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .analyzer import analyze_conversations
+    from .claim_deduplication import ClaimDeduplicator, ClaimIndex, analyze_claim_deduplication
+    from .loader import iter_conversations, load_conversations
+    from .models import ConversationClaimDedup, ConversationProgress, ProgressionEvaluation
+
+# Imported on first access: the analyzer pulls in the Gemini client, which
+# `tars-analyze --help` and users of the models alone should not pay for.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "analyze_conversations": ".analyzer",
+        "analyze_claim_deduplication": ".claim_deduplication",
+        "ClaimIndex": ".claim_deduplication",
+        "ClaimDeduplicator": ".claim_deduplication",
+        "iter_conversations": ".loader",
+        "load_conversations": ".loader",
+        "ConversationProgress": ".models",
+        "ProgressionEvaluation": ".models",
+        "ConversationClaimDedup": ".models",
+    },
+)
 
 __all__ = [
     "analyze_conversations",
     "analyze_claim_deduplication",
+    "ClaimIndex",
+    "ClaimDeduplicator",
+    "iter_conversations",
+    "load_conversations",
     "ConversationProgress",
     "ProgressionEvaluation",
     "ConversationClaimDedup",
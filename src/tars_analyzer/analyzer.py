@@ -1,36 +1,18 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict
-from datetime import datetime
+import shutil
+import tempfile
+import textwrap
+from dataclasses import asdict, replace
 from pathlib import Path
 from statistics import mean
+from typing import Iterable
 
-from .claim_deduplication import analyze_claim_deduplication
+from .claim_deduplication import ClaimDeduplicator
 from .gemini_client import GeminiEvaluator
-from .models import Conversation, Turn
-
-
-def _parse_timestamp(value: str) -> datetime:
-    return datetime.fromisoformat(value.replace("Z", "+00:00"))
-
-
-def load_conversations(path: str | Path) -> list[Conversation]:
-    path = Path(path)
-    conversations: list[Conversation] = []
-    for line in path.read_text().splitlines():
-        if not line.strip():
-            continue
-        data = json.loads(line)
-        conversations.append(
-            Conversation(
-                conversation_id=data["conversation_id"],
-                timestamp=_parse_timestamp(data["timestamp"]),
-                turns=[Turn(**turn) for turn in data["turns"]],
-                metadata=data.get("metadata", {}),
-            )
-        )
-    return sorted(conversations, key=lambda c: c.timestamp)
+from .loader import iter_conversations
+from .models import Conversation, ConversationProgress
 
 
 def _basic_metrics(conversation: Conversation) -> dict:
@@ -47,74 +29,131 @@ def _basic_metrics(conversation: Conversation) -> dict:
     }
 
 
+def _progress_dict(progress: ConversationProgress) -> dict:
+    # `asdict` would deep-copy a `TurnScoreTable` as an opaque object; expand it row by row.
+    data = asdict(replace(progress, turn_dimension_scores=[]))
+    data["turn_dimension_scores"] = [asdict(item) for item in progress.turn_dimension_scores]
+    return data
+
+
+def _write_report_json(path: Path, summary: dict, records_path: Path) -> None:
+    """Write `summary` plus the ``analyses`` read back from `records_path`, as ``json.dumps(indent=2)`` would."""
+    head = json.dumps(summary, indent=2)
+    with path.open("w", encoding="utf-8") as handle, records_path.open(encoding="utf-8") as records:
+        handle.write(head[: -len("\n}")] + ',\n  "analyses": [')
+        separator = "\n"
+        for line in records:
+            handle.write(separator + textwrap.indent(json.dumps(json.loads(line), indent=2), "    "))
+            separator = ",\n"
+        handle.write("\n  ]\n}" if separator == ",\n" else "]\n}")
+
+
 def analyze_conversations(
     input_path: str | Path,
     output_dir: str | Path,
     model: str = "gemini-2.0-flash",
+    dedup_backend: str = "index",
+    *,
+    evaluate_progression: bool = True,
+    assume_sorted: bool = False,
 ) -> dict:
-    conversations = load_conversations(input_path)
-    evaluator = GeminiEvaluator(model=model)
+    """Analyze a JSONL (optionally gzip/zstd) conversation log and write report files.
+
+    Conversations are read in timestamp order (pass `assume_sorted` for input
+    that already is, to skip the external sort), and each one's record is
+    written to ``analyses.jsonl`` as soon as it is analyzed; ``report.json``
+    and ``report.md`` are assembled from that file at the end.
+
+    The Gemini progression evaluation needs every conversation in one prompt,
+    so it loads the whole file, and the returned report includes
+    ``analyses``. With ``evaluate_progression=False`` the file is streamed
+    instead and only the claim history and running totals are kept in
+    memory; the returned report then omits ``analyses``.
+    """
+    deduplicator = ClaimDeduplicator(backend=dedup_backend)
+    by_id: dict = {}
+    conversations: Iterable[Conversation] = iter_conversations(input_path, sort=not assume_sorted)
+    if evaluate_progression:
+        conversations = list(conversations)
+        evaluator = GeminiEvaluator(model=model)
+        progression = evaluator.evaluate_progression(conversations)
+        by_id = {item.conversation_id: item for item in progression.per_conversation}
+        trajectory = {
+            "label": progression.trajectory_label,
+            "confidence": progression.trajectory_confidence,
+            "summary": progression.overall_summary,
+        }
+    else:
+        trajectory = {"label": "not_evaluated", "confidence": 0.0, "summary": "Progression evaluation was skipped."}
 
-    progression = evaluator.evaluate_progression(conversations)
-    claim_dedup = analyze_claim_deduplication(conversations)
-    claim_dedup_by_id = {item.conversation_id: item for item in claim_dedup}
-    by_id = {item.conversation_id: item for item in progression.per_conversation}
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    records_path = output_dir / "analyses.jsonl"
 
-    analyses = []
+    analyses: list[dict] = []
     qualities = []
-    for convo in conversations:
-        progress = by_id.get(convo.conversation_id)
-        analyses.append(
-            {
+    count = 0
+    repetition_total = 0.0
+    total_repeated = 0
+    total_novel = 0
+    # The Markdown breakdown is spooled to a temporary file because the
+    # report's header needs totals that are known only at the end.
+    with (
+        records_path.open("w", encoding="utf-8") as records,
+        tempfile.TemporaryFile("w+", encoding="utf-8") as breakdown,
+    ):
+        for convo in conversations:
+            progress = by_id.get(convo.conversation_id)
+            claim_dedup = deduplicator.process(convo)
+            count += 1
+            repetition_total += claim_dedup.repetition_ratio
+            total_repeated += claim_dedup.repeated_claims
+            total_novel += claim_dedup.novel_claims
+            item = {
                 "conversation_id": convo.conversation_id,
                 "timestamp": convo.timestamp.isoformat(),
                 "basic_metrics": _basic_metrics(convo),
-                "progression": asdict(progress) if progress else None,
-                "claim_deduplication": (
-                    asdict(claim_dedup_by_id[convo.conversation_id])
-                    if convo.conversation_id in claim_dedup_by_id
-                    else None
-                ),
+                "progression": _progress_dict(progress) if progress else None,
+                "claim_deduplication": asdict(claim_dedup),
             }
-        )
-        if progress:
-            qualities.append(progress.overall_agent_quality)
-
-    first_score = qualities[0] if qualities else 0.0
-    last_score = qualities[-1] if qualities else 0.0
-    trend_delta = round(last_score - first_score, 3)
-
-    result = {
-        "conversation_count": len(conversations),
-        "overall_agent_quality_scores": qualities,
-        "average_overall_agent_quality": round(mean(qualities), 3) if qualities else 0.0,
-        "trend_delta_first_to_last": trend_delta,
-        "knowledge_retention_proxy": {
-            "average_repetition_ratio": round(
-                mean([item.repetition_ratio for item in claim_dedup]), 3
-            )
-            if claim_dedup
-            else 0.0,
-            "total_repeated_claims": sum(item.repeated_claims for item in claim_dedup),
-            "total_novel_claims": sum(item.novel_claims for item in claim_dedup),
-        },
-        "trajectory": {
-            "label": progression.trajectory_label,
-            "confidence": progression.trajectory_confidence,
-            "summary": progression.overall_summary,
-        },
-        "analyses": analyses,
-    }
-
-    output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
-    (output_dir / "report.json").write_text(json.dumps(result, indent=2))
-    (output_dir / "report.md").write_text(_to_markdown(result))
+            records.write(json.dumps(item) + "\n")
+            breakdown.write("\n" + "\n".join(_markdown_item(item)))
+            if evaluate_progression:
+                analyses.append(item)
+            if progress:
+                qualities.append(progress.overall_agent_quality)
+
+        first_score = qualities[0] if qualities else 0.0
+        last_score = qualities[-1] if qualities else 0.0
+        trend_delta = round(last_score - first_score, 3)
+
+        result = {
+            "conversation_count": count,
+            "overall_agent_quality_scores": qualities,
+            "average_overall_agent_quality": round(mean(qualities), 3) if qualities else 0.0,
+            "trend_delta_first_to_last": trend_delta,
+            "knowledge_retention_proxy": {
+                "average_repetition_ratio": round(repetition_total / count, 3) if count else 0.0,
+                "total_repeated_claims": total_repeated,
+                "total_novel_claims": total_novel,
+            },
+            "trajectory": trajectory,
+        }
+
+        records.close()  # flushed before report.json reads it back
+        _write_report_json(output_dir / "report.json", result, records_path)
+        breakdown.seek(0)
+        with (output_dir / "report.md").open("w", encoding="utf-8") as handle:
+            handle.write("\n".join(_markdown_header(result)))
+            shutil.copyfileobj(breakdown, handle)
+
+    if evaluate_progression:
+        result["analyses"] = analyses
     return result
 
 
-def _to_markdown(report: dict) -> str:
-    lines = [
+def _markdown_header(report: dict) -> list[str]:
+    return [
         "# Agent Self-Improvement Report",
         "",
         f"- Conversations analyzed: **{report['conversation_count']}**",
@@ -141,32 +180,33 @@ def _to_markdown(report: dict) -> str:
         "",
     ]
 
-    for item in report["analyses"]:
-        progress = item["progression"]
-        lines.append(f"### {item['conversation_id']} ({item['timestamp']})")
-        if progress:
-            lines.extend(
-                [
-                    f"- Overall agent quality: **{progress['overall_agent_quality']}**",
-                    f"- Rank within sequence: **{progress['rank']}**",
-                    (
-                        "- Improvement vs previous conversation: "
-                        f"**{progress['improvement_vs_previous']:+}**"
-                    ),
-                    f"- Notes: {progress['notes']}",
-                ]
-            )
-        dedup = item.get("claim_deduplication")
-        if dedup:
-            lines.extend(
-                [
-                    (
-                        "- Claim deduplication: "
-                        f"{dedup['repeated_claims']} repeated / {dedup['total_claims']} "
-                        f"(ratio {dedup['repetition_ratio']})"
-                    )
-                ]
-            )
-        lines.append("")
-
-    return "\n".join(lines)
+
+def _markdown_item(item: dict) -> list[str]:
+    lines = []
+    progress = item["progression"]
+    lines.append(f"### {item['conversation_id']} ({item['timestamp']})")
+    if progress:
+        lines.extend(
+            [
+                f"- Overall agent quality: **{progress['overall_agent_quality']}**",
+                f"- Rank within sequence: **{progress['rank']}**",
+                (
+                    "- Improvement vs previous conversation: "
+                    f"**{progress['improvement_vs_previous']:+}**"
+                ),
+                f"- Notes: {progress['notes']}",
+            ]
+        )
+    dedup = item.get("claim_deduplication")
+    if dedup:
+        lines.extend(
+            [
+                (
+                    "- Claim deduplication: "
+                    f"{dedup['repeated_claims']} repeated / {dedup['total_claims']} "
+                    f"(ratio {dedup['repetition_ratio']})"
+                )
+            ]
+        )
+    lines.append("")
+    return lines
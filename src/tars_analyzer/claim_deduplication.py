@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import random
 import re
 from collections import Counter
+from typing import Any, Iterable
 
+from .claim_features import ClaimFeatures, ClaimFeatureStore
 from .models import Conversation, ConversationClaimDedup, DedupedClaim
 
 
@@ -64,48 +67,264 @@ def _claim_similarity(claim_a: str, claim_b: str) -> float:
     return max(ngram_sim, cosine_sim)
 
 
-def analyze_claim_deduplication(
-    conversations: list[Conversation], similarity_threshold: float = 0.85
-) -> list[ConversationClaimDedup]:
-    seen_claims: list[str] = []
-    results: list[ConversationClaimDedup] = []
+_BACKENDS = ("index", "python", "numpy")
+_HASH_MASK = (1 << 64) - 1
 
-    for convo in conversations:
-        claims = _extract_claims(convo)
-        repeated_items: list[DedupedClaim] = []
 
+def _mix(value: int) -> int:
+    """SplitMix64 finalizer: spreads small integer keys over 64 bits."""
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _HASH_MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _HASH_MASK
+    return value ^ (value >> 31)
+
+
+class ClaimIndex:
+    """MinHash/LSH index for finding earlier claims similar to a new one.
+
+    A claim matches when the Jaccard similarity of its word 3-grams or the
+    cosine similarity of its word counts reaches the threshold (see
+    `_claim_similarity`). The index keeps two MinHash signatures per claim,
+    one over the 3-gram shingles and one over the word multiset (each word
+    paired with its occurrence number, so "data data" is two shingles), and
+    splits each into `bands` bands of `rows` values. Claims sharing any band
+    bucket are candidates, and candidates are verified with the exact
+    similarity, so the index never reports a false match; it can only miss
+    one. With the default 16 bands of 4 rows, a pair with 3-gram Jaccard
+    0.85 is missed with probability below 1e-5, one whose word multisets
+    overlap with weighted Jaccard 0.75 with probability below 1%, and one
+    at 0.67 (eight shared "data" plus two differing words, cosine 0.97)
+    with probability of a few percent.
+
+    Cosine does not bound the multiset overlap from below: a claim that
+    repeats another's words k times has cosine 1 but weighted Jaccard 1/k.
+    Such pairs are found only if their 3-grams overlap; use the exhaustive
+    backends when every cosine match must be reported.
+
+    Lookups cost time proportional to the number of candidates instead of
+    the number of stored claims; memory grows by ``2 * bands`` bucket
+    entries per distinct claim plus its `ClaimFeatureStore` arrays.
+    Signatures are computed with NumPy when it is installed and in pure
+    Python otherwise; both give identical values.
+    """
+
+    def __init__(self, *, bands: int = 16, rows: int = 4, seed: int = 0) -> None:
+        if bands < 1 or rows < 1:
+            raise ValueError("bands and rows must be positive")
+        self.bands = bands
+        self.rows = rows
+        rng = random.Random(seed)
+        # Multiply-shift hashing: h(x) = ((a * x + b) mod 2**64) >> 32 with odd a.
+        self._params = [(rng.getrandbits(64) | 1, rng.getrandbits(64)) for _ in range(bands * rows)]
+        self._numpy: tuple[Any, Any, Any] | None = None
+        try:
+            import numpy as np  # type: ignore
+        except Exception:
+            pass
+        else:
+            self._numpy = (
+                np,
+                np.array([a for a, _ in self._params], dtype=np.uint64),
+                np.array([b for _, b in self._params], dtype=np.uint64),
+            )
+        self.store = ClaimFeatureStore()
+        # Hash of a claim's token IDs -> its ID, so repeated claims are stored once.
+        self._exact: dict[int, int] = {}
+        self._buckets: dict[tuple[int, int], int | list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def _signature(self, keys: Iterable[int]) -> list[int]:
+        hashes = [_mix(key) for key in keys]
+        if not hashes:
+            return [0] * len(self._params)
+        if self._numpy is not None:
+            np, a, b = self._numpy
+            values = np.array(hashes, dtype=np.uint64)[:, None]
+            return ((values * a + b) >> np.uint64(32)).min(axis=0).tolist()
+        return [min(((a * value + b) & _HASH_MASK) >> 32 for value in hashes) for a, b in self._params]
+
+    @staticmethod
+    def _word_shingles(features: ClaimFeatures) -> list[int]:
+        # (token ID, occurrence number) packed into one integer; token IDs are 32-bit.
+        return [(token << 32) | occurrence for token, count in features.counts.items() for occurrence in range(count)]
+
+    def _band_keys(self, features: ClaimFeatures) -> list[tuple[int, int]]:
+        keys: list[tuple[int, int]] = []
+        for offset, shingles in ((0, features.ngrams), (self.bands, self._word_shingles(features))):
+            signature = self._signature(shingles)
+            for band in range(self.bands):
+                rows = tuple(signature[band * self.rows : (band + 1) * self.rows])
+                keys.append((offset + band, hash(rows)))
+        return keys
+
+    def _candidates(self, keys: list[tuple[int, int]]) -> set[int]:
+        candidates: set[int] = set()
+        for key in keys:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                continue
+            if isinstance(bucket, int):
+                candidates.add(bucket)
+            else:
+                candidates.update(bucket)
+        return candidates
+
+    def query(self, claim: str) -> tuple[str, float]:
+        """Return the most similar stored claim and its similarity, or ``("", 0.0)``.
+
+        Among equally similar claims the earliest added wins.
+        """
+        features = self.store.features(claim)
+        return self._best(features, self._band_keys(features))
+
+    def _best(self, features: ClaimFeatures, keys: list[tuple[int, int]]) -> tuple[str, float]:
+        best_ident = -1
+        best_similarity = 0.0
+        for ident in sorted(self._candidates(keys)):
+            similarity = self.store.similarity(features, ident)
+            if similarity > best_similarity:
+                best_similarity = similarity
+                best_ident = ident
+        if best_ident < 0:
+            return "", 0.0
+        return self.store.text(best_ident), best_similarity
+
+    def add(self, claim: str) -> None:
+        """Store `claim`; adding a claim already in the index is a no-op."""
+        self._insert(self.store.features(claim), None)
+
+    def _insert(self, features: ClaimFeatures, keys: list[tuple[int, int]] | None) -> None:
+        digest = hash(features.token_ids)
+        known = self._exact.get(digest)
+        if known is not None and self.store.token_ids(known) == features.token_ids:
+            return
+        ident = self.store.add(features)
+        self._exact.setdefault(digest, ident)
+        for key in keys if keys is not None else self._band_keys(features):
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                self._buckets[key] = ident
+            elif isinstance(bucket, int):
+                self._buckets[key] = [bucket, ident]
+            else:
+                bucket.append(ident)
+
+    def query_and_add(self, claims: list[str]) -> list[tuple[str, float]]:
+        """Match each claim against the claims stored so far, then add them all.
+
+        Claims in the same batch are not matched against each other, which is
+        how `analyze_claim_deduplication` treats claims of one conversation.
+        """
+        pending: list[tuple[ClaimFeatures, list[tuple[int, int]]]] = []
+        matches: list[tuple[str, float]] = []
         for claim in claims:
-            best_previous = ""
+            features = self.store.features(claim)
+            keys = self._band_keys(features)
+            matches.append(self._best(features, keys))
+            pending.append((features, keys))
+        for features, keys in pending:
+            self._insert(features, keys)
+        return matches
+
+
+def _exhaustive_matches(claims: list[str], store: ClaimFeatureStore, *, vectorized: bool) -> list[tuple[str, float]]:
+    """Compare each claim with every stored claim, then store the claims."""
+    queries = [store.features(claim) for claim in claims]
+    if vectorized:
+        best = store.best_matches(queries)
+    else:
+        best = []
+        for features in queries:
+            best_ident = -1
             best_similarity = 0.0
-            for previous in seen_claims:
-                similarity = _claim_similarity(claim, previous)
+            for ident in range(len(store)):
+                similarity = store.similarity(features, ident)
                 if similarity > best_similarity:
                     best_similarity = similarity
-                    best_previous = previous
-
-            if best_similarity >= similarity_threshold:
-                repeated_items.append(
-                    DedupedClaim(
-                        claim=claim,
-                        matched_previous_claim=best_previous,
-                        similarity=round(best_similarity, 3),
-                    )
-                )
-
-        total = len(claims)
-        repeated = len(repeated_items)
-        novel = max(0, total - repeated)
-        ratio = round((repeated / total), 3) if total else 0.0
-        results.append(
-            ConversationClaimDedup(
-                conversation_id=convo.conversation_id,
-                total_claims=total,
-                repeated_claims=repeated,
-                novel_claims=novel,
-                repetition_ratio=ratio,
-                repeated_items=repeated_items,
+                    best_ident = ident
+            best.append((best_ident, best_similarity))
+    for features in queries:
+        store.add(features)
+    return [(store.text(ident), similarity) if ident >= 0 else ("", 0.0) for ident, similarity in best]
+
+
+def _dedup_result(
+    convo: Conversation, claims: list[str], matches: list[tuple[str, float]], threshold: float
+) -> ConversationClaimDedup:
+    repeated_items = [
+        DedupedClaim(claim=claim, matched_previous_claim=previous, similarity=round(similarity, 3))
+        for claim, (previous, similarity) in zip(claims, matches)
+        if similarity >= threshold
+    ]
+    total = len(claims)
+    repeated = len(repeated_items)
+    novel = max(0, total - repeated)
+    ratio = round((repeated / total), 3) if total else 0.0
+    return ConversationClaimDedup(
+        conversation_id=convo.conversation_id,
+        total_claims=total,
+        repeated_claims=repeated,
+        novel_claims=novel,
+        repetition_ratio=ratio,
+        repeated_items=repeated_items,
+    )
+
+
+class ClaimDeduplicator:
+    """Incremental form of `analyze_claim_deduplication`.
+
+    Feed conversations in order to `process`; each is compared with the
+    claims of the conversations processed before it. Only the claim history
+    is kept, so conversations can be streamed from `iter_conversations`.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.85,
+        *,
+        backend: str = "index",
+        index: ClaimIndex | None = None,
+    ) -> None:
+        if backend not in _BACKENDS:
+            raise ValueError(
+                f"Unknown claim deduplication backend {backend!r}; expected one of {', '.join(_BACKENDS)}"
             )
-        )
-        seen_claims.extend(claims)
+        self.similarity_threshold = similarity_threshold
+        self.backend = backend
+        self.index: ClaimIndex | None = None
+        if backend == "index":
+            self.index = index if index is not None else ClaimIndex()
+        self._seen_claims = ClaimFeatureStore()
+
+    def process(self, convo: Conversation) -> ConversationClaimDedup:
+        claims = _extract_claims(convo)
+        if self.index is not None:
+            matches = self.index.query_and_add(claims)
+        else:
+            matches = _exhaustive_matches(claims, self._seen_claims, vectorized=self.backend == "numpy")
+        return _dedup_result(convo, claims, matches, self.similarity_threshold)
+
+
+def analyze_claim_deduplication(
+    conversations: Iterable[Conversation],
+    similarity_threshold: float = 0.85,
+    *,
+    backend: str = "index",
+    index: ClaimIndex | None = None,
+) -> list[ConversationClaimDedup]:
+    """Find agent claims that repeat a claim from an earlier conversation.
+
+    Conversations are processed in order and each claim is compared with the
+    claims of all earlier conversations. `backend` selects how:
 
-    return results
+    - ``"index"`` looks candidates up in a `ClaimIndex` (MinHash/LSH); it
+      scales to hundreds of thousands of conversations but can, rarely,
+      miss a match.
+    - ``"python"`` compares every pair in pure Python.
+    - ``"numpy"`` compares each conversation's claims with the whole history
+      in one vectorized sparse product per chunk of history; it needs NumPy
+      and gives the same results as ``"python"``.
+    """
+    deduplicator = ClaimDeduplicator(similarity_threshold, backend=backend, index=index)
+    return [deduplicator.process(convo) for convo in conversations]
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+from array import array
+from collections import Counter
+from typing import Any
+
+# Token IDs are packed 21 bits apiece into one 64-bit n-gram key, which is
+# exact while the vocabulary has fewer than 2**21 - 1 distinct tokens.
+_ID_BITS = 21
+_ID_LIMIT = (1 << _ID_BITS) - 1
+_MASK_63 = (1 << 63) - 1
+
+
+def _ngram_key(first: int, second: int, third: int) -> int:
+    # IDs are shifted by one so a packed 3-gram (first field >= 1) can never
+    # equal a packed unigram (first two fields zero).
+    if first < _ID_LIMIT and second < _ID_LIMIT and third < _ID_LIMIT:
+        return ((first + 1) << (2 * _ID_BITS)) | ((second + 1) << _ID_BITS) | (third + 1)
+    # Past ~2M distinct tokens, fall back to a hash in the upper half of the key space.
+    return (1 << 63) | (hash((first, second, third)) & _MASK_63)
+
+
+def ngram_keys(token_ids: list[int] | tuple[int, ...], n: int = 3) -> set[int]:
+    """Integer keys of the word n-grams of a token sequence.
+
+    Mirrors `claim_deduplication._ngram_set`: sequences shorter than `n`
+    contribute their unigrams instead.
+    """
+    if n != 3:
+        raise ValueError("only word 3-grams are supported")
+    if len(token_ids) < n:
+        return {token + 1 for token in token_ids}
+    return {_ngram_key(*token_ids[i : i + n]) for i in range(len(token_ids) - n + 1)}
+
+
+class ClaimFeatures:
+    """The comparison features of one claim, as plain Python containers.
+
+    Used for the claim being looked up; stored claims live in the arrays of
+    a `ClaimFeatureStore`.
+    """
+
+    __slots__ = ("token_ids", "ngrams", "counts", "norm")
+
+    def __init__(self, token_ids: tuple[int, ...]) -> None:
+        self.token_ids = token_ids
+        self.ngrams = ngram_keys(token_ids)
+        self.counts = Counter(token_ids)
+        self.norm = sum(v * v for v in self.counts.values()) ** 0.5
+
+
+class ClaimFeatureStore:
+    """Append-only, array-backed features of normalized claims.
+
+    Each claim is tokenized once. Tokens are interned to integer IDs and the
+    claim keeps its token IDs, its set of 3-gram keys, its sparse term
+    vector (sorted term IDs with counts) and the vector's norm. Everything
+    per claim lives in flat `array` buffers addressed by offsets, so a stored
+    claim costs a few bytes per token instead of a set, a `Counter` and a
+    string. The claim text is rebuilt from its token IDs on demand.
+
+    `similarity` compares a `ClaimFeatures` with a stored claim and returns
+    exactly what `_claim_similarity` would for the two texts.
+    """
+
+    def __init__(self) -> None:
+        self._vocabulary: list[str] = []
+        self._token_index: dict[str, int] = {}
+        self._tokens = array("I")
+        self._token_offsets = array("Q", [0])
+        self._ngrams = array("Q")
+        self._ngram_offsets = array("Q", [0])
+        self._terms = array("I")
+        self._counts = array("I")
+        self._term_offsets = array("Q", [0])
+        self._norms = array("d")
+
+    def __len__(self) -> int:
+        return len(self._norms)
+
+    def intern(self, text: str) -> tuple[int, ...]:
+        """Token IDs of a normalized (space-separated) claim, adding new tokens."""
+        index = self._token_index
+        ids: list[int] = []
+        for token in text.split():
+            token_id = index.get(token)
+            if token_id is None:
+                token_id = index[token] = len(self._vocabulary)
+                self._vocabulary.append(token)
+            ids.append(token_id)
+        return tuple(ids)
+
+    def features(self, text: str) -> ClaimFeatures:
+        return ClaimFeatures(self.intern(text))
+
+    def add(self, features: ClaimFeatures) -> int:
+        """Store `features` and return the claim's ID (IDs are consecutive from 0)."""
+        self._tokens.extend(features.token_ids)
+        self._token_offsets.append(len(self._tokens))
+        self._ngrams.extend(sorted(features.ngrams))
+        self._ngram_offsets.append(len(self._ngrams))
+        terms = sorted(features.counts)
+        self._terms.extend(terms)
+        self._counts.extend(features.counts[term] for term in terms)
+        self._term_offsets.append(len(self._terms))
+        self._norms.append(features.norm)
+        return len(self._norms) - 1
+
+    def token_ids(self, ident: int) -> tuple[int, ...]:
+        return tuple(self._tokens[self._token_offsets[ident] : self._token_offsets[ident + 1]])
+
+    def text(self, ident: int) -> str:
+        vocabulary = self._vocabulary
+        return " ".join(vocabulary[token] for token in self.token_ids(ident))
+
+    def similarity(self, query: ClaimFeatures, ident: int) -> float:
+        """Max of 3-gram Jaccard and word-count cosine between `query` and a stored claim."""
+        start, end = self._ngram_offsets[ident], self._ngram_offsets[ident + 1]
+        shared = len(query.ngrams.intersection(self._ngrams[start:end]))
+        union = len(query.ngrams) + (end - start) - shared
+        ngram_sim = shared / union if union else 0.0
+
+        cosine_sim = 0.0
+        norm = self._norms[ident]
+        if query.norm and norm:
+            start, end = self._term_offsets[ident], self._term_offsets[ident + 1]
+            counts = query.counts
+            dot = 0
+            for term, count in zip(self._terms[start:end], self._counts[start:end]):
+                if term in counts:
+                    dot += counts[term] * count
+            cosine_sim = dot / (query.norm * norm)
+        return max(ngram_sim, cosine_sim)
+
+    def best_matches(self, queries: list[ClaimFeatures], *, chunk_rows: int = 65536) -> list[tuple[int, float]]:
+        """Most similar stored claim for each query, computed with NumPy.
+
+        The term buffers already form a CSR matrix (`_terms` are the column
+        indices, `_counts` the values, `_term_offsets` the row pointers), and
+        so do the n-gram keys with implicit ones. For each chunk of stored
+        rows, the entries whose column occurs in any query are gathered and
+        summed per (row, query) with `bincount`, which is the sparse product
+        restricted to the queries' columns. Dot products and n-gram overlaps
+        are exact integers, so the similarities equal `similarity` bit for
+        bit, and ties go to the lowest ID.
+
+        Returns ``(ident, similarity)`` per query, with ident -1 when no
+        stored claim has a positive similarity.
+        """
+        import numpy as np  # type: ignore
+
+        best = [(-1, 0.0)] * len(queries)
+        if not queries or not len(self):
+            return best
+
+        def query_columns(columns: list[dict[int, int]]) -> tuple[Any, Any]:
+            keys = np.array(sorted({key for column in columns for key in column}), dtype=np.uint64)
+            weights = np.zeros((len(keys), len(columns)), dtype=np.float64)
+            position = {int(key): index for index, key in enumerate(keys)}
+            for query_index, column in enumerate(columns):
+                for key, value in column.items():
+                    weights[position[key], query_index] = value
+            return keys, weights
+
+        def overlap(keys: Any, weights: Any, values: Any, row_lengths: Any, stored: Any, rows: int) -> Any:
+            """``(rows, queries)`` sums of stored value * query weight over shared columns."""
+            sums = np.zeros((rows, weights.shape[1]))
+            if not len(keys):
+                return sums
+            hit = np.isin(stored, keys)
+            row_ids = np.repeat(np.arange(rows), row_lengths)[hit]
+            hit_weights = weights[np.searchsorted(keys, stored[hit])]
+            if values is not None:
+                hit_weights = hit_weights * values[hit][:, None]
+            for query_index in range(weights.shape[1]):
+                sums[:, query_index] = np.bincount(row_ids, weights=hit_weights[:, query_index], minlength=rows)
+            return sums
+
+        ngram_keys_q, ngram_weights = query_columns([dict.fromkeys(query.ngrams, 1) for query in queries])
+        term_keys_q, term_weights = query_columns([dict(query.counts) for query in queries])
+        query_ngrams = np.array([len(query.ngrams) for query in queries], dtype=np.float64)
+        query_norms = np.array([query.norm for query in queries], dtype=np.float64)
+
+        for first in range(0, len(self), chunk_rows):
+            last = min(first + chunk_rows, len(self))
+            rows = last - first
+            ngram_bounds = np.frombuffer(self._ngram_offsets[first : last + 1], dtype=np.uint64).astype(np.int64)
+            term_bounds = np.frombuffer(self._term_offsets[first : last + 1], dtype=np.uint64).astype(np.int64)
+            ngram_lengths = np.diff(ngram_bounds)
+            stored_ngrams = np.frombuffer(self._ngrams[ngram_bounds[0] : ngram_bounds[-1]], dtype=np.uint64)
+            stored_terms = np.frombuffer(self._terms[term_bounds[0] : term_bounds[-1]], dtype=np.uint32)
+            stored_counts = np.frombuffer(self._counts[term_bounds[0] : term_bounds[-1]], dtype=np.uint32)
+            norms = np.frombuffer(self._norms[first:last], dtype=np.float64)
+
+            shared = overlap(ngram_keys_q, ngram_weights, None, ngram_lengths, stored_ngrams, rows)
+            union = query_ngrams[None, :] + ngram_lengths[:, None] - shared
+            ngram_sim = np.divide(shared, union, out=np.zeros_like(shared), where=union > 0)
+
+            dot = overlap(
+                term_keys_q.astype(np.uint32), term_weights, stored_counts, np.diff(term_bounds), stored_terms, rows
+            )
+            scale = query_norms[None, :] * norms[:, None]
+            cosine_sim = np.divide(dot, scale, out=np.zeros_like(dot), where=scale > 0)
+
+            similarity = np.maximum(ngram_sim, cosine_sim)
+            winners = similarity.argmax(axis=0)
+            for query_index, row in enumerate(winners.tolist()):
+                value = float(similarity[row, query_index])
+                if value > best[query_index][1]:
+                    best[query_index] = (first + row, value)
+        return best
+
+    def nbytes(self) -> int:
+        """Bytes held by the per-claim arrays (excluding the vocabulary)."""
+        buffers = (
+            self._tokens,
+            self._token_offsets,
+            self._ngrams,
+            self._ngram_offsets,
+            self._terms,
+            self._counts,
+            self._term_offsets,
+            self._norms,
+        )
+        return sum(buffer.itemsize * len(buffer) for buffer in buffers)
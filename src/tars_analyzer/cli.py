@@ -2,19 +2,42 @@ from __future__ import annotations
 
 import argparse
 
-from .analyzer import analyze_conversations
-
 
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Analyze ordered LLM-human conversations with Gemini to assess whether the same agent is self-improving over time."
     )
-    parser.add_argument("input", help="Path to JSONL conversations file")
+    parser.add_argument("input", help="Path to JSONL conversations file (optionally gzip- or zstd-compressed)")
     parser.add_argument("--out", default="output", help="Directory for report files")
     parser.add_argument("--model", default="gemini-2.0-flash", help="Gemini model name")
+    parser.add_argument(
+        "--dedup-backend",
+        choices=("index", "python", "numpy"),
+        default="index",
+        help="Claim deduplication backend: MinHash/LSH index, exhaustive pure Python, or exhaustive NumPy",
+    )
+    parser.add_argument(
+        "--skip-progression",
+        action="store_true",
+        help="Skip the Gemini progression evaluation and stream the input with bounded memory",
+    )
+    parser.add_argument(
+        "--assume-sorted",
+        action="store_true",
+        help="Input is already ordered by timestamp; skip the external sort",
+    )
     args = parser.parse_args()
 
-    report = analyze_conversations(args.input, args.out, model=args.model)
+    from .analyzer import analyze_conversations
+
+    report = analyze_conversations(
+        args.input,
+        args.out,
+        model=args.model,
+        dedup_backend=args.dedup_backend,
+        evaluate_progression=not args.skip_progression,
+        assume_sorted=args.assume_sorted,
+    )
     print(
         "Done. "
         f"Trajectory={report['trajectory']['label']} "
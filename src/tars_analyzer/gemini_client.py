@@ -11,6 +11,7 @@ from .models import (
     GeminiEvaluation,
     ProgressionEvaluation,
     TurnDimensionEvaluation,
+    TurnScoreTable,
 )
 
 
@@ -102,7 +103,7 @@ Return STRICT JSON with keys:
   - notes: short string explaining why this item is stronger/weaker
   - turn_dimension_scores: array with one item per turn in the same order as the transcript
     each turn item must contain:
-      - turn_index: integer
+      - turn_index: integer, the 0-based position of the turn in the transcript
       - role: string
       - content: string
       - helpfulness: {{score, justification, error_flag?}}
@@ -128,9 +129,11 @@ Conversations (ordered by time):
         )
 
         data: dict[str, Any] = json.loads(response.text)
+        turns_by_id = {convo.conversation_id: convo.turns for convo in ordered}
         per_conversation = []
         for item in data.get("per_conversation", []):
-            turns = []
+            # The model echoes each turn's content; the table keeps only echoes that differ from the source turn.
+            turns = TurnScoreTable(turns=turns_by_id.get(str(item["conversation_id"]), ()))
             for turn in item.get("turn_dimension_scores", []):
                 turns.append(
                     TurnDimensionEvaluation(
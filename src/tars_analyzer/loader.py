@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import gzip
+import heapq
+import io
+import json
+import tempfile
+from contextlib import ExitStack
+from datetime import datetime
+from operator import itemgetter
+from pathlib import Path
+from typing import IO, Iterable, Iterator
+
+from .models import Conversation, Turn
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Raw JSONL held in memory per sorted run before it is spilled to disk.
+DEFAULT_RUN_BYTES = 64 * 1024 * 1024
+
+
+def _parse_timestamp(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def parse_conversation(data: dict) -> Conversation:
+    return Conversation(
+        conversation_id=data["conversation_id"],
+        timestamp=_parse_timestamp(data["timestamp"]),
+        turns=[Turn(**turn) for turn in data["turns"]],
+        metadata=data.get("metadata", {}),
+    )
+
+
+def open_jsonl(path: str | Path) -> IO[str]:
+    """Open a JSONL file for text reading, decompressing gzip or zstd by magic bytes.
+
+    zstd needs Python 3.14's `compression.zstd` or the `zstandard` package.
+    """
+    path = Path(path)
+    with path.open("rb") as probe:
+        magic = probe.read(4)
+    if magic.startswith(_GZIP_MAGIC):
+        return gzip.open(path, "rt", encoding="utf-8")
+    if magic == _ZSTD_MAGIC:
+        try:
+            from compression import zstd  # type: ignore
+        except ImportError:
+            pass
+        else:
+            return zstd.open(path, "rt", encoding="utf-8")
+        try:
+            import zstandard  # type: ignore
+        except ImportError as exc:
+            raise ImportError(f"Reading zstd-compressed {path} requires the 'zstandard' package.") from exc
+        raw = zstandard.ZstdDecompressor().stream_reader(path.open("rb"), closefd=True)
+        return io.TextIOWrapper(raw, encoding="utf-8")
+    return path.open(encoding="utf-8")
+
+
+def _records(path: str | Path) -> Iterator[str]:
+    with open_jsonl(path) as handle:
+        for line in handle:
+            line = line.strip()
+            if line:
+                yield line
+
+
+def _write_run(run: list[tuple[datetime, str]], directory: str, number: int) -> Path:
+    run.sort(key=itemgetter(0))
+    path = Path(directory) / f"run-{number:05d}.jsonl"
+    with path.open("w", encoding="utf-8") as handle:
+        for timestamp, line in run:
+            handle.write(f"{timestamp.isoformat()}\t{line}\n")
+    return path
+
+
+def _read_run(handle: IO[str]) -> Iterator[tuple[datetime, str]]:
+    for row in handle:
+        timestamp, line = row.rstrip("\n").split("\t", 1)
+        yield datetime.fromisoformat(timestamp), line
+
+
+def _sorted_records(
+    lines: Iterable[str], *, run_bytes: int, temp_dir: str | Path | None
+) -> Iterator[tuple[datetime, str]]:
+    """Sort JSONL records by timestamp, spilling sorted runs to disk and merging them.
+
+    Both the in-run sort and `heapq.merge` are stable, so records with equal
+    timestamps keep their file order, as with `sorted`.
+    """
+    with ExitStack() as stack:
+        directory: str | None = None
+        runs: list[Path] = []
+        run: list[tuple[datetime, str]] = []
+        size = 0
+        for line in lines:
+            run.append((_parse_timestamp(json.loads(line)["timestamp"]), line))
+            size += len(line)
+            if size >= run_bytes:
+                if directory is None:
+                    directory = stack.enter_context(tempfile.TemporaryDirectory(prefix="tars-sort-", dir=temp_dir))
+                runs.append(_write_run(run, directory, len(runs)))
+                run, size = [], 0
+        if not runs:
+            run.sort(key=itemgetter(0))
+            yield from run
+            return
+        if run:
+            runs.append(_write_run(run, directory, len(runs)))
+        del run
+        handles = [stack.enter_context(path.open(encoding="utf-8")) for path in runs]
+        yield from heapq.merge(*(_read_run(handle) for handle in handles), key=itemgetter(0))
+
+
+def iter_conversations(
+    path: str | Path,
+    *,
+    sort: bool = True,
+    run_bytes: int = DEFAULT_RUN_BYTES,
+    temp_dir: str | Path | None = None,
+) -> Iterator[Conversation]:
+    """Yield conversations from a JSONL file (plain, gzip or zstd) one at a time.
+
+    With ``sort=True`` conversations come out ordered by timestamp. Inputs
+    larger than `run_bytes` are sorted externally: sorted runs are written to
+    a temporary directory (under `temp_dir`) and merged, so memory stays
+    bounded by `run_bytes` whatever the file size. Pass ``sort=False`` for
+    input that is already ordered to read it in a single pass.
+    """
+    lines = _records(path)
+    if not sort:
+        for line in lines:
+            yield parse_conversation(json.loads(line))
+        return
+    for _timestamp, line in _sorted_records(lines, run_bytes=run_bytes, temp_dir=temp_dir):
+        yield parse_conversation(json.loads(line))
+
+
+def load_conversations(path: str | Path) -> list[Conversation]:
+    return list(iter_conversations(path))
@@ -1,16 +1,24 @@
 from __future__ import annotations
 
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import overload
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Turn:
     role: str
     content: str
 
+    def __post_init__(self) -> None:
+        # A handful of role names repeat across millions of turns.
+        object.__setattr__(self, "role", sys.intern(self.role))
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Conversation:
     conversation_id: str
     timestamp: datetime
@@ -18,14 +26,14 @@ class Conversation:
     metadata: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DimensionScore:
     score: float
     justification: str
     error_flag: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TurnDimensionEvaluation:
     turn_index: int
     role: str
@@ -40,7 +48,108 @@ class TurnDimensionEvaluation:
     specificity: DimensionScore
 
 
-@dataclass
+DIMENSIONS = (
+    "helpfulness",
+    "factual_accuracy",
+    "instruction_following",
+    "coherence",
+    "depth_of_reasoning",
+    "safety_awareness",
+    "hallucination_likelihood",
+    "specificity",
+)
+
+
+class TurnScoreTable(Sequence[TurnDimensionEvaluation]):
+    """Per-turn dimension scores of one conversation, stored column by column.
+
+    Scores live in one `array` per dimension and justifications in one list
+    per dimension; error flags, which are rare, are kept sparsely. Turn
+    content is not copied when it can be recovered: if the table is built
+    with the conversation's `turns` and an evaluation's content equals that
+    of ``turns[turn_index]`` (0-based), it is read back from the turn.
+    Content that differs, e.g. because the evaluator numbered turns from 1,
+    is stored as given, so rows never pick up another turn's text.
+
+    Indexing returns a `TurnDimensionEvaluation` rebuilt from the columns,
+    so the table can stand in for a list of evaluations.
+    """
+
+    __slots__ = ("_turns", "_turn_index", "_roles", "_scores", "_justifications", "_error_flags", "_content")
+
+    def __init__(self, evaluations: Iterable[TurnDimensionEvaluation] = (), *, turns: Sequence[Turn] = ()) -> None:
+        self._turns = turns
+        self._turn_index = array("i")
+        self._roles: list[str] = []
+        self._scores = {name: array("d") for name in DIMENSIONS}
+        self._justifications: dict[str, list[str]] = {name: [] for name in DIMENSIONS}
+        self._error_flags: dict[tuple[int, str], str] = {}
+        self._content: dict[int, str] = {}
+        for evaluation in evaluations:
+            self.append(evaluation)
+
+    def append(self, evaluation: TurnDimensionEvaluation) -> None:
+        row = len(self._turn_index)
+        index = evaluation.turn_index
+        self._turn_index.append(index)
+        self._roles.append(sys.intern(evaluation.role))
+        if not (0 <= index < len(self._turns) and self._turns[index].content == evaluation.content):
+            self._content[row] = evaluation.content
+        for name in DIMENSIONS:
+            score: DimensionScore = getattr(evaluation, name)
+            self._scores[name].append(score.score)
+            self._justifications[name].append(score.justification)
+            if score.error_flag is not None:
+                self._error_flags[(row, name)] = score.error_flag
+
+    def __len__(self) -> int:
+        return len(self._turn_index)
+
+    @overload
+    def __getitem__(self, row: int) -> TurnDimensionEvaluation: ...
+
+    @overload
+    def __getitem__(self, row: slice) -> list[TurnDimensionEvaluation]: ...
+
+    def __getitem__(self, row: int | slice) -> TurnDimensionEvaluation | list[TurnDimensionEvaluation]:
+        if isinstance(row, slice):
+            return [self[i] for i in range(*row.indices(len(self)))]
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("turn score row out of range")
+        index = self._turn_index[row]
+        content = self._content.get(row)
+        if content is None:
+            content = self._turns[index].content
+        dimensions = {
+            name: DimensionScore(
+                score=self._scores[name][row],
+                justification=self._justifications[name][row],
+                error_flag=self._error_flags.get((row, name)),
+            )
+            for name in DIMENSIONS
+        }
+        return TurnDimensionEvaluation(turn_index=index, role=self._roles[row], content=content, **dimensions)
+
+    def __iter__(self) -> Iterator[TurnDimensionEvaluation]:
+        for row in range(len(self)):
+            yield self[row]
+
+    def scores(self, dimension: str) -> array:
+        """The column of scores for one dimension (a view; do not modify)."""
+        return self._scores[dimension]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (TurnScoreTable, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"TurnScoreTable({len(self)} turns)"
+
+
+@dataclass(slots=True)
 class GeminiEvaluation:
     helpfulness: float
     correctness: float
@@ -50,17 +159,18 @@ class GeminiEvaluation:
     notes: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationProgress:
     conversation_id: str
     rank: int
     overall_agent_quality: float
     improvement_vs_previous: float
     notes: str
-    turn_dimension_scores: list[TurnDimensionEvaluation] = field(default_factory=list)
+    # A list of evaluations or, as produced by `GeminiEvaluator`, a `TurnScoreTable`.
+    turn_dimension_scores: Sequence[TurnDimensionEvaluation] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProgressionEvaluation:
     overall_summary: str
     trajectory_label: str
@@ -68,7 +178,7 @@ class ProgressionEvaluation:
     per_conversation: list[ConversationProgress]
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationAnalysis:
     conversation_id: str
     timestamp: datetime
@@ -76,14 +186,14 @@ class ConversationAnalysis:
     basic_metrics: dict
 
 
-@dataclass
+@dataclass(slots=True)
 class DedupedClaim:
     claim: str
     matched_previous_claim: str
     similarity: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationClaimDedup:
     conversation_id: str
     total_claims: int
@@ -98,6 +208,8 @@ __all__ = [
     "Conversation",
     "DimensionScore",
     "TurnDimensionEvaluation",
+    "DIMENSIONS",
+    "TurnScoreTable",
     "GeminiEvaluation",
     "ConversationProgress",
     "ProgressionEvaluation",
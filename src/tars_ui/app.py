@@ -2,18 +2,25 @@ from __future__ import annotations
 
 import html
 import json
+import os
 import tempfile
 import urllib.parse
 from dataclasses import asdict
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
+from tars.server import RemoteClient
+from tars.settings import REMOTE_ENV
+from tars.validators.research.math.conversion_cache import ConversionCache
 from tars.validators.research.math.math_converter import MathConverter
 from tars.validators.research.math.math_extractor import MathExtractor
 from tars_ui.arxiv import download_arxiv_source, extract_source_tar, parse_arxiv_id, pick_main_tex
 
 
 class TarsUIHandler(BaseHTTPRequestHandler):
+    conversion_cache: ConversionCache | None = None
+    remote: RemoteClient | None = None
+
     def _build_hints_panel(self, result: dict) -> str:
         converter = result.get("converter_dict") or {}
         conversions = converter.get("metadata", {}).get("conversions", [])
@@ -121,8 +128,13 @@ class TarsUIHandler(BaseHTTPRequestHandler):
                 source_dir = extract_source_tar(tar_path, base / "src")
                 main_tex = pick_main_tex(source_dir)
 
-                extractor_result = MathExtractor().validate(main_tex)
-                converter_result = MathConverter().validate(main_tex)
+                if self.remote is not None:
+                    extractor_result, converter_result = self.remote.validate(
+                        main_tex, ["math_extractor", "math_converter"]
+                    )
+                else:
+                    extractor_result = MathExtractor().validate(main_tex)
+                    converter_result = MathConverter(cache=self.conversion_cache).validate(main_tex)
 
                 result = {
                     "main_tex": str(main_tex),
@@ -142,6 +154,11 @@ class TarsUIHandler(BaseHTTPRequestHandler):
 
 
 def main() -> None:
+    # Opt-in persistent conversion cache shared with the CLI via $TARS_CACHE_DIR.
+    TarsUIHandler.conversion_cache = ConversionCache.from_env()
+    # With $TARS_REMOTE set, validation runs on a warm `tars serve` daemon.
+    remote = os.environ.get(REMOTE_ENV)
+    TarsUIHandler.remote = RemoteClient(remote) if remote else None
     server = ThreadingHTTPServer(("0.0.0.0", 8000), TarsUIHandler)
     server.serve_forever()
 
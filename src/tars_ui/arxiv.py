@@ -5,6 +5,8 @@ import tarfile
 import urllib.request
 from pathlib import Path
 
+from tars.validators.project import find_main_tex
+
 
 def parse_arxiv_id(url_or_id: str) -> str:
     value = url_or_id.strip()
@@ -34,7 +36,4 @@ def extract_source_tar(tar_path: Path, destination: Path) -> Path:
 
 
 def pick_main_tex(source_dir: Path) -> Path:
-    tex_files = list(source_dir.rglob("*.tex"))
-    if not tex_files:
-        raise FileNotFoundError("No .tex files found in arXiv source")
-    return max(tex_files, key=lambda p: p.stat().st_size)
+    return find_main_tex(source_dir)
@@ -1,20 +1,32 @@
 from __future__ import annotations
 
+import importlib.util
 import json
+import random
 import sys
 import tempfile
 import unittest
+from dataclasses import FrozenInstanceError, replace
 from pathlib import Path
+from types import SimpleNamespace
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
+from datetime import datetime, timedelta
+
 from tars_analyzer import analyzer
+from tars_analyzer.claim_deduplication import ClaimIndex, _claim_similarity, analyze_claim_deduplication
+from tars_analyzer.claim_features import ClaimFeatureStore
 from tars_analyzer.gemini_client import GeminiEvaluator
 from tars_analyzer.models import (
+    DIMENSIONS,
+    Conversation,
     ConversationProgress,
     DimensionScore,
     ProgressionEvaluation,
+    Turn,
     TurnDimensionEvaluation,
+    TurnScoreTable,
 )
 
 
@@ -163,11 +175,297 @@ class AnalyzerTests(unittest.TestCase):
                 0,
             )
 
+    def test_streaming_report_without_progression(self):
+        claim = "Document the rationale and list concrete next steps for implementation."
+        records = [
+            {"conversation_id": name, "timestamp": timestamp, "turns": [{"role": "agent", "content": claim}]}
+            for name, timestamp in (("late", "2025-01-02T00:00:00Z"), ("early", "2025-01-01T00:00:00Z"))
+        ]
+
+        with tempfile.TemporaryDirectory() as td:
+            input_path = Path(td) / "conversations.jsonl"
+            input_path.write_text("\n".join(json.dumps(record) for record in records))
+
+            original = analyzer.GeminiEvaluator
+            analyzer.GeminiEvaluator = None
+            try:
+                report = analyzer.analyze_conversations(input_path, Path(td) / "out", evaluate_progression=False)
+            finally:
+                analyzer.GeminiEvaluator = original
+
+            self.assertNotIn("analyses", report)
+            self.assertEqual(2, report["conversation_count"])
+            self.assertEqual("not_evaluated", report["trajectory"]["label"])
+            self.assertEqual(1, report["knowledge_retention_proxy"]["total_repeated_claims"])
+            written = json.loads((Path(td) / "out" / "report.json").read_text())
+            streamed = [json.loads(line) for line in (Path(td) / "out" / "analyses.jsonl").read_text().splitlines()]
+            self.assertEqual(written["analyses"], streamed)
+            self.assertEqual(["early", "late"], [item["conversation_id"] for item in streamed])
+            self.assertIsNone(streamed[0]["progression"])
+            self.assertEqual(1, streamed[1]["claim_deduplication"]["repeated_claims"])
+
+    def test_assume_sorted_keeps_file_order_with_progression(self):
+        records = [
+            {"conversation_id": name, "timestamp": timestamp, "turns": [{"role": "human", "content": "help"}]}
+            for name, timestamp in (("late", "2025-01-02T00:00:00Z"), ("early", "2025-01-01T00:00:00Z"))
+        ]
+
+        with tempfile.TemporaryDirectory() as td:
+            input_path = Path(td) / "conversations.jsonl"
+            input_path.write_text("\n".join(json.dumps(record) for record in records))
+
+            original = analyzer.GeminiEvaluator
+            analyzer.GeminiEvaluator = FakeEvaluator
+            try:
+                sorted_report = analyzer.analyze_conversations(input_path, Path(td) / "sorted")
+                as_is = analyzer.analyze_conversations(input_path, Path(td) / "as_is", assume_sorted=True)
+            finally:
+                analyzer.GeminiEvaluator = original
+
+        self.assertEqual(["early", "late"], [item["conversation_id"] for item in sorted_report["analyses"]])
+        self.assertEqual(["late", "early"], [item["conversation_id"] for item in as_is["analyses"]])
+
     def test_score_bounds_validation(self):
         self.assertEqual(GeminiEvaluator._bounded_score(8), 8.0)
         with self.assertRaises(ValueError):
             GeminiEvaluator._bounded_score(11)
 
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+def _conversation(index: int, *claims: str) -> Conversation:
+    return Conversation(
+        conversation_id=f"conv-{index}",
+        timestamp=datetime(2025, 1, 1) + timedelta(days=index),
+        turns=[Turn(role="agent", content=". ".join(claims))],
+    )
+
+
+def _evaluation(index: int, content: str, *, flag: str | None = None) -> TurnDimensionEvaluation:
+    scores = {
+        name: DimensionScore(score=index + position / 10, justification=f"{name} {index}", error_flag=flag)
+        for position, name in enumerate(DIMENSIONS)
+    }
+    return TurnDimensionEvaluation(turn_index=index, role="agent", content=content, **scores)
+
+
+class ModelTests(unittest.TestCase):
+    def test_models_are_slotted_and_frozen(self):
+        turn = Turn(role="".join(["ag", "ent"]), content="hello")
+
+        self.assertIs(sys.intern("agent"), turn.role)
+        self.assertFalse(hasattr(turn, "__dict__"))
+        with self.assertRaises(FrozenInstanceError):
+            turn.content = "changed"
+
+    def test_turn_score_table_round_trips_without_copying_content(self):
+        turns = [Turn(role="human", content="question"), Turn(role="agent", content="answer")]
+        evaluations = [
+            _evaluation(0, "question"),
+            _evaluation(1, "answer", flag="unsupported claim"),
+            _evaluation(5, "turn the model invented"),
+        ]
+
+        table = TurnScoreTable(evaluations, turns=turns)
+
+        self.assertEqual(evaluations, list(table))
+        self.assertEqual(table, evaluations)
+        self.assertEqual(evaluations[-1], table[-1])
+        self.assertEqual(evaluations[1:], table[1:])
+        self.assertEqual([0.0, 1.0, 5.0], list(table.scores("helpfulness")))
+        self.assertEqual({2: "turn the model invented"}, table._content)
+        self.assertEqual(8, len(table._error_flags))
+        with self.assertRaises(IndexError):
+            table[3]
+
+    def test_turn_score_table_keeps_content_of_misnumbered_turns(self):
+        turns = [Turn(role="user", content="question A"), Turn(role="agent", content="answer B")]
+        evaluations = [
+            replace(_evaluation(1, "question A"), role="user"),
+            _evaluation(2, "answer B"),
+        ]
+
+        table = TurnScoreTable(evaluations, turns=turns)
+
+        self.assertEqual(
+            [(1, "user", "question A"), (2, "agent", "answer B")],
+            [(row.turn_index, row.role, row.content) for row in table],
+        )
+        self.assertEqual({0: "question A", 1: "answer B"}, table._content)
+
+    def test_progression_results_use_a_score_table(self):
+        conversation = Conversation(
+            conversation_id="conv-0",
+            timestamp=datetime(2025, 1, 1),
+            turns=[Turn(role="human", content="question"), Turn(role="agent", content="answer")],
+        )
+        score = {"score": 7, "justification": "ok"}
+        reply = {
+            "overall_summary": "fine",
+            "trajectory_label": "flat",
+            "trajectory_confidence": 5,
+            "per_conversation": [
+                {
+                    "conversation_id": "conv-0",
+                    "rank": 1,
+                    "overall_agent_quality": 7,
+                    "improvement_vs_previous": 0,
+                    "turn_dimension_scores": [
+                        {"turn_index": i, "role": t.role, "content": t.content, **dict.fromkeys(DIMENSIONS, score)}
+                        for i, t in enumerate(conversation.turns)
+                    ],
+                }
+            ],
+        }
+        evaluator = GeminiEvaluator.__new__(GeminiEvaluator)
+        evaluator.model = "test"
+        evaluator._types = SimpleNamespace(GenerateContentConfig=lambda **kwargs: kwargs)
+        evaluator.client = SimpleNamespace(
+            models=SimpleNamespace(generate_content=lambda **kwargs: SimpleNamespace(text=json.dumps(reply)))
+        )
+
+        (progress,) = evaluator.evaluate_progression([conversation]).per_conversation
+
+        self.assertIsInstance(progress.turn_dimension_scores, TurnScoreTable)
+        self.assertEqual({}, progress.turn_dimension_scores._content)
+        payload = analyzer._progress_dict(progress)
+        self.assertEqual(["question", "answer"], [item["content"] for item in payload["turn_dimension_scores"]])
+        self.assertEqual(7.0, payload["turn_dimension_scores"][1]["specificity"]["score"])
+        json.dumps(payload)
+
+
+class ClaimFeatureStoreTests(unittest.TestCase):
+    CLAIMS = [
+        "the cache stores every converted equation on disk",
+        "every converted equation the cache stores on disk",
+        "the the cache cache stores stores",
+        "short claim",
+        "one",
+        "",
+    ]
+
+    def test_similarity_matches_string_comparison(self):
+        store = ClaimFeatureStore()
+        for claim in self.CLAIMS:
+            store.add(store.features(claim))
+
+        for ident, stored in enumerate(self.CLAIMS):
+            self.assertEqual(stored, store.text(ident))
+            for claim in self.CLAIMS:
+                with self.subTest(stored=stored, claim=claim):
+                    self.assertEqual(_claim_similarity(claim, stored), store.similarity(store.features(claim), ident))
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy not installed")
+    def test_vectorized_best_matches_equal_pairwise_comparison(self):
+        store = ClaimFeatureStore()
+        for claim in self.CLAIMS * 2:
+            store.add(store.features(claim))
+        queries = [store.features(claim) for claim in [*self.CLAIMS, "nothing in common here"]]
+
+        expected = []
+        for query in queries:
+            scores = [store.similarity(query, ident) for ident in range(len(store))]
+            best = max(scores)
+            expected.append((scores.index(best), best) if best > 0 else (-1, 0.0))
+
+        self.assertEqual(expected, store.best_matches(queries))
+        self.assertEqual(expected, store.best_matches(queries, chunk_rows=3))
+
+    def test_tokens_are_interned_once(self):
+        store = ClaimFeatureStore()
+        first = store.features("alpha beta gamma alpha")
+        second = store.features("gamma beta alpha")
+
+        self.assertEqual((0, 1, 2, 0), first.token_ids)
+        self.assertEqual((2, 1, 0), second.token_ids)
+        self.assertEqual(0, store.nbytes() - ClaimFeatureStore().nbytes())
+
+
+class ClaimIndexTests(unittest.TestCase):
+    def test_matches_exhaustive_comparison(self):
+        rng = random.Random(7)
+        vocab = [f"term{i}" for i in range(400)]
+        templates = [" ".join(rng.choice(vocab) for _ in range(rng.randint(5, 14))) for _ in range(60)]
+
+        def variant(template: str) -> str:
+            words = template.split()
+            roll = rng.random()
+            if roll < 0.3:
+                words[rng.randrange(len(words))] = rng.choice(vocab)
+            elif roll < 0.5:
+                rng.shuffle(words)
+            return " ".join(words)
+
+        conversations = [
+            _conversation(i, *(variant(rng.choice(templates)) for _ in range(rng.randint(0, 4))))
+            for i in range(150)
+        ]
+
+        indexed = analyze_claim_deduplication(conversations)
+
+        self.assertEqual(indexed, analyze_claim_deduplication(conversations, backend="python"))
+        self.assertGreater(sum(item.repeated_claims for item in indexed), 100)
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy not installed")
+    def test_numpy_backend_matches_python_backend(self):
+        rng = random.Random(3)
+        vocab = [f"term{i}" for i in range(50)]
+        templates = [[rng.choice(vocab) for _ in range(rng.randint(5, 9))] for _ in range(10)]
+        conversations = [
+            _conversation(i, *(" ".join(rng.sample(words, len(words))) for words in rng.sample(templates, 3)))
+            for i in range(40)
+        ]
+
+        expected = analyze_claim_deduplication(conversations, backend="python")
+
+        self.assertEqual(expected, analyze_claim_deduplication(conversations, backend="numpy"))
+        self.assertGreater(sum(item.repeated_claims for item in expected), 0)
+
+    def test_unknown_backend_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, "Unknown claim deduplication backend"):
+            analyze_claim_deduplication([], backend="scipy")
+
+    def test_word_order_and_single_word_changes_are_found(self):
+        index = ClaimIndex()
+        index.add("the cache stores every converted equation on disk")
+        index.add("retries use exponential backoff with random jitter")
+
+        previous, similarity = index.query("every converted equation the cache stores on disk")
+        self.assertEqual("the cache stores every converted equation on disk", previous)
+        self.assertAlmostEqual(1.0, similarity)
+        previous, similarity = index.query("the cache stores every parsed equation on disk")
+        self.assertEqual("the cache stores every converted equation on disk", previous)
+        self.assertGreaterEqual(similarity, 0.85)
+        self.assertEqual(("", 0.0), index.query("completely unrelated words about something else entirely"))
+
+    def test_repeated_words_count_towards_the_word_signature(self):
+        stored = "data data data data data data data data alpha beta"
+        query = "data data data data data data data data gamma delta"
+        index = ClaimIndex()
+        index.add(stored)
+
+        self.assertGreater(_claim_similarity(stored, query), 0.95)
+        self.assertEqual((stored, _claim_similarity(stored, query)), index.query(query))
+
+    def test_claims_of_one_conversation_do_not_match_each_other(self):
+        claim = "the validator rejects equations without an equals sign"
+        index = ClaimIndex()
+
+        self.assertEqual([("", 0.0), ("", 0.0)], index.query_and_add([claim, claim]))
+        self.assertEqual([(claim, 1.0)], index.query_and_add([claim]))
+        self.assertEqual(1, len(index))
+
+    def test_pure_python_signatures_match_numpy(self):
+        index = ClaimIndex()
+        shingles = {1, 2, 3, (1 << 63) | 12345}
+        if index._numpy is None:
+            self.skipTest("numpy not installed")
+
+        expected = index._signature(shingles)
+        index._numpy = None
+
+        self.assertEqual(expected, index._signature(shingles))
+
 
 if __name__ == "__main__":
     unittest.main()
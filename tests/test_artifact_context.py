@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tars.validators import ArtifactContext, ValidationEngine
+from tars.validators.research.citations import CitationValidator
+from tars.validators.research.math.lean_exporter import LeanExportValidator
+from tars.validators.research.math.math_converter import MathConverter
+from tars.validators.research.math.math_extractor import MathExtractor
+from tars.validators.research.math.math_validator import MathValidator
+
+
+class ArtifactContextTests(unittest.TestCase):
+    def test_context_is_lazy_and_cached(self):
+        context = ArtifactContext(Path("examples/latex/sample_math.tex"))
+
+        with patch.object(Path, "read_bytes", autospec=True, side_effect=Path.read_bytes) as read_bytes:
+            self.assertEqual(0, read_bytes.call_count)
+            equations = context.equations
+            self.assertEqual(5, len(equations))
+            self.assertIs(equations, context.equations)
+            self.assertEqual((context.path, 1, 1), context.locate(0))
+
+        self.assertEqual(1, read_bytes.call_count)
+
+    def test_path_shim_matches_context_validation(self):
+        tex_path = Path("examples/latex/sample_math.tex")
+
+        by_path = MathExtractor().validate(tex_path)
+        by_context = MathExtractor().validate_context(ArtifactContext(tex_path))
+
+        self.assertEqual(by_path.to_dict(), by_context.to_dict())
+
+    def test_engine_reads_and_parses_paper_once_for_full_suite(self):
+        with tempfile.TemporaryDirectory() as td:
+            tex_path = Path(td) / "paper.tex"
+            shutil.copy("examples/latex/sample_math.tex", tex_path)
+
+            engine = ValidationEngine()
+            engine.register_validators(
+                [MathExtractor(), MathConverter(), MathValidator(), LeanExportValidator(), CitationValidator()]
+            )
+
+            with patch.object(Path, "read_bytes", autospec=True, side_effect=Path.read_bytes) as read_bytes, patch.object(
+                MathExtractor, "extract_text", autospec=True, side_effect=MathExtractor.extract_text
+            ) as extract_text:
+                results = engine.run(tex_path)
+
+        self.assertEqual(5, len(results))
+        self.assertEqual(1, read_bytes.call_count)
+        self.assertEqual(1, extract_text.call_count)
+
+    def test_process_executor_matches_serial_results(self):
+        engine = ValidationEngine()
+        engine.register_validators([MathExtractor(), MathConverter(), CitationValidator()])
+        tex_path = Path("examples/latex/sample_math.tex")
+
+        serial = engine.run(tex_path)
+        parallel = engine.run(tex_path, executor="processes", max_workers=3)
+
+        def _strip_timing(result):
+            payload = result.to_dict()
+            payload["metadata"].pop("wall_time_seconds")
+            return payload
+
+        self.assertEqual([_strip_timing(r) for r in serial], [_strip_timing(r) for r in parallel])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tars.validators.research.citations.arxiv_batch import (
+    ArxivBatchResolver,
+    ArxivQueryError,
+    ArxivRecord,
+    parse_atom_feed,
+    split_version,
+)
+from tars.validators.research.citations.resolution_cache import ResolutionCache
+from tars.validators.research.citations.resolver import CitationResolver
+
+FIXTURE = Path(__file__).resolve().parent / "fixtures" / "arxiv_id_list.atom"
+
+ERROR_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <id>http://arxiv.org/api/errors#incorrect_id_format_for_1234</id>
+    <title>Error</title>
+    <summary>incorrect id format for 1234</summary>
+  </entry>
+</feed>
+"""
+
+
+class _AtomHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        server = self.server
+        query = parse_qs(urlsplit(self.path).query)
+        with server.lock:
+            server.queries.append(query["id_list"][0].split(","))
+        body = server.body
+        self.send_response(server.status)
+        self.send_header("Content-Type", "application/atom+xml")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+class _AtomServer(ThreadingHTTPServer):
+    daemon_threads = True
+    block_on_close = False
+
+    def __init__(self, body: bytes, status: int = 200) -> None:
+        super().__init__(("127.0.0.1", 0), _AtomHandler)
+        self.body = body
+        self.status = status
+        self.lock = threading.Lock()
+        self.queries: list[list[str]] = []
+        self.url = f"http://127.0.0.1:{self.server_address[1]}/api/query"
+        threading.Thread(target=self.serve_forever, kwargs={"poll_interval": 0.02}, daemon=True).start()
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+class ParseAtomFeedTests(unittest.TestCase):
+    def test_recorded_feed(self):
+        records = parse_atom_feed(FIXTURE.read_bytes())
+
+        self.assertEqual({"1706.03762", "1412.6980", "hep-th/9711200", "1203.0001"}, set(records))
+        self.assertEqual(7, records["1706.03762"].latest_version)
+        self.assertEqual("Attention Is All You Need", records["1706.03762"].title)
+        self.assertEqual(3, records["hep-th/9711200"].latest_version)
+        self.assertTrue(records["1203.0001"].withdrawn)
+        self.assertFalse(records["1412.6980"].withdrawn)
+
+    def test_error_feed_raises(self):
+        with self.assertRaisesRegex(ArxivQueryError, "incorrect id format"):
+            parse_atom_feed(ERROR_FEED)
+        with self.assertRaises(ArxivQueryError):
+            parse_atom_feed(b"<html>busy</html")
+
+    def test_split_version(self):
+        self.assertEqual(("1706.03762", 5), split_version("1706.03762v5"))
+        self.assertEqual(("hep-th/9711200", None), split_version("hep-th/9711200"))
+
+
+class ArxivBatchResolverTests(unittest.TestCase):
+    def _server(self, body: bytes = b"", status: int = 200) -> _AtomServer:
+        server = _AtomServer(body or FIXTURE.read_bytes(), status)
+        self.addCleanup(server.stop)
+        return server
+
+    def _resolver(self, server: _AtomServer, **kwargs) -> ArxivBatchResolver:
+        resolver = ArxivBatchResolver(base_url=server.url, request_interval=0.0, **kwargs)
+        self.addCleanup(resolver.close)
+        return resolver
+
+    def test_checks_are_batched_and_reported(self):
+        server = self._server()
+        resolver = self._resolver(server, chunk_size=3)
+        ids = ["1706.03762", "1706.03762v3", "1412.6980v12", "hep-th/9711200", "1203.0001", "2501.99999", "bad id"]
+
+        results = resolver.check(ids)
+
+        self.assertEqual(
+            {
+                "1706.03762": (True, None),
+                "1706.03762v3": (True, None),
+                "1412.6980v12": (False, "arXiv version v12 not found (latest is v9)"),
+                "hep-th/9711200": (True, None),
+                "1203.0001": (False, "arXiv paper withdrawn"),
+                "2501.99999": (False, "arXiv ID not found"),
+                "bad id": (False, "Malformed arXiv ID"),
+            },
+            results,
+        )
+        self.assertEqual(
+            [["1706.03762", "1412.6980", "hep-th/9711200"], ["1203.0001", "2501.99999"]], server.queries
+        )
+
+    def test_records_are_memoized(self):
+        server = self._server()
+        resolver = self._resolver(server)
+        resolver.prefetch(["1706.03762", "2501.99999"])
+
+        records = resolver.lookup(["1706.03762v7", "2501.99999"])
+
+        self.assertEqual(1, len(server.queries))
+        self.assertEqual(ArxivRecord(arxiv_id="2501.99999", exists=False), records["2501.99999"])
+        self.assertEqual(7, records["1706.03762v7"].latest_version)
+
+    def test_query_failure_is_transient(self):
+        resolver = self._resolver(self._server(status=503))
+
+        ok, reason = resolver.check(["1706.03762"])["1706.03762"]
+
+        self.assertFalse(ok)
+        self.assertEqual("arXiv lookup failed: arXiv query HTTP error: 503", reason)
+
+    def test_citation_resolver_uses_batch_for_arxiv_ids(self):
+        server = self._server()
+        resolver = CitationResolver(arxiv_batch=self._resolver(server))
+        self.addCleanup(resolver.close)
+
+        def per_id_check(*_args, **_kwargs):
+            raise AssertionError("per-ID arXiv check should not run")
+
+        _, arxiv = resolver.resolve([], ["1706.03762", "1412.6980"], arxiv_check=per_id_check)
+
+        self.assertEqual({"1706.03762": (True, None), "1412.6980": (True, None)}, arxiv)
+        self.assertEqual(1, len(server.queries))
+
+    def test_batch_results_are_cached_across_resolvers(self):
+        server = self._server()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        ids = ["1706.03762", "1203.0001", "2501.99999"]
+
+        for _ in range(2):
+            resolver = CitationResolver(arxiv_batch=self._resolver(server), cache=ResolutionCache(tmp.name))
+            _, arxiv = resolver.resolve([], ids)
+            resolver.close()
+
+        self.assertEqual(1, len(server.queries))
+        self.assertEqual((False, "arXiv paper withdrawn"), arxiv["1203.0001"])
+        self.assertEqual((3, 0), (resolver.cache.hits, resolver.cache.misses))
+
+
+if __name__ == "__main__":
+    unittest.main()
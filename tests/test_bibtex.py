@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import io
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tars.validators.research.citations.bibtex import iter_bib_entries, parse_bib
+
+
+class ParseBibTests(unittest.TestCase):
+    def test_nested_braces_and_quotes(self):
+        (entry,) = parse_bib(
+            """
+            @Article{vaswani2017,
+              title = {Attention Is {All} You {N}eed},
+              author = "Vaswani, Ashish and Shazeer, {Noam}",
+              note = "a {"}quoted{"} word, {with, commas}",
+              year = 2017,
+            }
+            """
+        )
+
+        self.assertEqual(("article", "vaswani2017"), (entry.entry_type, entry.key))
+        self.assertEqual("Attention Is {All} You {N}eed", entry.fields["title"])
+        self.assertEqual("Vaswani, Ashish and Shazeer, {Noam}", entry.fields["author"])
+        self.assertEqual('a {"}quoted{"} word, {with, commas}', entry.fields["note"])
+        self.assertEqual("2017", entry.fields["year"])
+
+    def test_string_macros_and_concatenation(self):
+        entries = parse_bib(
+            """
+            @string{ICLR = "International Conference on Learning Representations"}
+            @STRING(proc = {Proceedings of the })
+            @inproceedings{kingma2015,
+              booktitle = proc # ICLR,
+              month = may,
+              title = {Adam} # ": " # "A Method",
+              note = undefinedmacro
+            }
+            """
+        )
+
+        (entry,) = entries
+        self.assertEqual(
+            "Proceedings of the International Conference on Learning Representations", entry.fields["booktitle"]
+        )
+        self.assertEqual("May", entry.fields["month"])
+        self.assertEqual("Adam: A Method", entry.fields["title"])
+        self.assertEqual("undefinedmacro", entry.fields["note"])
+
+    def test_comments_preamble_and_free_text_are_skipped(self):
+        entries = parse_bib(
+            """
+            Free text with an email me@example.org is ignored.
+            @comment{ @article{fake, title = {not an entry}} }
+            @preamble{ "\\newcommand{\\noopsort}[1]{}" }
+            @misc(paren, title = {Parenthesised (entry)}, year = {2020})
+            @book{nofields}
+            """
+        )
+
+        self.assertEqual(["paren", "nofields"], [entry.key for entry in entries])
+        self.assertEqual("Parenthesised (entry)", entries[0].fields["title"])
+        self.assertEqual({}, entries[1].fields)
+
+    def test_redundant_outer_braces_are_dropped(self):
+        (entry,) = parse_bib("@article{k, title = {{Deep Learning}}, note = {{A} and {B}}}")
+
+        self.assertEqual("Deep Learning", entry.fields["title"])
+        self.assertEqual("{A} and {B}", entry.fields["note"])
+
+    def test_streaming_across_chunk_boundaries_tracks_lines(self):
+        text = "".join(
+            f"@article{{key{i},\n  title = {{Title {{{i}}}}},\n  year = {2000 + i}\n}}\n" for i in range(50)
+        )
+
+        entries = list(iter_bib_entries(io.StringIO(text), chunk_size=7))
+
+        self.assertEqual([f"key{i}" for i in range(50)], [entry.key for entry in entries])
+        self.assertEqual("Title {49}", entries[49].fields["title"])
+        self.assertEqual([1, 5, 9], [entry.line for entry in entries[:3]])
+
+    def test_unterminated_entry_is_dropped(self):
+        entries = parse_bib("@article{ok, title = {Fine}}\n@article{broken, title = {Never closed")
+
+        self.assertEqual(["ok"], [entry.key for entry in entries])
+
+
+if __name__ == "__main__":
+    unittest.main()
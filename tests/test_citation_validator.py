@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import tempfile
+import threading
+import time
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from unittest.mock import patch
 
@@ -11,7 +14,51 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
 from tars.validators.research.citations.citation_validator import CitationValidator
 from tars.validators.research.citations.extractor import extract_citations
-from tars.validators.research.citations.resolver import arxiv_exists, doi_resolves
+from tars.validators.research.citations.resolver import CitationResolver, arxiv_exists, doi_resolves
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):  # noqa: N802
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+            server.client_ports.add(self.client_address[1])
+        try:
+            time.sleep(server.delay)
+            self.send_response(server.routes.get(self.path, 404))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def log_message(self, *_args):
+        pass
+
+
+class _StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    block_on_close = False
+
+    def __init__(self, routes: dict[str, int], delay: float = 0.0) -> None:
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.routes = routes
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.active = 0
+        self.peak = 0
+        self.client_ports: set[int] = set()
+        self.base_url = f"http://127.0.0.1:{self.server_address[1]}"
+        threading.Thread(target=self.serve_forever, kwargs={"poll_interval": 0.02}, daemon=True).start()
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
 
 
 class CitationExtractorTests(unittest.TestCase):
@@ -64,6 +111,63 @@ class CitationResolverTests(unittest.TestCase):
         self.assertEqual("Malformed arXiv ID", reason)
 
 
+class CitationResolverHTTPTests(unittest.TestCase):
+    def _server(self, routes: dict[str, int], delay: float = 0.0) -> _StubServer:
+        server = _StubServer(routes, delay)
+        self.addCleanup(server.stop)
+        return server
+
+    def _resolver(self, server: _StubServer, **kwargs) -> CitationResolver:
+        resolver = CitationResolver(
+            doi_base_url=f"{server.base_url}/doi/", arxiv_base_url=f"{server.base_url}/abs/", **kwargs
+        )
+        self.addCleanup(resolver.close)
+        return resolver
+
+    def test_resolves_against_stub_without_following_redirects(self):
+        server = self._server({"/doi/10.1000/ok": 302, "/abs/1706.03762": 200})
+        dois, arxiv = self._resolver(server).resolve(["10.1000/ok", "10.1000/missing", "bad"], ["1706.03762"])
+
+        self.assertEqual((True, None), dois["10.1000/ok"])
+        self.assertEqual((False, "DOI HTTP error: 404"), dois["10.1000/missing"])
+        self.assertEqual((False, "Malformed DOI"), dois["bad"])
+        self.assertEqual((True, None), arxiv["1706.03762"])
+        self.assertEqual(3, server.requests)
+
+    def test_connections_are_kept_alive_and_limited_per_host(self):
+        server = self._server({}, delay=0.02)
+        dois = [f"10.1000/{k}" for k in range(12)]
+        results, _ = self._resolver(server, per_host_limit=2).resolve(dois + dois[:4], [])
+
+        self.assertEqual(set(dois), set(results))
+        self.assertEqual(12, server.requests)
+        self.assertLessEqual(server.peak, 2)
+        self.assertLessEqual(len(server.client_ports), 2)
+
+    def test_deadline_bounds_total_time(self):
+        server = self._server({}, delay=2.0)
+        started = time.perf_counter()
+        results, _ = self._resolver(server, deadline=0.3).resolve(["10.1000/slow"], [])
+
+        self.assertLess(time.perf_counter() - started, 1.5)
+        self.assertEqual((False, CitationResolver.DEADLINE_REASON), results["10.1000/slow"])
+
+    def test_validator_reports_checks_from_stub(self):
+        server = self._server({"/doi/10.1000/ok": 200})
+        with tempfile.TemporaryDirectory() as td:
+            tex = Path(td) / "paper.tex"
+            tex.write_text("Text \\cite{a,b}.", encoding="utf-8")
+            (Path(td) / "paper.bib").write_text(
+                "@article{a, author={A}, title={T}, year={2020}, journal={J}, doi={10.1000/ok}}\n"
+                "@article{b, author={B}, title={U}, year={2021}, journal={J}, doi={10.1000/gone}}\n",
+                encoding="utf-8",
+            )
+            result = CitationValidator(resolver=self._resolver(server)).validate(tex)
+
+        checks = {check["key"]: (check["ok"], check["reason"]) for check in result.metadata["doi_checks"]}
+        self.assertEqual({"a": (True, None), "b": (False, "DOI HTTP error: 404")}, checks)
+        self.assertIn("DOI check failed for 'b': DOI HTTP error: 404", result.metadata["warnings"])
+
 class CitationValidatorTests(unittest.TestCase):
     def test_detects_missing_mapping(self):
         with tempfile.TemporaryDirectory() as td:
@@ -83,6 +187,7 @@ class CitationValidatorTests(unittest.TestCase):
 
         self.assertFalse(result.passed)
         self.assertIn("missing", " ".join(result.errors))
+        self.assertEqual(["line:2:col:23:cite"], result.metadata["missing_citation_locations"]["missing"])
 
     def test_bib_quality_and_resolvers(self):
         with tempfile.TemporaryDirectory() as td:
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import importlib.util
+import itertools
+import pickle
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tars.validators.research.math import conversion_cache as conversion_cache_module
+from tars.validators.research.math import math_validator as math_validator_module
+from tars.validators.research.math.conversion_cache import ConversionCache
+from tars.validators.research.math.math_converter import ConversionError, MathConverter
+from tars.validators.research.math.math_validator import MathValidator
+
+
+HAS_SYMPY = importlib.util.find_spec("sympy") is not None
+HAS_LATEX2SYMPY2 = importlib.util.find_spec("latex2sympy2") is not None
+
+
+@unittest.skipUnless(HAS_SYMPY, "sympy not installed")
+class ConversionCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        import sympy as sp
+
+        self.sp = sp
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_entries_persist_across_instances(self):
+        x = self.sp.Symbol("x")
+        writer = ConversionCache(self.cache_dir)
+        writer.put("x^2", x**2)
+        writer.put("\\bad", ConversionError(latex="\\bad", error_type="ParseError", message="nope"))
+        writer.close()
+
+        reader = ConversionCache(self.cache_dir)
+        self.assertEqual(x**2, reader.get("x^2"))
+        error = reader.get("\\bad")
+        self.assertEqual(ConversionError(latex="\\bad", error_type="ParseError", message="nope"), error)
+        self.assertIsNone(reader.get("y"))
+        self.assertEqual({"hits": 2, "misses": 1}, {k: reader.stats()[k] for k in ("hits", "misses")})
+
+    def test_key_uses_normalized_latex_and_converter_version(self):
+        cache = ConversionCache(self.cache_dir, version="v1")
+        cache.put("x \\label{eq:1}", self.sp.Symbol("x"))
+
+        self.assertEqual(self.sp.Symbol("x"), cache.get("x"))
+        self.assertIsNone(ConversionCache(self.cache_dir, version="v2").get("x"))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        clock = itertools.count()
+        cache = ConversionCache(self.cache_dir, max_entries=2)
+        cache.EVICTION_INTERVAL = 1
+        with patch.object(conversion_cache_module.time, "time", side_effect=lambda: float(next(clock))):
+            cache.put("a", self.sp.Symbol("a"))
+            cache.put("b", self.sp.Symbol("b"))
+            cache.get("a")
+            cache.put("c", self.sp.Symbol("c"))
+
+            self.assertEqual(2, cache.entry_count())
+            self.assertIsNone(cache.get("b"))
+            self.assertIsNotNone(cache.get("a"))
+
+    def test_pickled_cache_reconnects_to_the_same_store(self):
+        cache = ConversionCache(self.cache_dir)
+        cache.put("z", self.sp.Symbol("z"))
+
+        clone = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(self.sp.Symbol("z"), clone.get("z"))
+
+    def test_from_env_is_opt_in(self):
+        with patch.dict("os.environ", {}, clear=True):
+            self.assertIsNone(ConversionCache.from_env())
+        with patch.dict("os.environ", {"TARS_CACHE_DIR": str(self.cache_dir)}):
+            self.assertEqual(self.cache_dir, ConversionCache.from_env().cache_dir)
+
+
+@unittest.skipUnless(HAS_SYMPY and HAS_LATEX2SYMPY2, "sympy/latex2sympy2 not installed")
+class ConversionCacheIntegrationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        tmp = Path(self._tmp.name)
+        self.cache_dir = tmp / "cache"
+        self.paper = tmp / "paper.tex"
+        self.paper.write_text(
+            "\\begin{equation}\nF = m a\n\\end{equation}\n"
+            "\\begin{equation}\n(a+b)^2 = a^2 + 2 a b + b^2\n\\end{equation}\n"
+        )
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_second_run_is_served_from_disk(self):
+        first = MathValidator(cache=ConversionCache(self.cache_dir)).validate(self.paper)
+        self.assertEqual(0, first.metadata["cache_stats"]["persistent_hits"])
+        self.assertEqual(4, first.metadata["cache_stats"]["persistent_misses"])
+
+        with patch.object(math_validator_module, "convert_latex_to_sympy") as convert:
+            second = MathValidator(cache=ConversionCache(self.cache_dir)).validate(self.paper)
+
+        convert.assert_not_called()
+        self.assertEqual(4, second.metadata["cache_stats"]["persistent_hits"])
+        self.assertEqual(
+            [item["status"] for item in first.metadata["results"]],
+            [item["status"] for item in second.metadata["results"]],
+        )
+
+    def test_math_converter_shares_the_cache(self):
+        MathValidator(cache=ConversionCache(self.cache_dir)).validate(self.paper)
+        cache = ConversionCache(self.cache_dir)
+
+        result = MathConverter(cache=cache).validate(self.paper)
+
+        self.assertTrue(result.passed)
+        self.assertEqual(4, cache.hits)
+        self.assertEqual(0, cache.misses)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tars.corpus import completed_papers, discover_papers, validate_corpus
+
+
+HAS_SYMPY = importlib.util.find_spec("sympy") is not None
+HAS_LATEX2SYMPY2 = importlib.util.find_spec("latex2sympy2") is not None
+
+
+def _write_paper(path: Path, body: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"\\begin{{equation}}\n{body}\n\\end{{equation}}\n")
+    return path
+
+
+class DiscoverPapersTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.a = _write_paper(self.root / "corpus" / "a" / "main.tex", "x = x")
+        self.b = _write_paper(self.root / "corpus" / "b.tex", "y = y")
+        (self.root / "corpus" / "notes.txt").write_text("not a paper")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_directory_is_searched_recursively(self):
+        self.assertEqual([self.a, self.b], discover_papers(self.root / "corpus"))
+
+    def test_manifest_lists_paths_relative_to_itself(self):
+        manifest = self.root / "papers.txt"
+        manifest.write_text("# corpus\ncorpus/b.tex\n\ncorpus/a/main.tex\n")
+
+        self.assertEqual([self.b, self.a], discover_papers(manifest))
+
+    def test_glob_pattern(self):
+        self.assertEqual([self.b], discover_papers(str(self.root / "corpus" / "*.tex")))
+
+
+@unittest.skipUnless(HAS_SYMPY and HAS_LATEX2SYMPY2, "sympy/latex2sympy2 not installed")
+class ValidateCorpusTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.output = self.root / "out" / "results.jsonl"
+        self.papers = [
+            _write_paper(self.root / "p1.tex", "(x+1)^2 = x^2 + 2x + 1"),
+            _write_paper(self.root / "p2.tex", "(x+1)^2 = x^2 + 1"),
+        ]
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _records(self) -> list[dict]:
+        return [json.loads(line) for line in self.output.read_text().splitlines()]
+
+    def test_streams_one_record_per_paper(self):
+        summary = validate_corpus(self.papers, self.output)
+
+        records = {record["paper"]: record for record in self._records()}
+        self.assertEqual({str(p) for p in self.papers}, set(records))
+        self.assertEqual("PASS", records[str(self.papers[0])]["status"])
+        self.assertEqual("FAIL", records[str(self.papers[1])]["status"])
+        self.assertEqual((2, 1, 0, 2), (summary.papers, summary.failed, summary.errored, summary.equations))
+        self.assertGreater(summary.papers_per_second, 0)
+
+    def test_resume_skips_completed_papers_and_drops_partial_line(self):
+        validate_corpus(self.papers[:1], self.output)
+        with self.output.open("a") as handle:
+            handle.write('{"paper": "trunc')
+        summary = validate_corpus(self.papers, self.output)
+
+        self.assertEqual((1, 1), (summary.papers, summary.resumed))
+        self.assertEqual([str(p) for p in self.papers], [record["paper"] for record in self._records()])
+
+    def test_no_resume_overwrites_output(self):
+        validate_corpus(self.papers, self.output)
+        validate_corpus(self.papers[:1], self.output, resume=False)
+
+        self.assertEqual({str(self.papers[0])}, completed_papers(self.output))
+
+    def test_missing_paper_is_recorded_not_raised(self):
+        summary = validate_corpus([self.root / "missing.tex"], self.output)
+
+        self.assertEqual(1, summary.failed)
+        self.assertEqual("FAIL", self._records()[0]["status"])
+
+    def test_worker_pool_matches_serial(self):
+        validate_corpus(self.papers, self.output, workers=2)
+        pooled = {record["paper"]: record["status"] for record in self._records()}
+
+        self.assertEqual({str(self.papers[0]): "PASS", str(self.papers[1]): "FAIL"}, pooled)
+
+    def test_worker_recycling_warns_where_unsupported(self):
+        with patch("tars.corpus._POOL_RECYCLES_WORKERS", False):
+            with self.assertWarnsRegex(RuntimeWarning, "needs Python 3.11"):
+                validate_corpus(self.papers, self.output, workers=2, max_tasks_per_child=5)
+
+        self.assertEqual(2, len(self._records()))
+
+
+if __name__ == "__main__":
+    unittest.main()
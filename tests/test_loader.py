@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import gzip
+import importlib.util
+import json
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tars_analyzer.loader import iter_conversations, load_conversations, open_jsonl
+
+
+HAS_ZSTD = importlib.util.find_spec("zstandard") is not None or sys.version_info >= (3, 14)
+
+
+def _record(index: int, day: int) -> str:
+    return json.dumps(
+        {
+            "conversation_id": f"conv-{index}",
+            "timestamp": f"2025-01-{day:02d}T00:00:00Z",
+            "turns": [{"role": "agent", "content": f"answer {index}"}],
+        }
+    )
+
+
+class LoaderTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        rng = random.Random(5)
+        # Few distinct days, so many records tie and the sort must be stable.
+        self.days = [rng.randint(1, 9) for _ in range(200)]
+        self.lines = [_record(index, day) for index, day in enumerate(self.days)]
+        self.expected = [f"conv-{index}" for index, _day in sorted(enumerate(self.days), key=lambda item: item[1])]
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def write(self, name: str, text: str) -> Path:
+        path = self.root / name
+        path.write_text(text, encoding="utf-8")
+        return path
+
+    def test_sorts_by_timestamp_keeping_file_order_for_ties(self):
+        path = self.write("log.jsonl", "\n".join(self.lines) + "\n\n")
+
+        self.assertEqual(self.expected, [c.conversation_id for c in load_conversations(path)])
+
+    def test_external_sort_spills_runs_and_cleans_up(self):
+        path = self.write("log.jsonl", "\n".join(self.lines))
+        spill = self.root / "spill"
+        spill.mkdir()
+
+        stream = iter_conversations(path, run_bytes=2000, temp_dir=spill)
+        first = next(stream)
+        (run_dir,) = spill.iterdir()
+        self.assertGreater(len(list(run_dir.iterdir())), 5)
+        rest = [c.conversation_id for c in stream]
+
+        self.assertEqual(self.expected, [first.conversation_id, *rest])
+        self.assertEqual([], list(spill.iterdir()))
+
+    def test_unsorted_streaming_keeps_file_order(self):
+        path = self.write("log.jsonl", "\n".join(self.lines))
+
+        ids = [c.conversation_id for c in iter_conversations(path, sort=False)]
+
+        self.assertEqual([f"conv-{index}" for index in range(len(self.lines))], ids)
+
+    def test_gzip_input_is_detected_by_content(self):
+        path = self.root / "log.data"
+        with gzip.open(path, "wt", encoding="utf-8") as handle:
+            handle.write("\n".join(self.lines))
+
+        self.assertEqual(self.expected, [c.conversation_id for c in iter_conversations(path, run_bytes=5000)])
+
+    @unittest.skipUnless(HAS_ZSTD, "zstd support not installed")
+    def test_zstd_input(self):
+        data = "\n".join(self.lines).encode("utf-8")
+        try:
+            from compression import zstd  # type: ignore
+
+            compressed = zstd.compress(data)
+        except ImportError:
+            import zstandard  # type: ignore
+
+            compressed = zstandard.ZstdCompressor().compress(data)
+        path = self.root / "log.jsonl.zst"
+        path.write_bytes(compressed)
+
+        with open_jsonl(path) as handle:
+            self.assertEqual(self.lines[0], handle.readline().strip())
+        self.assertEqual(self.expected, [c.conversation_id for c in load_conversations(path)])
+
+
+if __name__ == "__main__":
+    unittest.main()
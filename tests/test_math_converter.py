@@ -99,7 +99,7 @@ class MathConverterFailureTests(unittest.TestCase):
             },
         )
 
-        with patch.object(converter.extractor, "validate", return_value=extraction), patch(
+        with patch.object(converter.extractor, "validate_context", return_value=extraction), patch(
             "tars.validators.research.math.math_converter.convert_equation",
             side_effect=[
                 EquationConversionResult(lhs_sympy="a", rhs_sympy="b", error=None),
@@ -46,6 +46,15 @@ class MathExtractorTests(unittest.TestCase):
         self.assertTrue(all("raw" in e and "lhs" in e and "rhs" in e and "source_location" in e for e in equations))
 
 
+    def test_records_line_and_column_locations(self):
+        extractor = MathExtractor()
+        result = extractor.validate(Path("examples/latex/sample_math.tex"))
+
+        first_inline = next(e for e in result.metadata["expressions"] if e["environment_type"] == "inline")
+        self.assertEqual(4, first_inline["line_number"])
+        self.assertEqual(13, first_inline["column_number"])
+        self.assertEqual("line:4:col:13:inline", result.metadata["equations"][0]["source_location"])
+
     def test_multiple_equals_splits_on_first_equals(self):
         extractor = MathExtractor()
         tex_path = Path("examples/latex/multi_equals.tex")
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tars.validators.research.math.math_extractor import MathExtractor
+from tars.validators.research.math.math_tokenizer import iter_math_spans
+
+
+class MathTokenizerTests(unittest.TestCase):
+    def test_spans_are_yielded_in_source_order(self):
+        text = "intro $a=b$\n\\[\nx=y\n\\]\n\\begin{align}\nf&=g\n\\end{align}\n$c$"
+        spans = list(iter_math_spans(text))
+
+        self.assertEqual(
+            ["inline", "display_brackets", "align", "inline"],
+            [s.environment_type for s in spans],
+        )
+        self.assertEqual(sorted(s.start for s in spans), [s.start for s in spans])
+        self.assertEqual("$a=b$", text[spans[0].start : spans[0].end])
+        self.assertEqual("\\[\nx=y\n\\]", text[spans[1].start : spans[1].end])
+
+    def test_escaped_and_double_dollars_are_not_inline_math(self):
+        text = "costs \\$5 and $$ display $$ but $x=1$ is math"
+        spans = list(iter_math_spans(text))
+
+        self.assertEqual(1, len(spans))
+        self.assertEqual("$x=1$", text[spans[0].start : spans[0].end])
+
+    def test_dollars_inside_blocks_are_ignored(self):
+        text = "\\begin{equation}\n\\text{$}\\ y = 2\n\\end{equation} $z$"
+        spans = list(iter_math_spans(text))
+
+        self.assertEqual(["equation", "inline"], [s.environment_type for s in spans])
+        self.assertEqual("$z$", text[spans[1].start : spans[1].end])
+
+    def test_block_inside_inline_math_is_yielded_before_the_inline_span(self):
+        spans = list(iter_math_spans("a $x \\[y\\] z$ b"))
+
+        self.assertEqual(
+            [("display_brackets", 5, 10), ("inline", 2, 13)],
+            [(s.environment_type, s.start, s.end) for s in spans],
+        )
+
+    def test_unclosed_block_and_inline_produce_no_spans(self):
+        text = "\\[ never closed\n$ also open\n\\begin{equation} x = 1"
+        self.assertEqual([], list(iter_math_spans(text)))
+
+    def test_extract_text_orders_blocks_before_inline_on_same_line(self):
+        expressions = MathExtractor().extract_text("$a=b$ \\[c=d\\] \\begin{equation}e=f\\end{equation}")
+
+        self.assertEqual(
+            ["display_brackets", "equation", "inline"],
+            [e.environment_type for e in expressions],
+        )
+
+    def test_many_unclosed_openers_stay_fast(self):
+        text = "\\[ x " * 200_000
+        self.assertEqual([], list(iter_math_spans(text)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -50,7 +50,7 @@ class MathValidatorPipelineTests(unittest.TestCase):
     def test_symbolic_pass_short_circuits_numeric(self):
         symbolic_pass = ValidationResult(name="symbolic_validator", passed=True, errors=[], metadata={})
 
-        with patch.object(self.validator.extractor, "validate", return_value=self._fake_extraction_result()), patch(
+        with patch.object(self.validator.extractor, "validate_context", return_value=self._fake_extraction_result()), patch(
             "tars.validators.research.math.math_validator.convert_equation",
             return_value=self._fake_conversion_result(),
         ), patch.object(
@@ -73,7 +73,7 @@ class MathValidatorPipelineTests(unittest.TestCase):
     def test_metrics_reported_for_pass_case(self):
         symbolic_pass = ValidationResult(name="symbolic_validator", passed=True, errors=[], metadata={})
 
-        with patch.object(self.validator.extractor, "validate", return_value=self._fake_extraction_result()), patch(
+        with patch.object(self.validator.extractor, "validate_context", return_value=self._fake_extraction_result()), patch(
             "tars.validators.research.math.math_validator.convert_equation",
             return_value=self._fake_conversion_result(),
         ), patch.object(
@@ -114,7 +114,7 @@ class MathValidatorPipelineTests(unittest.TestCase):
         )
         symbolic_pass = ValidationResult(name="symbolic_validator", passed=True, errors=[], metadata={})
 
-        with patch.object(self.validator.extractor, "validate", return_value=extraction), patch(
+        with patch.object(self.validator.extractor, "validate_context", return_value=extraction), patch(
             "tars.validators.research.math.math_validator.convert_equation",
             return_value=self._fake_conversion_result(),
         ) as convert_eq, patch.object(
@@ -139,7 +139,7 @@ class MathValidatorPipelineTests(unittest.TestCase):
         )
         numeric_pass = ValidationResult(name="numeric_validator", passed=True, errors=[], metadata={})
 
-        with patch.object(self.validator.extractor, "validate", return_value=self._fake_extraction_result()), patch(
+        with patch.object(self.validator.extractor, "validate_context", return_value=self._fake_extraction_result()), patch(
             "tars.validators.research.math.math_validator.convert_equation",
             return_value=self._fake_conversion_result(),
         ), patch.object(
@@ -162,6 +162,47 @@ class MathValidatorPipelineTests(unittest.TestCase):
         )
 
 
+    def test_symbolic_timeout_routes_to_numeric_and_is_counted(self):
+        symbolic_timeout = ValidationResult(
+            name="symbolic_validator",
+            passed=False,
+            status="TIMEOUT",
+            reason="time budget exceeded",
+            errors=["Symbolic simplification exceeded the 1.0s time budget"],
+            metadata={},
+        )
+        numeric_pass = ValidationResult(name="numeric_validator", passed=True, errors=[], metadata={})
+
+        with patch.object(self.validator.extractor, "validate_context", return_value=self._fake_extraction_result()), patch(
+            "tars.validators.research.math.math_validator.convert_equation",
+            return_value=self._fake_conversion_result(),
+        ), patch.object(
+            self.validator.symbolic_validator,
+            "validate_equivalence",
+            return_value=symbolic_timeout,
+        ), patch.object(
+            self.validator.numeric_validator,
+            "validate_equivalence",
+            return_value=numeric_pass,
+        ):
+            result = self.validator.validate(Path("paper.tex"))
+
+        self.assertTrue(result.passed)
+        eq = result.metadata["results"][0]
+        self.assertTrue(eq["timed_out"])
+        self.assertEqual(["symbolic_attempt", "symbolic_timeout", "numeric_attempt", "numeric_pass"], eq["decision_path"])
+        self.assertEqual(1, result.metadata["metrics"]["timed_out_equations"])
+
+    def test_budget_options_reach_symbolic_validator(self):
+        validator = MathValidator(symbolic_timeout=2.5, max_expression_size=400)
+
+        self.assertEqual(2.5, validator.symbolic_validator.timeout)
+        self.assertEqual(400, validator.symbolic_validator.max_expression_size)
+        self.assertEqual(
+            {"symbolic_timeout": 2.5, "max_expression_size": 400, "cache": None},
+            validator._worker_options(),
+        )
+
     def test_conversion_failure_is_skipped(self):
         class _Err:
             message = "cannot parse"
@@ -169,7 +210,7 @@ class MathValidatorPipelineTests(unittest.TestCase):
         class _Conversion:
             error = _Err()
 
-        with patch.object(self.validator.extractor, "validate", return_value=self._fake_extraction_result()), patch(
+        with patch.object(self.validator.extractor, "validate_context", return_value=self._fake_extraction_result()), patch(
             "tars.validators.research.math.math_validator.convert_equation",
             return_value=_Conversion(),
         ):
@@ -190,7 +231,7 @@ class MathValidatorPipelineTests(unittest.TestCase):
         class _Conversion:
             error = _Err()
 
-        with patch.object(self.validator.extractor, "validate", return_value=self._fake_extraction_result()), patch(
+        with patch.object(self.validator.extractor, "validate_context", return_value=self._fake_extraction_result()), patch(
             "tars.validators.research.math.math_validator.convert_equation",
             return_value=_Conversion(),
         ):
@@ -210,7 +251,7 @@ class MathValidatorPipelineTests(unittest.TestCase):
             metadata={},
         )
 
-        with patch.object(self.validator.extractor, "validate", return_value=self._fake_extraction_result()), patch(
+        with patch.object(self.validator.extractor, "validate_context", return_value=self._fake_extraction_result()), patch(
             "tars.validators.research.math.math_validator.convert_equation",
             return_value=self._fake_conversion_result(),
         ), patch.object(
@@ -237,7 +278,7 @@ class MathValidatorPipelineTests(unittest.TestCase):
             metadata={},
         )
 
-        with patch.object(self.validator.extractor, "validate", return_value=self._fake_extraction_result()), patch(
+        with patch.object(self.validator.extractor, "validate_context", return_value=self._fake_extraction_result()), patch(
             "tars.validators.research.math.math_validator.convert_equation",
             return_value=self._fake_conversion_result(),
         ), patch.object(
@@ -267,7 +308,7 @@ class MathValidatorPipelineTests(unittest.TestCase):
             metadata={},
         )
 
-        with patch.object(self.validator.extractor, "validate", return_value=self._fake_extraction_result()), patch(
+        with patch.object(self.validator.extractor, "validate_context", return_value=self._fake_extraction_result()), patch(
             "tars.validators.research.math.math_validator.convert_equation",
             return_value=self._fake_conversion_result(),
         ), patch.object(
@@ -318,7 +359,7 @@ class MathValidatorDerivativeTests(unittest.TestCase):
     def test_derivative_equation_passes(self):
         with patch.object(
             self.validator.extractor,
-            "validate",
+            "validate_context",
             return_value=self._derivative_extraction_result("2*x"),
         ), patch(
             "tars.validators.research.math.math_validator.convert_latex_to_sympy",
@@ -337,7 +378,7 @@ class MathValidatorDerivativeTests(unittest.TestCase):
     def test_derivative_equation_fails_when_rhs_incorrect(self):
         with patch.object(
             self.validator.extractor,
-            "validate",
+            "validate_context",
             return_value=self._derivative_extraction_result("3*x"),
         ), patch(
             "tars.validators.research.math.math_validator.convert_latex_to_sympy",
@@ -378,7 +419,7 @@ class MathValidatorIntegralTests(unittest.TestCase):
     def test_integral_equation_passes(self):
         with patch.object(
             self.validator.extractor,
-            "validate",
+            "validate_context",
             return_value=self._integral_extraction_result("x**3/3"),
         ), patch(
             "tars.validators.research.math.math_validator.convert_latex_to_sympy",
@@ -393,7 +434,7 @@ class MathValidatorIntegralTests(unittest.TestCase):
     def test_integral_equation_fails_when_rhs_incorrect(self):
         with patch.object(
             self.validator.extractor,
-            "validate",
+            "validate_context",
             return_value=self._integral_extraction_result("x**2/2"),
         ), patch(
             "tars.validators.research.math.math_validator.convert_latex_to_sympy",
@@ -420,6 +461,15 @@ class MathValidatorExampleFilesTests(unittest.TestCase):
         metrics = result.metadata.get("metrics", {})
         self.assertGreater(metrics.get("failed_equations", 0), 0)
 
+    def test_worker_pool_matches_serial_run(self):
+        for name in ("math_valid.tex", "math_invalid.tex"):
+            paper = self.repo_root / "examples" / "research" / name
+            with self.subTest(paper=name):
+                serial = MathValidator().validate(paper)
+                pooled = MathValidator(workers=2).validate(paper)
+
+                self.assertEqual(serial.to_dict(), pooled.to_dict())
+
 
 if __name__ == "__main__":
     unittest.main()
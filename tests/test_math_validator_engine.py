@@ -47,7 +47,7 @@ class MathValidatorEngineIntegrationTests(unittest.TestCase):
         )
         numeric_pass = ValidationResult(name="numeric_validator", passed=True, errors=[], metadata={})
 
-        with patch.object(validator.extractor, "validate", return_value=extraction), patch(
+        with patch.object(validator.extractor, "validate_context", return_value=extraction), patch(
             "tars.validators.research.math.math_validator.convert_equation",
             return_value=_Conversion(),
         ), patch.object(
@@ -71,6 +71,7 @@ class MathValidatorEngineIntegrationTests(unittest.TestCase):
                 "validated_equations": 1,
                 "failed_equations": 0,
                 "skipped_equations": 0,
+                "timed_out_equations": 0,
             },
             result.metadata["metrics"],
         )
@@ -4,6 +4,7 @@ import importlib.util
 import sys
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
@@ -11,6 +12,7 @@ from tars.validators.research.math.numeric_validator import NumericValidator
 
 
 HAS_SYMPY = importlib.util.find_spec("sympy") is not None
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
 
 
 @unittest.skipUnless(HAS_SYMPY, "sympy not installed")
@@ -65,6 +67,60 @@ class NumericValidatorTests(unittest.TestCase):
         self.assertTrue(result.passed)
 
 
+@unittest.skipUnless(HAS_SYMPY and HAS_NUMPY, "sympy and numpy not installed")
+class NumericValidatorCompiledTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.validator = NumericValidator()
+        import sympy as sp
+
+        self.sp = sp
+        self.x = sp.Symbol("x")
+
+    def test_default_runs_many_vectorized_trials(self):
+        result = self.validator.validate_equivalence((self.x + 1) ** 2, self.x**2 + 2 * self.x + 1)
+
+        self.assertTrue(result.passed)
+        self.assertEqual("numpy", result.metadata["evaluation_backend"])
+        self.assertEqual(NumericValidator.COMPILED_TRIALS, result.metadata["trials"])
+
+    def test_mismatch_reports_substitution(self):
+        result = self.validator.validate_equivalence(self.sp.sqrt(self.x**2), self.x, seed=3)
+
+        self.assertFalse(result.passed)
+        self.assertEqual("numpy", result.metadata["evaluation_backend"])
+        self.assertLess(result.metadata["substitution"]["x"], 0)
+
+    def test_non_finite_samples_are_masked(self):
+        lhs = self.sp.log(self.x) - self.sp.log(self.x)
+        result = self.validator.validate_equivalence(lhs, self.sp.Integer(0), trials=200)
+
+        self.assertTrue(result.passed)
+        self.assertEqual(200, result.metadata["successful_trials"])
+
+    def test_large_magnitudes_compare_relatively(self):
+        lhs = (self.x + 1) ** 20
+        result = self.validator.validate_equivalence(lhs, self.sp.expand(lhs))
+
+        self.assertTrue(result.passed)
+
+    def test_uncompilable_expressions_fall_back_to_subs(self):
+        y = self.sp.Symbol("y")
+        lhs = self.sp.Integral(self.x**2, (self.x, 0, y))
+        result = self.validator.validate_equivalence(lhs, y**3 / 3)
+
+        self.assertTrue(result.passed)
+        self.assertEqual("subs", result.metadata["evaluation_backend"])
+        self.assertEqual(NumericValidator.SUBS_TRIALS, result.metadata["trials"])
+
+    def test_subs_path_is_used_without_compiled_backend(self):
+        with patch.object(NumericValidator, "_validate_compiled", return_value=None):
+            result = self.validator.validate_equivalence(self.x * 2, self.x + self.x, trials=4)
+
+        self.assertTrue(result.passed)
+        self.assertEqual("subs", result.metadata["evaluation_backend"])
+        self.assertEqual(4, result.metadata["trials"])
+
+
 class NumericValidatorPathTests(unittest.TestCase):
     def test_validate_path_returns_structured_result(self):
         v = NumericValidator()
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tars.validators.research.citations.citation_validator import CitationValidator
+from tars.validators.research.citations.offline_index import (
+    OFFLINE_INDEX_ENV,
+    OfflineIndex,
+    build_offline_index,
+)
+
+ARXIV_RECORDS = [
+    {
+        "id": "1706.03762",
+        "doi": None,
+        "comments": "15 pages, 5 figures",
+        "versions": [{"version": "v1"}, {"version": "v7"}, {"version": "v2"}],
+    },
+    {
+        "id": "hep-th/9711200",
+        "doi": "10.1023/A:1026654312961",
+        "comments": None,
+        "versions": [{"version": "v1"}, {"version": "v3"}],
+    },
+    {
+        "id": "1203.0001",
+        "comments": "This paper has been withdrawn by the author",
+        "versions": [{"version": "v1"}, {"version": "v2"}],
+    },
+]
+
+CROSSREF_DOCUMENT = {"items": [{"DOI": "10.1109/CVPR.2016.90"}, {"DOI": "10.1038/nature14539"}, {"title": ["no doi"]}]}
+
+
+class OfflineIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        with gzip.open(self.root / "arxiv-metadata-oai-snapshot.json.gz", "wt", encoding="utf-8") as handle:
+            for record in ARXIV_RECORDS:
+                handle.write(json.dumps(record) + "\n")
+        crossref = self.root / "crossref"
+        crossref.mkdir()
+        (crossref / "0.json").write_text(json.dumps(CROSSREF_DOCUMENT, indent=2), encoding="utf-8")
+        (crossref / "README.txt").write_text("not a dump", encoding="utf-8")
+
+        self.path = self.root / "index" / "citations.idx"
+        self.counts = build_offline_index([self.root / "arxiv-metadata-oai-snapshot.json.gz", crossref], self.path)
+        self.index = OfflineIndex(self.path)
+        self.addCleanup(self.index.close)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_build_counts_and_leaves_no_staging_files(self):
+        self.assertEqual({"doi": 3, "arxiv": 3}, self.counts)
+        self.assertEqual(self.counts, self.index.counts())
+        self.assertEqual(["citations.idx"], [p.name for p in self.path.parent.iterdir()])
+
+    def test_doi_lookups_are_normalized(self):
+        self.assertEqual((True, None), self.index.check_doi("https://doi.org/10.1109/cvpr.2016.90"))
+        self.assertEqual((True, None), self.index.check_doi("10.1023/a:1026654312961"))
+        self.assertEqual((False, "DOI not in offline index"), self.index.check_doi("10.1000/unknown"))
+        self.assertEqual((False, "Malformed DOI"), self.index.check_doi("not-a-doi"))
+
+    def test_arxiv_lookups_report_versions_and_withdrawals(self):
+        self.assertEqual(7, self.index.arxiv_record("arXiv:1706.03762v2").latest_version)
+        self.assertEqual((True, None), self.index.check_arxiv("hep-th/9711200v3"))
+        self.assertFalse(self.index.check_arxiv("hep-th/9711200v4")[0])
+        self.assertEqual((False, "arXiv paper withdrawn"), self.index.check_arxiv("1203.0001"))
+        self.assertEqual((False, "arXiv ID not in offline index"), self.index.check_arxiv("2501.99999"))
+
+    def test_pickles_by_path(self):
+        clone = pickle.loads(pickle.dumps(self.index))
+        self.addCleanup(clone.close)
+        self.assertTrue(clone.has_doi("10.1038/nature14539"))
+
+    def test_validator_uses_index_without_network(self):
+        tex = self.root / "paper.tex"
+        tex.write_text("Text \\cite{a,b}.", encoding="utf-8")
+        (self.root / "paper.bib").write_text(
+            """
+            @article{a, author = {He, K.}, title = {ResNet}, year = {2016}, journal = {CVPR}, doi = {10.1109/CVPR.2016.90}}
+            @article{b, author = {Vaswani, A.}, title = {Attention}, year = {2017}, journal = {NeurIPS},
+                     archivePrefix = {arXiv}, eprint = {1203.0001}}
+            """,
+            encoding="utf-8",
+        )
+
+        def no_network(*_args, **_kwargs):
+            raise AssertionError("network check should not run")
+
+        with patch(
+            "tars.validators.research.citations.citation_validator.doi_resolves", side_effect=no_network
+        ), patch(
+            "tars.validators.research.citations.citation_validator.arxiv_exists", side_effect=no_network
+        ), patch.dict(os.environ, {OFFLINE_INDEX_ENV: str(self.path)}):
+            result = CitationValidator().validate(tex)
+
+        self.assertEqual(
+            [{"key": "a", "doi": "10.1109/CVPR.2016.90", "ok": True, "reason": None}], result.metadata["doi_checks"]
+        )
+        self.assertEqual("arXiv paper withdrawn", result.metadata["arxiv_checks"][0]["reason"])
+        self.assertEqual(str(self.path), result.metadata["offline_index"])
+
+    def test_missing_index_file(self):
+        with self.assertRaises(FileNotFoundError):
+            OfflineIndex(self.root / "missing.idx")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import os
+import pickle
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tars.validators.context import ArtifactContext
+from tars.validators.project import ProjectLoader, find_main_tex, load_project
+from tars.validators.research.citations.citation_validator import CitationValidator
+from tars.validators.research.math.math_extractor import MathExtractor
+
+
+class LatexProjectTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        (self.root / "sections").mkdir()
+        self.main = self.write(
+            "main.tex",
+            "\\documentclass{article}\n"
+            "\\begin{document}\n"
+            "Intro $a=b$ \\cite{intro}.\n"
+            "\\input{sections/method}\n"
+            "% \\input{sections/unused}\n"
+            "\\include{sections/results.tex}\n"
+            "\\bibliography{refs,extra}\n"
+            "\\end{document}\n",
+        )
+        self.write("sections/method.tex", "Method\n\\[x = y + 1\\]\n\\subimport{./}{detail}\n")
+        self.write("sections/detail.tex", "Detail $z=2$ \\citep{detail}\n")
+        self.write("sections/unused.tex", "$never$")
+        self.write("sections/results.tex", "Results $r=1$ \\cite{results,intro}\n")
+        self.write("refs.bib", "@article{intro, title = {Intro}}\n@article{results, title = {Results}}")
+        self.write("extra.bib", "@misc{detail, title = {Detail}}")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def write(self, name: str, text: str) -> Path:
+        path = self.root / name
+        path.write_text(text, encoding="utf-8")
+        return path
+
+    def test_includes_are_spliced_in_document_order(self):
+        project = load_project(self.main)
+
+        self.assertEqual(
+            ["main.tex", "method.tex", "detail.tex", "results.tex"], [file.path.name for file in project.files]
+        )
+        self.assertEqual(["refs.bib", "extra.bib"], [file.path.name for file in project.bib_files])
+        self.assertEqual([], project.missing)
+        text = project.text
+        self.assertLess(text.index("Intro"), text.index("Method"))
+        self.assertLess(text.index("Method"), text.index("Detail"))
+        self.assertLess(text.index("Detail"), text.index("Results"))
+        self.assertNotIn("\\input{sections/method}", text)
+        self.assertNotIn("$never$", text)
+
+    def test_locate_maps_unified_offsets_back_to_files(self):
+        context = ArtifactContext(self.main)
+        text = context.text
+
+        path, line, column = context.locate(text.index("$z=2$"))
+        self.assertEqual(self.root / "sections" / "detail.tex", path)
+        self.assertEqual((1, 8), (line, column))
+        self.assertEqual((self.main, 3, 1), context.locate(text.index("Intro")))
+        self.assertEqual((self.root / "sections" / "results.tex", 1, 1), context.locate(text.index("Results")))
+        with self.assertRaises(IndexError):
+            context.locate(len(text) + 1)
+
+    def test_math_and_citations_carry_file_prefixed_locations(self):
+        context = ArtifactContext(self.main)
+
+        locations = [equation.source_location for equation in context.equations]
+        self.assertEqual(
+            [
+                "line:3:col:7:inline",
+                "sections/method.tex:line:2:col:1:display_brackets",
+                "sections/detail.tex:line:1:col:8:inline",
+                "sections/results.tex:line:1:col:9:inline",
+            ],
+            locations,
+        )
+        citations = context.citations
+        self.assertEqual({"intro", "detail", "results"}, citations.cite_keys)
+        self.assertEqual({"intro", "detail", "results"}, citations.bib_keys)
+        self.assertEqual(
+            ["line:3:col:13:cite", "sections/results.tex:line:1:col:15:cite"], citations.cite_locations["intro"]
+        )
+
+    def test_include_cycles_and_missing_files_are_tolerated(self):
+        self.write("sections/a.tex", "A \\input{sections/b}")
+        self.write("sections/b.tex", "B \\input{sections/a} \\input{sections/ghost}")
+        main = self.write("cycle.tex", "\\input{sections/a}")
+
+        project = load_project(main)
+
+        self.assertEqual(["cycle.tex", "a.tex", "b.tex"], [file.path.name for file in project.files])
+        self.assertEqual(["sections/ghost"], project.missing)
+
+    def test_missing_import_targets_keep_their_directory(self):
+        main = self.write(
+            "imports.tex", "\\subimport{chap/}{intro}\n\\import{appendix/}{extra.tex}\n\\input{sections/method}\n"
+        )
+        self.write("sections/method.tex", "\\subimport{../chap/}{later}\n")
+
+        project = load_project(main)
+
+        self.assertEqual(["chap/intro", "appendix/extra.tex", "chap/later"], project.missing)
+
+    def test_missing_includes_are_reported_by_validators(self):
+        self.write("sections/results.tex", "Results $r=1$ \\input{sections/ghost} \\cite{results,intro}\n")
+
+        math = MathExtractor().validate(self.main)
+        citations = CitationValidator().validate(self.main)
+
+        self.assertEqual(["sections/ghost"], math.metadata["missing_includes"])
+        self.assertEqual(["sections/ghost"], citations.metadata["missing_includes"])
+        self.assertIn(
+            "Included files not found, their citations are not checked: sections/ghost",
+            citations.metadata["warnings"],
+        )
+        complete = MathExtractor().validate(self.root / "sections" / "detail.tex")
+        self.assertEqual([], complete.metadata["missing_includes"])
+
+    def test_bbl_is_spliced_at_bibliography(self):
+        self.write("main.bbl", "\\begin{thebibliography}{1}\n\\bibitem{intro} Intro.\n\\end{thebibliography}\n")
+
+        project = load_project(self.main)
+
+        self.assertIn("\\bibitem{intro}", project.text)
+        self.assertNotIn("\\bibliography{refs,extra}", project.text)
+        self.assertIn("intro", project.citations().bib_keys)
+
+    def test_loader_reparses_only_the_edited_file(self):
+        loader = ProjectLoader()
+        calls: list[str] = []
+        original = MathExtractor.extract_text
+
+        def counting(extractor, text, index=None):
+            calls.append(text)
+            return original(extractor, text, index)
+
+        with patch.object(MathExtractor, "extract_text", counting):
+            ArtifactContext(self.main, loader=loader).equations
+            self.assertEqual(4, len(calls))
+
+            ArtifactContext(self.main, loader=loader).equations
+            self.assertEqual(4, len(calls))
+
+            detail = self.root / "sections" / "detail.tex"
+            detail.write_text("Detail $z=3$ edited \\citep{detail}\n", encoding="utf-8")
+            os.utime(detail, ns=(detail.stat().st_mtime_ns + 10**9,) * 2)
+            equations = ArtifactContext(self.main, loader=loader).equations
+
+        self.assertEqual(5, len(calls))
+        self.assertIn("z=3", calls[-1])
+        self.assertEqual("3", equations[2].rhs)
+
+    def test_touch_without_change_keeps_parses(self):
+        loader = ProjectLoader()
+        loader.load(self.main)
+        reads = loader.reads
+        detail = loader.file(self.root / "sections" / "detail.tex")
+        detail.memo("marker", lambda: "kept")
+
+        path = self.root / "sections" / "detail.tex"
+        os.utime(path, ns=(path.stat().st_mtime_ns + 10**9,) * 2)
+        loader.load(self.main)
+
+        self.assertEqual(reads + 1, loader.reads)
+        self.assertEqual("kept", loader.file(path).memo("marker", lambda: "rebuilt"))
+
+    def test_loader_drops_least_recently_used_files(self):
+        loader = ProjectLoader(max_files=2)
+        main = loader.file(self.main)
+        loader.file(self.root / "sections" / "method.tex")
+        self.assertIs(main, loader.file(self.main))
+        loader.file(self.root / "sections" / "detail.tex")
+
+        self.assertEqual(
+            [self.main.resolve(), (self.root / "sections" / "detail.tex").resolve()], list(loader._files)
+        )
+        reads = loader.reads
+        loader.file(self.root / "sections" / "method.tex")
+        self.assertEqual(reads + 1, loader.reads)
+        self.assertEqual(2, len(loader._files))
+
+    def test_context_pickles_after_preload(self):
+        context = ArtifactContext(self.main, loader=ProjectLoader())
+        context.preload()
+
+        clone = pickle.loads(pickle.dumps(context))
+
+        self.assertEqual(
+            [equation.source_location for equation in context.equations],
+            [equation.source_location for equation in clone.equations],
+        )
+        self.assertEqual(context.citations.cite_keys, clone.citations.cite_keys)
+
+
+class FindMainTexTests(unittest.TestCase):
+    def test_prefers_root_document_over_larger_included_file(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            (root / "ms.tex").write_text(
+                "\\documentclass{article}\n\\begin{document}\\input{appendix}\\end{document}", encoding="utf-8"
+            )
+            (root / "appendix.tex").write_text("long appendix text " * 200, encoding="utf-8")
+            (root / "standalone.tex").write_text(
+                "% \\documentclass{article}\n" + "figure " * 300, encoding="utf-8"
+            )
+
+            self.assertEqual(root / "ms.tex", find_main_tex(root))
+
+    def test_included_documentclass_file_loses_to_its_parent(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            (root / "paper.tex").write_text(
+                "\\documentclass{article}\n\\begin{document}\\subfile{chapter}\\end{document}", encoding="utf-8"
+            )
+            (root / "chapter.tex").write_text(
+                "\\documentclass[paper]{subfiles}\n\\begin{document}" + "words " * 300 + "\\end{document}",
+                encoding="utf-8",
+            )
+
+            self.assertEqual(root / "paper.tex", find_main_tex(root))
+
+
+if __name__ == "__main__":
+    unittest.main()
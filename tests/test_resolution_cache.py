@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import os
+import pickle
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tars.validators.cache import CACHE_DIR_ENV
+from tars.validators.research.citations.citation_validator import CitationValidator
+from tars.validators.research.citations.resolution_cache import ResolutionCache, normalize_identifier
+from tars.validators.research.citations.resolver import CitationResolver
+
+
+class _Counter:
+    def __init__(self, result, delay: float = 0.0) -> None:
+        self.result = result
+        self.delay = delay
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, *_args, **_kwargs):
+        with self.lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return self.result
+
+
+class NormalizeIdentifierTests(unittest.TestCase):
+    def test_doi_prefixes_and_case_are_dropped(self):
+        for raw in ("10.1000/ABC", "doi:10.1000/abc", " https://doi.org/10.1000/Abc ", "http://dx.doi.org/10.1000/abc"):
+            self.assertEqual("10.1000/abc", normalize_identifier("doi", raw))
+
+    def test_arxiv_prefix_is_dropped(self):
+        self.assertEqual("1706.03762", normalize_identifier("arxiv", "arXiv:1706.03762"))
+        self.assertEqual("hep-th/9901001", normalize_identifier("arxiv", "https://arxiv.org/abs/hep-th/9901001"))
+
+    def test_unknown_kind(self):
+        with self.assertRaises(ValueError):
+            normalize_identifier("isbn", "123")
+
+
+class ResolutionCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _cache(self, **kwargs) -> ResolutionCache:
+        cache = ResolutionCache(self.cache_dir, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_hit_is_shared_across_instances_and_identifier_spellings(self):
+        resolve = _Counter((True, None))
+        self.assertEqual((True, None), self._cache().get_or_resolve("doi", "10.1000/ABC", resolve))
+
+        other = self._cache()
+        self.assertEqual((True, None), other.get_or_resolve("doi", "doi:10.1000/abc", resolve))
+        self.assertEqual(1, resolve.calls)
+        self.assertEqual((1, 0), (other.hits, other.misses))
+
+    def test_positive_and_negative_ttls_differ(self):
+        cache = self._cache(positive_ttl=60.0, negative_ttl=0.05)
+        cache.put("doi", "10.1000/good", (True, None))
+        cache.put("doi", "10.1000/gone", (False, "DOI HTTP error: 404"))
+        self.assertEqual((False, "DOI HTTP error: 404"), cache.get("doi", "10.1000/gone"))
+
+        time.sleep(0.1)
+        self.assertEqual((True, None), cache.get("doi", "10.1000/good"))
+        self.assertIsNone(cache.get("doi", "10.1000/gone"))
+
+    def test_transient_failures_are_not_cached(self):
+        cache = self._cache()
+        for reason in ("DOI HTTP error: 503", "DOI resolution failed: timed out", CitationResolver.DEADLINE_REASON):
+            self.assertFalse(cache.put("doi", "10.1000/x", (False, reason)))
+        self.assertTrue(cache.put("arxiv", "bad id", (False, "Malformed arXiv ID")))
+        self.assertIsNone(cache.get("doi", "10.1000/x"))
+
+        resolve = _Counter((False, "DOI HTTP error: 500"))
+        cache.get_or_resolve("doi", "10.1000/x", resolve)
+        cache.get_or_resolve("doi", "10.1000/x", resolve)
+        self.assertEqual(2, resolve.calls)
+
+    def test_concurrent_lookups_resolve_once(self):
+        cache = self._cache()
+        resolve = _Counter((True, None), delay=0.1)
+        results = []
+
+        def lookup():
+            results.append(cache.get_or_resolve("arxiv", "1706.03762", resolve))
+
+        threads = [threading.Thread(target=lookup) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([(True, None)] * 8, results)
+        self.assertEqual(1, resolve.calls)
+        self.assertEqual(1, cache.misses)
+        self.assertEqual(7, cache.hits + cache.coalesced)
+
+    def test_waits_for_result_of_another_lease_holder(self):
+        holder = self._cache()
+        self.assertTrue(holder._try_lease("doi", "10.1000/abc", "other-process"))
+
+        def finish():
+            time.sleep(0.1)
+            holder.put("doi", "10.1000/abc", (True, None))
+
+        threading.Thread(target=finish).start()
+        waiter = self._cache()
+        resolve = _Counter((False, "DOI HTTP error: 404"))
+
+        self.assertEqual((True, None), waiter.get_or_resolve("doi", "10.1000/abc", resolve))
+        self.assertEqual(0, resolve.calls)
+        self.assertEqual(1, waiter.coalesced)
+
+    def test_expired_lease_is_taken_over(self):
+        holder = self._cache(lease_seconds=0.1)
+        self.assertTrue(holder._try_lease("doi", "10.1000/abc", "crashed-worker"))
+
+        resolve = _Counter((True, None))
+        self.assertEqual((True, None), self._cache().get_or_resolve("doi", "10.1000/abc", resolve))
+        self.assertEqual(1, resolve.calls)
+
+    def test_pickles_by_configuration(self):
+        cache = self._cache(negative_ttl=5.0)
+        cache.put("doi", "10.1000/abc", (True, None))
+        clone = pickle.loads(pickle.dumps(cache))
+        self.addCleanup(clone.close)
+
+        self.assertEqual(5.0, clone.negative_ttl)
+        self.assertEqual((True, None), clone.get("doi", "10.1000/abc"))
+
+    def test_validator_reports_per_run_cache_stats(self):
+        tex = self.cache_dir / "paper.tex"
+        tex.write_text("Text \\cite{a,b}.", encoding="utf-8")
+        (self.cache_dir / "paper.bib").write_text(
+            """
+            @article{a, author = {Doe, Jane}, title = {A}, year = {2020}, journal = {J}, doi = {10.1000/abc}}
+            @article{b, author = {Roe, Rich}, title = {B}, year = {2021}, journal = {J}, doi = {10.1000/def}}
+            """,
+            encoding="utf-8",
+        )
+        validator = CitationValidator(resolver=CitationResolver(cache=self._cache()))
+
+        with patch(
+            "tars.validators.research.citations.citation_validator.doi_resolves",
+            return_value=(True, None),
+        ) as doi_mock:
+            first = validator.validate(tex)
+            second = validator.validate(tex)
+            with patch.dict(os.environ, {CACHE_DIR_ENV: ""}):
+                uncached = CitationValidator().validate(tex)
+
+        self.assertEqual(4, doi_mock.call_count)
+        self.assertEqual({"hits": 0, "misses": 2, "coalesced": 0}, first.metadata["resolution_cache"])
+        self.assertEqual({"hits": 2, "misses": 0, "coalesced": 0}, second.metadata["resolution_cache"])
+        self.assertNotIn("resolution_cache", uncached.metadata)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import importlib.util
+import io
+import pickle
+import shutil
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tars.cli import main
+from tars.validators.research.math.math_validator import MathValidator
+from tars.validators.research.math.result_store import EquationResultStore, is_reusable
+
+
+HAS_SYMPY = importlib.util.find_spec("sympy") is not None
+HAS_LATEX2SYMPY2 = importlib.util.find_spec("latex2sympy2") is not None
+
+EXAMPLES = Path(__file__).resolve().parents[1] / "examples" / "research"
+
+
+def _without_cached(details: list[dict]) -> list[dict]:
+    return [{key: value for key, value in item.items() if key != "cached"} for item in details]
+
+
+class EquationResultStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self._tmp.name)
+        self.store = EquationResultStore(self.cache_dir, version="test")
+        self.addCleanup(self.store.close)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_fingerprint_ignores_location_but_not_content_or_options(self):
+        equation = {"raw": "x = y", "lhs": "x", "rhs": "y", "source_location": "line:1:col:1:inline"}
+        moved = {**equation, "source_location": "sections/a.tex:line:9:col:3:equation"}
+        edited = {**equation, "raw": "x = z", "rhs": "z"}
+
+        self.assertEqual(self.store.fingerprint(equation), self.store.fingerprint(moved))
+        self.assertNotEqual(self.store.fingerprint(equation), self.store.fingerprint(edited))
+        self.assertNotEqual(
+            self.store.fingerprint(equation), self.store.fingerprint(equation, {"symbolic_timeout": 1.0})
+        )
+        other_version = EquationResultStore(self.cache_dir, version="other")
+        self.addCleanup(other_version.close)
+        self.assertNotEqual(self.store.fingerprint(equation), other_version.fingerprint(equation))
+
+    def test_round_trip_drops_location_and_skips_unstable_results(self):
+        passed = {"source_location": "line:1:col:1:inline", "raw": "x=x", "decision_path": ["symbolic_pass"]}
+        timed_out = {"raw": "y=y", "decision_path": ["symbolic_timeout"], "timed_out": True}
+        crashed = {"raw": "z=z", "decision_path": ["equation_processing_exception"]}
+
+        written = self.store.put_many([("a", passed), ("b", timed_out), ("c", crashed)])
+
+        self.assertEqual(1, written)
+        self.assertFalse(is_reusable(timed_out))
+        self.assertEqual({"a": {"raw": "x=x", "decision_path": ["symbolic_pass"]}}, self.store.get_many(["a", "b"]))
+
+    def test_persists_across_instances_and_pickles_by_path(self):
+        self.store.put_many([("a", {"raw": "x=x", "decision_path": []})])
+        self.store.close()
+
+        clone = pickle.loads(pickle.dumps(self.store))
+        self.addCleanup(clone.close)
+
+        self.assertEqual(["a"], list(clone.get_many(["a"])))
+        self.assertEqual(1, clone.entry_count())
+
+    def test_close_evicts_least_recently_used(self):
+        store = EquationResultStore(self.cache_dir, version="test", max_entries=2)
+        for key in ("a", "b", "c"):
+            store.put_many([(key, {"raw": key, "decision_path": []})])
+        store.get_many(["a"])
+        store.close()
+
+        self.assertEqual({"a", "c"}, set(store.get_many(["a", "b", "c"])))
+        store.close()
+
+
+@unittest.skipUnless(HAS_SYMPY and HAS_LATEX2SYMPY2, "sympy/latex2sympy2 not installed")
+class IncrementalMathValidationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.paper = self.root / "paper.tex"
+        shutil.copy(EXAMPLES / "math_invalid.tex", self.paper)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_rerun_reuses_every_equation_and_matches_full_run(self):
+        full = MathValidator().validate(self.paper)
+        store = EquationResultStore(self.root / "cache")
+        self.addCleanup(store.close)
+
+        first = MathValidator(results=store).validate(self.paper)
+        with patch.object(MathValidator, "_validate_one_equation", side_effect=AssertionError("re-checked")):
+            second = MathValidator(results=store).validate(self.paper)
+
+        total = full.metadata["equation_count"]
+        self.assertEqual({"reused_equations": 0, "rechecked_equations": total}, first.metadata["incremental"])
+        self.assertEqual({"reused_equations": total, "rechecked_equations": 0}, second.metadata["incremental"])
+        self.assertTrue(all(item["cached"] for item in second.metadata["results"]))
+        for run in (first, second):
+            self.assertEqual(full.metadata["results"], _without_cached(run.metadata["results"]))
+            self.assertEqual(full.metadata["metrics"], run.metadata["metrics"])
+            self.assertEqual((full.passed, full.status, full.errors), (run.passed, run.status, run.errors))
+
+    def test_only_edited_equations_are_rechecked(self):
+        store = EquationResultStore(self.root / "cache")
+        self.addCleanup(store.close)
+        MathValidator(results=store).validate(self.paper)
+
+        text = self.paper.read_text(encoding="utf-8")
+        self.paper.write_text("\\[q^2 = q \\cdot q\\]\n" + text, encoding="utf-8")
+        checked: list[str] = []
+        original = MathValidator._validate_one_equation
+
+        def recording(validator, equation):
+            checked.append(equation["raw"])
+            return original(validator, equation)
+
+        with patch.object(MathValidator, "_validate_one_equation", recording):
+            result = MathValidator(results=store).validate(self.paper)
+
+        self.assertEqual(["q^2 = q \\cdot q"], checked)
+        self.assertEqual(1, result.metadata["incremental"]["rechecked_equations"])
+        full = MathValidator().validate(self.paper)
+        self.assertEqual(full.metadata["results"], _without_cached(result.metadata["results"]))
+
+    def test_cli_incremental_flag_reports_reuse(self):
+        for expected in ("reused_equations=0", "rechecked_equations=0"):
+            buffer = io.StringIO()
+            with redirect_stdout(buffer):
+                main(["validate-math", str(self.paper), "--incremental", "--cache-dir", str(self.root / "cache")])
+            self.assertIn(expected, buffer.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
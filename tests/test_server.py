@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import importlib.util
+import io
+import json
+import sys
+import tempfile
+import threading
+import time
+import unittest
+import urllib.error
+import urllib.request
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tars.cli import main
+from tars.server import (
+    QueueFullError,
+    RemoteClient,
+    RemoteError,
+    ValidationService,
+    default_validator_factories,
+    make_server,
+)
+from tars.validators.base import BaseValidator
+from tars.validators.context import ArtifactContext
+from tars.validators.result import ValidationResult
+
+
+HAS_SYMPY = importlib.util.find_spec("sympy") is not None
+HAS_LATEX2SYMPY2 = importlib.util.find_spec("latex2sympy2") is not None
+
+PAPER = "Intro \\[x + x = 2x\\]\n\\begin{equation}y \\cdot y = 3y\\end{equation}\n"
+
+
+class _LengthValidator(BaseValidator):
+    """Counts the paper's characters; counts its own constructions to check reuse."""
+
+    name = "length"
+    instances = 0
+
+    def __init__(self) -> None:
+        type(self).instances += 1
+
+    def validate(self, artifact_path: Path) -> ValidationResult:
+        return self.validate_context(ArtifactContext(artifact_path))
+
+    def validate_context(self, context: ArtifactContext) -> ValidationResult:
+        return ValidationResult(name=self.name, passed=True, status="PASS", metadata={"length": len(context.text)})
+
+
+class _BlockingValidator(_LengthValidator):
+    name = "blocking"
+    release = threading.Event()
+
+    def validate_context(self, context: ArtifactContext) -> ValidationResult:
+        self.release.wait(5)
+        return super().validate_context(context)
+
+
+class _Daemon:
+    """A service plus HTTP (or Unix socket) server running in background threads."""
+
+    def __init__(self, service: ValidationService, *, unix_socket: str | None = None) -> None:
+        self.service = service
+        self.server = make_server(service, port=0, unix_socket=unix_socket)
+        service.start()
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        if unix_socket is not None:
+            self.url = f"unix://{unix_socket}"
+        else:
+            host, port = self.server.server_address[:2]
+            self.url = f"http://{host}:{port}"
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self.service.stop(timeout=5)
+
+
+class ValidationServiceTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.paper = Path(self._tmp.name) / "paper.tex"
+        self.paper.write_text(PAPER, encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_workers_reuse_validators_across_jobs(self):
+        _LengthValidator.instances = 0
+        service = ValidationService(factories={"length": _LengthValidator})
+
+        jobs = [service.submit(self.paper, ["length"]) for _ in range(3)]
+        for job in jobs:
+            service.run(job)
+
+        self.assertEqual(1, _LengthValidator.instances)
+        self.assertEqual(["done"] * 3, [job.status for job in jobs])
+        self.assertEqual(len(PAPER), jobs[0].results[0]["metadata"]["length"])
+        self.assertEqual(
+            [
+                {"type": "result", "validator": "length", "status": "PASS", "passed": True},
+                {"type": "done", "status": "done", "error": None},
+            ],
+            list(jobs[0].iter_events()),
+        )
+
+    def test_bounded_queue_and_unknown_validators_are_rejected(self):
+        service = ValidationService(max_queue=1, factories={"length": _LengthValidator})
+        service.submit(self.paper, ["length"])
+
+        with self.assertRaises(QueueFullError):
+            service.submit(self.paper, ["length"])
+        with self.assertRaises(KeyError):
+            service.submit(self.paper, ["nope"])
+        with self.assertRaises(ValueError):
+            service.submit(self.paper, [])
+        self.assertEqual(1, service.stats()["queued"])
+
+    def test_failing_job_reports_error(self):
+        def broken() -> BaseValidator:
+            raise RuntimeError("cannot build")
+
+        service = ValidationService(factories={"broken": broken})
+        job = service.submit(self.paper, ["broken"])
+        service.run(job)
+
+        self.assertEqual("error", job.status)
+        self.assertEqual("RuntimeError: cannot build", job.error)
+
+    def test_finished_jobs_are_pruned(self):
+        service = ValidationService(max_finished=2, factories={"length": _LengthValidator})
+        jobs = [service.submit(self.paper, ["length"]) for _ in range(3)]
+        for job in jobs:
+            service.run(job)
+
+        self.assertIsNone(service.get(jobs[0].id))
+        self.assertIs(jobs[2], service.get(jobs[2].id))
+
+
+class HttpApiTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.paper = self.root / "paper.tex"
+        self.paper.write_text(PAPER, encoding="utf-8")
+        _BlockingValidator.release.set()
+        self.daemon = _Daemon(
+            ValidationService(max_queue=1, factories={"length": _LengthValidator, "blocking": _BlockingValidator})
+        )
+        self.addCleanup(self.daemon.close)
+        self.client = RemoteClient(self.daemon.url, timeout=10)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def post(self, body: bytes) -> tuple[int, dict]:
+        request = urllib.request.Request(f"{self.daemon.url}/jobs", data=body, method="POST")
+        try:
+            with urllib.request.urlopen(request, timeout=10) as response:
+                return response.status, json.loads(response.read())
+        except urllib.error.HTTPError as exc:
+            return exc.code, json.loads(exc.read())
+
+    def test_submit_stream_and_fetch_results(self):
+        events: list[dict] = []
+
+        (result,) = self.client.validate(self.paper, ["length"], on_event=events.append)
+
+        self.assertEqual(len(PAPER), result.metadata["length"])
+        self.assertEqual(["result", "done"], [event["type"] for event in events])
+        self.assertEqual(1, self.client.health()["finished"])
+
+    def test_bad_requests(self):
+        self.assertEqual(400, self.post(b"not json")[0])
+        self.assertEqual(400, self.post(json.dumps({"validators": ["length"]}).encode())[0])
+        status, payload = self.post(json.dumps({"paper": str(self.paper), "validators": ["nope"]}).encode())
+        self.assertEqual((400, "Unknown validators: nope"), (status, payload["error"]))
+        for body in (
+            [],
+            {"paper": 1},
+            {"paper": str(self.paper), "validators": "length"},
+            {"paper": str(self.paper), "validators": [1]},
+            {"paper": str(self.paper), "validators": [None, "length"]},
+            {"paper": str(self.paper), "validators": []},
+        ):
+            with self.subTest(body=body):
+                status, payload = self.post(json.dumps(body).encode())
+                self.assertEqual(400, status)
+                self.assertIn("Expected", payload["error"])
+        self.assertEqual(0, self.client.health()["queued"])
+        with self.assertRaisesRegex(RemoteError, "Unknown job"):
+            self.client.job("job-999")
+
+    def test_full_queue_returns_503(self):
+        _BlockingValidator.release.clear()
+        try:
+            running = self.client.submit(self.paper, ["blocking"])
+            while self.client.job(running["id"])["status"] != "running":
+                time.sleep(0.01)
+            self.client.submit(self.paper, ["length"])
+
+            status, payload = self.post(json.dumps({"paper": str(self.paper), "validators": ["length"]}).encode())
+        finally:
+            _BlockingValidator.release.set()
+
+        self.assertEqual(503, status)
+        self.assertIn("queue is full", payload["error"])
+
+    def test_unix_socket_transport(self):
+        socket_path = str(self.root / "tars.sock")
+        daemon = _Daemon(ValidationService(factories={"length": _LengthValidator}), unix_socket=socket_path)
+        self.addCleanup(daemon.close)
+
+        (result,) = RemoteClient(daemon.url, timeout=10).validate(self.paper, ["length"])
+
+        self.assertTrue(result.passed)
+
+    def test_unreachable_daemon(self):
+        with self.assertRaisesRegex(RemoteError, "Cannot reach"):
+            RemoteClient(f"unix://{self.root / 'missing.sock'}").health()
+
+
+@unittest.skipUnless(HAS_SYMPY and HAS_LATEX2SYMPY2, "sympy/latex2sympy2 not installed")
+class RemoteMathValidationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.paper = Path(self._tmp.name) / "paper.tex"
+        self.paper.write_text(PAPER, encoding="utf-8")
+        self.daemon = _Daemon(ValidationService(factories=default_validator_factories()))
+        self.addCleanup(self.daemon.close)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_equations_stream_before_the_final_result(self):
+        events: list[dict] = []
+
+        (result,) = RemoteClient(self.daemon.url, timeout=30).validate(self.paper, on_event=events.append)
+
+        self.assertEqual(["equation", "equation", "result", "done"], [event["type"] for event in events])
+        self.assertEqual(["PASS", "FAIL"], [event["status"] for event in events[:2]])
+        streamed = [{k: v for k, v in event.items() if k not in ("type", "validator")} for event in events[:2]]
+        self.assertEqual(result.metadata["results"], streamed)
+
+    def test_cli_remote_matches_local_output(self):
+        outputs = []
+        local = ["validate-math", str(self.paper)]
+        for argv in ([*local, "--remote", self.daemon.url], local):
+            buffer = io.StringIO()
+            with redirect_stdout(buffer):
+                self.assertEqual(0, main(argv))
+            outputs.append(buffer.getvalue())
+
+        self.assertEqual(outputs[1], outputs[0])
+        self.assertIn("status=FAIL", outputs[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
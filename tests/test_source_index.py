@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tars.validators.source_index import SourceIndex
+
+
+class SourceIndexTests(unittest.TestCase):
+    def test_positions_are_one_based_lines_and_columns(self):
+        text = "ab\ncde\n\nf"
+        index = SourceIndex(text)
+
+        self.assertEqual(4, index.line_count)
+        self.assertEqual((1, 1), index.position(0))
+        self.assertEqual((1, 3), index.position(2))
+        self.assertEqual((2, 1), index.position(3))
+        self.assertEqual((2, 3), index.position(text.index("e")))
+        self.assertEqual((3, 1), index.position(7))
+        self.assertEqual((4, 1), index.position(text.index("f")))
+        self.assertEqual((4, 2), index.position(len(text)))
+
+    def test_matches_newline_counting(self):
+        text = "x\n" * 50 + "$a$ and\n\n  $b$\n"
+        index = SourceIndex(text)
+        for offset in range(len(text) + 1):
+            self.assertEqual(text.count("\n", 0, offset) + 1, index.line_number(offset))
+
+    def test_location_string_and_bounds(self):
+        index = SourceIndex("one\n  two")
+
+        self.assertEqual("line:2:col:3:inline", index.location(6, "inline"))
+        with self.assertRaises(IndexError):
+            index.position(100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+# Heavy optional dependencies that light commands must never import.
+FORBIDDEN = ("sympy", "latex2sympy2", "antlr4", "pint", "numpy", "google")
+
+# Import time budget (milliseconds of `-X importtime` self time, beyond what a
+# bare interpreter imports) for starting a CLI and handling a light command.
+# argparse alone accounts for ~10 ms; the budget leaves room for slow CI.
+STARTUP_BUDGET_MS = 60
+
+
+def _run(*args: str) -> tuple[subprocess.CompletedProcess[str], dict[str, int]]:
+    """Run ``python -X importtime *args`` and return the process and ``{module: self_us}``."""
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    env.pop("TARS_REMOTE", None)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=120,
+    )
+    modules: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, name = (part.strip() for part in line[len("import time:") :].split("|"))
+        modules[name] = int(self_us)
+    return proc, modules
+
+
+class StartupTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        _proc, cls.baseline = _run("-c", "pass")
+
+    def assert_light(self, modules: dict[str, int]) -> None:
+        heavy = sorted({name.split(".")[0] for name in modules} & set(FORBIDDEN))
+        self.assertEqual([], heavy)
+        added_ms = sum(us for name, us in modules.items() if name not in self.baseline) / 1000
+        self.assertLess(added_ms, STARTUP_BUDGET_MS, f"startup imports took {added_ms:.1f} ms")
+
+    def test_tars_help(self):
+        proc, modules = _run("-m", "tars.cli", "--help")
+
+        self.assertEqual(0, proc.returncode, proc.stderr[-2000:])
+        self.assertIn("validate-math", proc.stdout)
+        self.assert_light(modules)
+        self.assertNotIn("tars.validators.research", modules)
+
+    def test_argument_error(self):
+        proc, modules = _run("-m", "tars.cli", "validate-math")
+
+        self.assertEqual(2, proc.returncode)
+        self.assert_light(modules)
+
+    def test_build_citation_index_does_not_import_math_stack(self):
+        with tempfile.TemporaryDirectory() as td:
+            dump = Path(td) / "dump.jsonl"
+            dump.write_text(json.dumps({"id": "1706.03762", "versions": [{"version": "v1"}]}) + "\n")
+
+            proc, modules = _run("-m", "tars.cli", "build-citation-index", str(dump), "--output", f"{td}/idx")
+
+        self.assertEqual(0, proc.returncode, proc.stderr[-2000:])
+        self.assertEqual([], sorted({name.split(".")[0] for name in modules} & set(FORBIDDEN)))
+        self.assertNotIn("tars.validators.research.math", modules)
+
+    def test_analyzer_help(self):
+        proc, modules = _run("-m", "tars_analyzer.cli", "--help")
+
+        self.assertEqual(0, proc.returncode, proc.stderr[-2000:])
+        self.assert_light(modules)
+        self.assertNotIn("tars_analyzer.gemini_client", modules)
+
+
+if __name__ == "__main__":
+    unittest.main()
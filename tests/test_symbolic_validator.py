@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import importlib.util
 import sys
+import threading
+import time
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
@@ -103,6 +106,117 @@ class SymbolicValidatorTests(unittest.TestCase):
         self.assertTrue(result.passed)
 
 
+@unittest.skipUnless(HAS_SYMPY, "sympy not installed")
+class SymbolicValidatorStageTests(unittest.TestCase):
+    def setUp(self) -> None:
+        import sympy as sp
+
+        self.sp = sp
+        self.x = sp.Symbol("x")
+        self.validator = SymbolicValidator()
+
+    def _decided_by(self, lhs, rhs):
+        return self.validator.validate_equivalence(lhs, rhs).metadata["decided_by"]
+
+    def test_cheap_stages_decide_common_identities(self):
+        x, sp = self.x, self.sp
+        self.assertEqual("structural", self._decided_by(x + 1, 1 + x))
+        self.assertEqual("expand", self._decided_by((x + 1) ** 2, x**2 + 2 * x + 1))
+        self.assertEqual("cancel", self._decided_by((x**2 - 1) / (x - 1), x + 1))
+        self.assertEqual("trigsimp", self._decided_by(sp.sin(x) ** 2 + sp.cos(x) ** 2, sp.Integer(1)))
+
+    def test_numeric_probe_rejects_without_simplify(self):
+        with patch.object(SymbolicValidator, "_simplify_difference") as simplify:
+            result = self.validator.validate_equivalence((self.x + 1) ** 2, self.x**2 + 1)
+
+        simplify.assert_not_called()
+        self.assertFalse(result.passed)
+        self.assertEqual("numeric_probe", result.metadata["decided_by"])
+
+    def test_full_simplify_is_the_last_resort(self):
+        result = self.validator.validate_equivalence(self.sp.gamma(self.x + 1), self.x * self.sp.gamma(self.x))
+
+        self.assertTrue(result.passed)
+        self.assertEqual("simplify", result.metadata["decided_by"])
+
+    def test_matrices_skip_the_numeric_probe(self):
+        lhs = self.sp.Matrix([[(self.x + 1) ** 2, 0], [0, self.x]])
+        rhs = self.sp.Matrix([[self.x**2 + 1, 0], [0, self.x]])
+        result = self.validator.validate_equivalence(lhs, rhs)
+
+        self.assertFalse(result.passed)
+        self.assertEqual("simplify", result.metadata["decided_by"])
+
+
+@unittest.skipUnless(HAS_SYMPY, "sympy not installed")
+class SymbolicValidatorBudgetTests(unittest.TestCase):
+    def setUp(self) -> None:
+        import sympy as sp
+
+        self.sp = sp
+        self.x = sp.Symbol("x")
+
+    def test_budgeted_check_runs_out_of_process(self):
+        validator = SymbolicValidator(timeout=30.0)
+        result = validator.validate_equivalence((self.x + 1) ** 2, self.x**2 + 2 * self.x + 1)
+
+        self.assertTrue(result.passed)
+        self.assertIsNone(result.status)
+        self.assertEqual("0", result.metadata["difference"])
+        self.assertEqual("expand", result.metadata["decided_by"])
+
+    def test_budgeted_check_does_not_fork_a_threaded_process(self):
+        results = []
+
+        def check() -> None:
+            results.append(SymbolicValidator._process_context().get_start_method())
+            validator = SymbolicValidator(timeout=60.0)
+            results.append(validator.validate_equivalence(self.sp.sin(self.x) ** 2 + self.sp.cos(self.x) ** 2, 1))
+
+        worker = threading.Thread(target=check)
+        worker.start()
+        worker.join()
+
+        method, result = results
+        self.assertNotEqual("fork", method)
+        self.assertTrue(result.passed, result.errors)
+        self.assertEqual("trigsimp", result.metadata["decided_by"])
+
+    def test_budgeted_check_reports_child_errors(self):
+        validator = SymbolicValidator(timeout=30.0)
+        with patch.object(SymbolicValidator, "_decide", side_effect=ValueError("boom")):
+            result = validator.validate_equivalence(self.x, self.x)
+
+        self.assertFalse(result.passed)
+        self.assertEqual(["Symbolic validation failed: boom"], result.errors)
+
+    def test_slow_simplification_times_out(self):
+        def _slow(*_args):
+            time.sleep(30)
+            return True, "0"
+
+        validator = SymbolicValidator(timeout=0.5)
+        started = time.perf_counter()
+        with patch.object(SymbolicValidator, "_decide", side_effect=_slow):
+            result = validator.validate_equivalence(self.x, self.x)
+        elapsed = time.perf_counter() - started
+
+        self.assertFalse(result.passed)
+        self.assertEqual("TIMEOUT", result.status)
+        self.assertEqual("time budget exceeded", result.reason)
+        self.assertLess(elapsed, 5.0)
+
+    def test_expression_size_ceiling(self):
+        validator = SymbolicValidator(max_expression_size=3)
+        lhs = sum(self.sp.sin(self.x) ** k for k in range(1, 6))
+        result = validator.validate_equivalence(lhs, self.sp.Integer(0))
+
+        self.assertFalse(result.passed)
+        self.assertEqual("TIMEOUT", result.status)
+        self.assertEqual("expression size budget exceeded", result.reason)
+        self.assertGreater(result.metadata["expression_size"], 3)
+
+
 class SymbolicValidatorNoSympyTests(unittest.TestCase):
     def test_validate_path_returns_structured_result(self):
         v = SymbolicValidator()
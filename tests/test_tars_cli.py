@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import io
+import os
 import sys
+import tempfile
 import unittest
-from contextlib import redirect_stdout
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 from unittest.mock import patch
 
@@ -12,6 +14,8 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 from tars.cli import main
 from tars.validators.result import ValidationResult
 
+MATH_VALIDATOR = "tars.validators.research.math.math_validator.MathValidator"
+
 
 class TarsCliTests(unittest.TestCase):
     def test_validate_math_prints_summary(self):
@@ -31,7 +35,7 @@ class TarsCliTests(unittest.TestCase):
             },
         )
 
-        with patch("tars.cli.MathValidator.validate", return_value=fake_result):
+        with patch(f"{MATH_VALIDATOR}.validate", return_value=fake_result):
             buffer = io.StringIO()
             with redirect_stdout(buffer):
                 code = main(["validate-math", "paper.tex"])
@@ -43,6 +47,137 @@ class TarsCliTests(unittest.TestCase):
         self.assertIn("validated_equations=10", output)
         self.assertIn("failed_equations=1", output)
         self.assertIn("skipped_equations=2", output)
+        self.assertIn("timed_out_equations=0", output)
+
+    def test_validate_math_passes_symbolic_budget_options(self):
+        fake_result = ValidationResult(name="math_validator", passed=True, status="PASS", metadata={"metrics": {}})
+
+        with patch(MATH_VALIDATOR) as validator_cls, patch.dict(os.environ, clear=True):
+            validator_cls.return_value.validate.return_value = fake_result
+            with redirect_stdout(io.StringIO()):
+                main(["validate-math", "paper.tex", "--symbolic-timeout", "2.5", "--max-expression-size", "300"])
+
+        validator_cls.assert_called_once_with(
+            symbolic_timeout=2.5, max_expression_size=300, cache=None, results=None
+        )
+
+    def test_validate_math_uses_cache_dir_and_reports_hits(self):
+        fake_result = ValidationResult(
+            name="math_validator",
+            passed=True,
+            status="PASS",
+            metadata={"metrics": {}, "cache_stats": {"persistent_hits": 3, "persistent_misses": 1}},
+        )
+
+        with tempfile.TemporaryDirectory() as td, patch(MATH_VALIDATOR) as validator_cls:
+            validator_cls.return_value.validate.return_value = fake_result
+            buffer = io.StringIO()
+            with redirect_stdout(buffer):
+                main(["validate-math", "paper.tex", "--cache-dir", td])
+
+            cache = validator_cls.call_args.kwargs["cache"]
+            self.assertEqual(Path(td), cache.cache_dir)
+
+        self.assertIn("Conversion cache: hits=3 misses=1", buffer.getvalue())
+
+
+    def test_validate_corpus_prints_throughput(self):
+        from tars.corpus import CorpusSummary
+
+        summary = CorpusSummary(papers=4, resumed=2, failed=1, errored=0, equations=40, elapsed_seconds=2.0)
+        with tempfile.TemporaryDirectory() as td, patch("tars.corpus.validate_corpus", return_value=summary) as run:
+            output = str(Path(td) / "results.jsonl")
+            buffer = io.StringIO()
+            with redirect_stdout(buffer), patch.dict(os.environ, clear=True):
+                code = main(["validate-corpus", td, "--output", output, "--workers", "3"])
+
+        self.assertEqual(0, code)
+        self.assertEqual(3, run.call_args.kwargs["workers"])
+        self.assertTrue(run.call_args.kwargs["resume"])
+        out = buffer.getvalue()
+        self.assertIn("papers=4 resumed=2 failed=1 errored=0 equations=40", out)
+        self.assertIn("papers_per_second=2.00 equations_per_second=20.00", out)
+
+    def test_validate_math_remote_reports_unreachable_daemon(self):
+        stderr = io.StringIO()
+        with redirect_stderr(stderr), redirect_stdout(io.StringIO()):
+            code = main(["validate-math", "paper.tex", "--remote", "http://127.0.0.1:1"])
+
+        self.assertEqual(1, code)
+        self.assertIn("Remote validation failed:", stderr.getvalue())
+
+    def test_validate_math_remote_rejects_local_only_options(self):
+        for flags in (["--watch"], ["--incremental"], ["--symbolic-timeout", "2"], ["--cache-dir", "cache"]):
+            with self.subTest(flags=flags), redirect_stderr(io.StringIO()) as stderr:
+                with self.assertRaises(SystemExit) as raised:
+                    main(["validate-math", "paper.tex", "--remote", "http://127.0.0.1:1", *flags])
+
+                self.assertEqual(2, raised.exception.code)
+                self.assertIn(f"{flags[0]} cannot be combined with --remote", stderr.getvalue())
+
+    def test_serve_passes_symbolic_budgets_to_the_math_validator(self):
+        with patch("tars.server.serve") as serve, patch.dict(os.environ, clear=True):
+            code = main(["serve", "--symbolic-timeout", "2.5", "--max-expression-size", "300"])
+
+        self.assertEqual(0, code)
+        validator = serve.call_args.kwargs["service"].factories["math_validator"]()
+        self.assertEqual(2.5, validator.symbolic_validator.timeout)
+        self.assertEqual(300, validator.symbolic_validator.max_expression_size)
+
+    def test_validate_corpus_rejects_worker_recycling_where_unsupported(self):
+        with patch("tars.cli._POOL_RECYCLES_WORKERS", False), patch("tars.corpus.validate_corpus") as run:
+            with redirect_stderr(io.StringIO()) as stderr, self.assertRaises(SystemExit):
+                main(["validate-corpus", "papers", "--output", "out.jsonl", "--max-tasks-per-child", "5"])
+            self.assertIn("--max-tasks-per-child needs Python 3.11", stderr.getvalue())
+
+            summary = run.return_value
+            summary.papers_per_second = summary.equations_per_second = summary.elapsed_seconds = 0.0
+            with tempfile.TemporaryDirectory() as td, redirect_stdout(io.StringIO()):
+                main(["validate-corpus", td, "--output", str(Path(td) / "out.jsonl")])
+
+        self.assertIsNone(run.call_args.kwargs["max_tasks_per_child"])
+
+    def test_build_citation_index_reports_counts(self):
+        with tempfile.TemporaryDirectory() as td:
+            dump = Path(td) / "arxiv.jsonl"
+            dump.write_text('{"id": "1706.03762", "versions": [{"version": "v7"}], "doi": "10.1000/xyz"}\n')
+            output = Path(td) / "citations.idx"
+            buffer = io.StringIO()
+            with redirect_stdout(buffer):
+                code = main(["build-citation-index", str(dump), "--output", str(output)])
+
+            self.assertEqual(0, code)
+            self.assertTrue(output.is_file())
+        self.assertIn("Citation index: dois=1 arxiv_ids=1", buffer.getvalue())
+
+    def test_validate_math_watch_prints_status_diffs_until_interrupted(self):
+        from tars.watch import WatchUpdate
+
+        first = ValidationResult(name="math_validator", passed=True, status="PASS", metadata={"metrics": {}})
+        second = ValidationResult(name="math_validator", passed=False, status="FAIL", metadata={"metrics": {}})
+
+        def fake_watch(watcher, on_update, **_kwargs):
+            on_update(WatchUpdate(result=first))
+            on_update(
+                WatchUpdate(
+                    result=second,
+                    changed_files=[Path("intro.tex")],
+                    changes=["~ intro.tex:line:3:col:1:inline: PASS -> FAIL x=y"],
+                    elapsed_seconds=0.25,
+                )
+            )
+            raise KeyboardInterrupt
+
+        with tempfile.TemporaryDirectory() as td, patch("tars.watch.PaperWatcher.watch", fake_watch):
+            buffer = io.StringIO()
+            with redirect_stdout(buffer):
+                code = main(["validate-math", "paper.tex", "--watch", "--cache-dir", td])
+
+        self.assertEqual(0, code)
+        out = buffer.getvalue()
+        self.assertIn("Math validation: status=PASS", out)
+        self.assertIn("Changed: intro.tex -> status=FAIL elapsed_seconds=0.25", out)
+        self.assertIn("  ~ intro.tex:line:3:col:1:inline: PASS -> FAIL x=y", out)
 
 
 if __name__ == "__main__":
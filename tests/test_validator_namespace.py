@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import sys
+import time
 import unittest
 from pathlib import Path
 
@@ -42,6 +43,18 @@ class DummyCitationValidator(BaseValidator):
         )
 
 
+class SleepingValidator(BaseValidator):
+    artifact_type = "generic"
+
+    def __init__(self, name: str, delay: float) -> None:
+        self.name = name
+        self.delay = delay
+
+    def validate(self, artifact_path: Path) -> ValidationResult:
+        time.sleep(self.delay)
+        return ValidationResult(name=self.name, passed=True, metadata={"path": str(artifact_path)})
+
+
 class ValidatorNamespaceTests(unittest.TestCase):
     def test_validation_result_json_serializable(self):
         result = ValidationResult(
@@ -87,6 +100,42 @@ class ValidatorNamespaceTests(unittest.TestCase):
             self.assertEqual(summary["failed"], 1)
             self.assertFalse(summary["all_passed"])
 
+    def test_engine_records_wall_time_per_validator(self):
+        engine = ValidationEngine()
+        engine.register_validators([DummyLatexValidator(), DummyCitationValidator()])
+
+        results = engine.run(Path("paper.tex"))
+
+        self.assertTrue(all(r.metadata["wall_time_seconds"] >= 0.0 for r in results))
+
+    def test_engine_concurrent_executors_preserve_order(self):
+        engine = ValidationEngine()
+        engine.register_validators([DummyLatexValidator(), DummyCitationValidator()])
+        names = ["latex", "citations"]
+
+        serial = engine.run(Path("paper.tex"), validator_names=names)
+        for executor in ("threads", "processes"):
+            with self.subTest(executor=executor):
+                results = engine.run(Path("paper.tex"), validator_names=names, executor=executor, max_workers=2)
+                self.assertEqual(names, [r.name for r in results])
+                self.assertEqual([r.passed for r in serial], [r.passed for r in results])
+                self.assertTrue(all("wall_time_seconds" in r.metadata for r in results))
+
+    def test_engine_threads_run_validators_concurrently(self):
+        engine = ValidationEngine()
+        engine.register_validators([SleepingValidator(f"sleep_{i}", 0.2) for i in range(4)])
+
+        started = time.perf_counter()
+        results = engine.run(Path("paper.tex"), executor="threads", max_workers=4)
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(["sleep_0", "sleep_1", "sleep_2", "sleep_3"], [r.name for r in results])
+        self.assertLess(elapsed, 0.6)
+
+    def test_engine_rejects_unknown_executor(self):
+        with self.assertRaises(ValueError):
+            ValidationEngine().run(Path("paper.tex"), executor="gpu")
+
 
 if __name__ == "__main__":
     unittest.main()
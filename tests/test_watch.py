@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import importlib.util
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tars.validators.research.math.math_validator import MathValidator
+from tars.validators.research.math.result_store import EquationResultStore
+from tars.validators.result import ValidationResult
+from tars.watch import PaperWatcher, WatchUpdate, diff_results
+
+
+HAS_SYMPY = importlib.util.find_spec("sympy") is not None
+HAS_LATEX2SYMPY2 = importlib.util.find_spec("latex2sympy2") is not None
+
+
+def _result(*items: tuple[str, str, str]) -> ValidationResult:
+    return ValidationResult(
+        name="math_validator",
+        passed=True,
+        metadata={"results": [{"source_location": loc, "raw": raw, "status": status} for loc, raw, status in items]},
+    )
+
+
+class DiffResultsTests(unittest.TestCase):
+    def test_reports_added_removed_and_changed_statuses(self):
+        before = _result(("line:1", "a=a", "PASS"), ("line:2", "b=c", "FAIL"), ("line:3", "d=d", "PASS"))
+        after = _result(("line:1", "a=a", "PASS"), ("line:2", "b=c", "PASS"), ("line:4", "e=f", "FAIL"))
+
+        self.assertEqual(
+            ["~ line:2: FAIL -> PASS b=c", "+ line:4: FAIL e=f", "- line:3: d=d"], diff_results(before, after)
+        )
+
+    def test_moved_equations_are_not_reported(self):
+        before = _result(("line:1", "a=a", "PASS"), ("line:2", "a=a", "FAIL"))
+        after = _result(("line:7", "a=a", "PASS"), ("line:8", "a=a", "FAIL"))
+
+        self.assertEqual([], diff_results(before, after))
+        self.assertEqual([], diff_results(None, after))
+
+
+@unittest.skipUnless(HAS_SYMPY and HAS_LATEX2SYMPY2, "sympy/latex2sympy2 not installed")
+class PaperWatcherTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.paper = self.root / "paper.tex"
+        self.paper.write_text("Intro \\[x + x = 2x\\]\n\\input{section}\n\\bibliography{refs}\n", encoding="utf-8")
+        self.section = self.root / "section.tex"
+        self.section.write_text("\\[y \\cdot y = y^2\\]\n", encoding="utf-8")
+        self.bib = self.root / "refs.bib"
+        self.bib.write_text("@misc{a, title = {A}}", encoding="utf-8")
+        self.store = EquationResultStore(self.root / "cache")
+        self.addCleanup(self.store.close)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def edit(self, path: Path, text: str) -> None:
+        path.write_text(text, encoding="utf-8")
+        # Make the change visible even on filesystems with coarse timestamps.
+        mtime = path.stat().st_mtime_ns + 10**9
+        os.utime(path, ns=(mtime, mtime))
+
+    def scripted_sleep(self, edits: list[tuple[Path, str]]):
+        """A `sleep` that applies one scripted edit per call, then does nothing."""
+        calls: list[float] = []
+
+        def sleep(seconds: float) -> None:
+            calls.append(seconds)
+            if edits:
+                self.edit(*edits.pop(0))
+
+        return sleep, calls
+
+    def test_included_file_edit_rechecks_only_its_equation(self):
+        sleep, _calls = self.scripted_sleep([(self.section, "\\[y \\cdot y = 3y\\]\n")])
+        watcher = PaperWatcher(
+            self.paper, validator=MathValidator(results=self.store), interval=0.01, debounce=0.01, sleep=sleep
+        )
+        updates: list[WatchUpdate] = []
+
+        watcher.watch(updates.append, max_runs=2)
+
+        first, second = updates
+        self.assertEqual([], first.changed_files)
+        self.assertTrue(first.result.passed)
+        self.assertEqual([self.section], second.changed_files)
+        self.assertFalse(second.result.passed)
+        self.assertEqual({"reused_equations": 1, "rechecked_equations": 1}, second.result.metadata["incremental"])
+        self.assertEqual(["+ section.tex:line:1:col:1:display_brackets: FAIL y \\cdot y = 3y"], second.changes[:1])
+        self.assertEqual(["- section.tex:line:1:col:1:display_brackets: y \\cdot y = y^2"], second.changes[1:])
+
+    def test_burst_of_saves_is_debounced_into_one_run(self):
+        edits = [(self.section, f"\\[y + {n} = {n} + y\\]\n") for n in range(3)]
+        sleep, calls = self.scripted_sleep(edits)
+        watcher = PaperWatcher(self.paper, interval=0.5, debounce=0.2, sleep=sleep)
+        watcher.run()
+
+        changed = watcher.wait_for_change()
+
+        self.assertEqual([self.section], changed)
+        # One poll, two debounce waits that still saw edits, one quiet debounce wait.
+        self.assertEqual([0.5, 0.2, 0.2, 0.2], calls)
+
+    def test_bibliography_only_edit_skips_math(self):
+        watcher = PaperWatcher(self.paper, sleep=lambda _seconds: None)
+        first = watcher.run()
+        reads = watcher.loader.reads
+
+        update = watcher.run([self.bib])
+
+        self.assertTrue(update.skipped)
+        self.assertIs(first.result, update.result)
+        self.assertEqual(reads, watcher.loader.reads)
+        self.assertIn(self.bib, watcher.snapshot())
+
+    def test_save_during_a_run_triggers_another_run(self):
+        test = self
+
+        class EditingValidator(MathValidator):
+            runs = 0
+
+            def validate_context(self, context):
+                result = super().validate_context(context)
+                EditingValidator.runs += 1
+                if EditingValidator.runs == 1:
+                    test.edit(test.section, "\\[y + y = 2y\\]\n\\[y - y = 0\\]\n")
+                return result
+
+        stop = threading.Event()
+        calls: list[float] = []
+
+        def sleep(seconds: float) -> None:
+            calls.append(seconds)
+            if len(calls) > 5:
+                stop.set()
+
+        watcher = PaperWatcher(self.paper, validator=EditingValidator(), interval=0.01, debounce=0.01, sleep=sleep)
+        updates: list[WatchUpdate] = []
+
+        watcher.watch(updates.append, stop=stop, max_runs=2)
+
+        self.assertEqual(2, len(updates))
+        self.assertEqual([self.section], updates[1].changed_files)
+        self.assertEqual(3, updates[1].result.metadata["metrics"]["total_equations"])
+
+    def test_creating_a_missing_include_triggers_a_run(self):
+        self.edit(self.paper, "Intro \\[x + x = 2x\\]\n\\input{section}\n\\input{appendix}\n")
+        appendix = self.root / "appendix.tex"
+        scripted, calls = self.scripted_sleep([(appendix, "\\[z - z = 0\\]\n")])
+        stop = threading.Event()
+
+        def sleep(seconds: float) -> None:
+            scripted(seconds)
+            if len(calls) > 5:
+                stop.set()
+
+        watcher = PaperWatcher(self.paper, interval=0.01, debounce=0.01, sleep=sleep)
+        first = watcher.run()
+        self.assertIsNone(watcher.snapshot()[appendix])
+
+        changed = watcher.wait_for_change(stop)
+        second = watcher.run(changed)
+
+        self.assertEqual([appendix], changed)
+        self.assertEqual(2, first.result.metadata["metrics"]["total_equations"])
+        self.assertEqual(3, second.result.metadata["metrics"]["total_equations"])
+        self.assertNotIn(appendix.with_suffix(""), watcher.snapshot())
+
+    def test_creating_a_missing_subimport_triggers_a_run(self):
+        self.edit(self.paper, "Intro \\[x + x = 2x\\]\n\\subimport{chap/}{intro}\n")
+        (self.root / "chap").mkdir()
+        intro = self.root / "chap" / "intro.tex"
+        scripted, calls = self.scripted_sleep([(intro, "\\[z - z = 0\\]\n")])
+        stop = threading.Event()
+
+        def sleep(seconds: float) -> None:
+            scripted(seconds)
+            if len(calls) > 5:
+                stop.set()
+
+        watcher = PaperWatcher(self.paper, interval=0.01, debounce=0.01, sleep=sleep)
+        watcher.run()
+
+        self.assertEqual([intro], watcher.wait_for_change(stop))
+
+    def test_stop_event_ends_the_session(self):
+        stop = threading.Event()
+        watcher = PaperWatcher(self.paper, interval=0.01, sleep=lambda _seconds: stop.set())
+        updates: list[WatchUpdate] = []
+
+        watcher.watch(updates.append, stop=stop)
+
+        self.assertEqual(1, len(updates))
+
+
+if __name__ == "__main__":
+    unittest.main()